@@ -5,7 +5,7 @@ import { ExternalLink, Clock, Sparkles, FileText, Loader2, Heart, Share2, Bookma
 import { Card, CardContent, CardFooter, CardHeader } from "@/components/ui/card"
 import { Button } from "@/components/ui/button"
 import { Badge } from "@/components/ui/badge"
-import { useNews } from "@/contexts/news-context"
+import { needsSummary, useNews } from "@/contexts/news-context"
 
 const topicColors = {
   Technology: "bg-gradient-to-r from-blue-500 to-cyan-500",
@@ -47,7 +47,7 @@ export function NewsCard({ article }) {
   }
 
   const handleSummaryToggle = () => {
-    if (!showSummary && !article.summary) {
+    if (!showSummary && needsSummary(article)) {
       toggleSummaryView(article.id)
     }
     setShowSummary(!showSummary)
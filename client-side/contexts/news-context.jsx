@@ -5,6 +5,12 @@ import { apiClient } from "@/lib/api"
 
 const NewsContext = createContext(undefined)
 
+// Extractive summaries are stand-ins until the model summarizes the article
+export const needsSummary = (article) => !article.summary || article.summaryEngine === "extractive"
+
+// Feed prefetch takes cached summaries and local stand-ins; opening a card still asks the model
+const PREFETCH_LATENCY_BUDGET_MS = 500
+
 export function NewsProvider({ children }) {
   const [articles, setArticles] = useState([])
   const [loading, setLoading] = useState(false)
@@ -44,6 +50,7 @@ export function NewsProvider({ children }) {
         },
         originalExcerpt: article.original_excerpt,
         summary: article.summary,
+        summaryEngine: article.summary_engine,
         publishedAt: article.published_at,
         topic: article.topic,
         url: article.url,
@@ -54,6 +61,7 @@ export function NewsProvider({ children }) {
       }))
 
       setArticles(transformedArticles)
+      prefetchSummaries(transformedArticles)
     } catch (err) {
       console.error("Failed to fetch articles:", err)
       setError("Failed to load articles. Please try again.")
@@ -62,6 +70,29 @@ export function NewsProvider({ children }) {
     }
   }
 
+  // One batch request for the summaries the feed is missing, instead of one per card
+  const prefetchSummaries = async (feed) => {
+    const missing = feed.filter((article) => !article.summary).map((article) => article.id)
+    if (missing.length === 0) return
+
+    try {
+      const { results } = await apiClient.generateSummaries(missing, PREFETCH_LATENCY_BUDGET_MS)
+      const prefetched = new Map(
+        results.filter((result) => result.summary && !result.error).map((result) => [result.article_id, result]),
+      )
+      setArticles((prev) =>
+        prev.map((a) => {
+          const result = prefetched.get(a.id)
+          // A card opened meanwhile is streaming a model summary; keep that
+          if (!result || a.summary || a.isLoadingSummary) return a
+          return { ...a, summary: result.summary, summaryEngine: result.engine }
+        }),
+      )
+    } catch (err) {
+      console.error("Failed to prefetch summaries:", err)
+    }
+  }
+
   // Generate AI summary
   const generateSummary = async (articleId) => {
     setArticles((prev) =>
@@ -72,10 +103,15 @@ export function NewsProvider({ children }) {
       const article = articles.find((a) => a.id === articleId)
       if (!article) return
 
-      const response = await apiClient.generateSummary(article.title, article.originalExcerpt)
+      // Show the summary as it streams in rather than after the whole thing is generated
+      const { summary, engine } = await apiClient.streamSummary(article.title, article.originalExcerpt, article.id, (text) =>
+        setArticles((prev) => prev.map((a) => (a.id === articleId ? { ...a, summary: text } : a))),
+      )
 
       setArticles((prev) =>
-        prev.map((a) => (a.id === articleId ? { ...a, summary: response.summary, isLoadingSummary: false } : a)),
+        prev.map((a) =>
+          a.id === articleId ? { ...a, summary, summaryEngine: engine, isLoadingSummary: false } : a,
+        ),
       )
     } catch (err) {
       console.error("Failed to generate summary:", err)
@@ -107,7 +143,7 @@ export function NewsProvider({ children }) {
 
   const toggleSummaryView = (articleId) => {
     const article = articles.find((a) => a.id === articleId)
-    if (article && !article.summary && !article.isLoadingSummary) {
+    if (article && needsSummary(article) && !article.isLoadingSummary) {
       generateSummary(articleId)
     }
   }
@@ -61,10 +61,60 @@ class ApiClient {
   }
 
   // AI endpoints
-  async generateSummary(title, content) {
+  async generateSummary(title, content, articleId) {
     return this.request("/api/ai/summarize", {
       method: "POST",
-      body: JSON.stringify({ title, content }),
+      body: JSON.stringify({ title, content, article_id: articleId }),
+    })
+  }
+
+  // Streams the summary as it is generated; onChunk receives the text so far.
+  // Resolves to { summary, engine }
+  async streamSummary(title, content, articleId, onChunk) {
+    const response = await fetch(`${this.baseURL}/api/ai/summarize/stream`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json", Accept: "text/event-stream" },
+      body: JSON.stringify({ title, content, article_id: articleId }),
+    })
+    if (!response.ok) {
+      throw new Error(`HTTP error! status: ${response.status}`)
+    }
+
+    const reader = response.body.getReader()
+    const decoder = new TextDecoder()
+    let buffer = ""
+    let text = ""
+
+    while (true) {
+      const { done, value } = await reader.read()
+      if (done) break
+      buffer += decoder.decode(value, { stream: true })
+
+      // Frames are separated by a blank line: "event: <name>\ndata: <json>"
+      let boundary
+      while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+        const frame = buffer.slice(0, boundary)
+        buffer = buffer.slice(boundary + 2)
+        const event = frame.match(/^event: (.*)$/m)?.[1]
+        const data = JSON.parse(frame.match(/^data: (.*)$/m)?.[1] || "{}")
+
+        if (event === "chunk") {
+          text += data.text
+          onChunk?.(text)
+        } else if (event === "done" || event === "error") {
+          return { summary: data.summary, engine: data.engine }
+        }
+      }
+    }
+    return { summary: text, engine: "llm" }
+  }
+
+  // One request for a whole feed's summaries; results come back in input order.
+  // Within latencyBudgetMs, misses are summarized locally instead of waiting on the model
+  async generateSummaries(articleIds, latencyBudgetMs) {
+    return this.request("/api/ai/summarize/batch", {
+      method: "POST",
+      body: JSON.stringify({ article_ids: articleIds, latency_budget_ms: latencyBudgetMs }),
     })
   }
 
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark: event-loop stalls while AI summaries are pending
+
+Starts a batch of summary requests against a stand-in Gemini client that
+takes MODEL_LATENCY seconds per call, and meanwhile measures how late a
+10 ms heartbeat on the same event loop fires:
+- blocking: the old pattern, the synchronous generate_content called inside
+  the coroutine
+- async: AIService as it runs now, awaiting client.aio with the concurrency
+  semaphore
+Needs no API key or network.
+
+Usage:
+    python benchmarks/bench_ai_event_loop.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from config import settings
+from services.ai_service import AIService
+
+MODEL_LATENCY = 0.5
+REQUESTS = 8
+HEARTBEAT = 0.01
+
+class StandInModels:
+    """generate_content with a fixed latency, in sync and async flavours"""
+
+    def generate_content(self, model: str, contents: str):
+        time.sleep(MODEL_LATENCY)
+        return SimpleNamespace(text="A stand-in summary.")
+
+    async def async_generate_content(self, model: str, contents: str):
+        await asyncio.sleep(MODEL_LATENCY)
+        return SimpleNamespace(text="A stand-in summary.")
+
+def stand_in_client() -> SimpleNamespace:
+    models = StandInModels()
+    return SimpleNamespace(
+        models=models,
+        aio=SimpleNamespace(models=SimpleNamespace(generate_content=models.async_generate_content)),
+    )
+
+async def blocking_summary(client, title: str, content: str) -> str:
+    """The previous implementation's call pattern"""
+    return client.models.generate_content(model="stand-in", contents=f"{title}\n{content}").text
+
+async def heartbeat(stop: asyncio.Event) -> float:
+    """Worst lateness of a periodic tick, in milliseconds"""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT)
+        worst = max(worst, (time.perf_counter() - start - HEARTBEAT) * 1000)
+    return worst
+
+async def run(summarize) -> tuple:
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(stop))
+    await asyncio.sleep(HEARTBEAT * 2)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(summarize(f"Title {i}", "Content") for i in range(REQUESTS)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    return elapsed, await ticker
+
+async def main():
+    client = stand_in_client()
+
+    service = AIService()
+    service._client = client
+
+    print(f"{REQUESTS} summaries, {MODEL_LATENCY}s each, concurrency limit {settings.GEMINI_MAX_CONCURRENCY}\n")
+    print(f"{'path':<9} | {'wall time (s)':>13} | {'worst loop stall (ms)':>21}")
+    print("-" * 50)
+
+    elapsed, stall = await run(lambda title, content: blocking_summary(client, title, content))
+    print(f"{'blocking':<9} | {elapsed:>13.2f} | {stall:>21.1f}")
+
+    elapsed, stall = await run(lambda title, content: service.generate_summary(title, content, fallback=False))
+    print(f"{'async':<9} | {elapsed:>13.2f} | {stall:>21.1f}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark: local extractive summaries, throughput and quality
+
+Runs the extractive summarizer over a fixture corpus of news articles with
+hand-written reference summaries (benchmarks/fixtures/summary_corpus.json):
+- quality: ROUGE-1, ROUGE-2 and ROUGE-L F1 against the references for the
+  previous fallback (first two sentences), TextRank and centroid scoring
+- NewsAPI-style input: the same articles cut to 200 characters plus the
+  "… [+N chars]" marker, counting summaries that leak the marker
+- throughput: articles per second on one core (CPU time) through
+  summarize_many, which scores each batch in one set of padded matrix
+  operations
+Needs no API key, network or database.
+
+Usage:
+    python benchmarks/bench_extractive.py
+"""
+
+import json
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from services.extractive_summarizer import METHODS, extractive_summarizer
+
+CORPUS = Path(__file__).parent / "fixtures" / "summary_corpus.json"
+BATCH_SIZE = 50
+BATCHES = 40
+
+def previous_fallback(title: str, content: str) -> str:
+    """The fallback summary AIService used before the extractive engine"""
+    sentences = content.split('. ')
+    if len(sentences) >= 2:
+        return f"{sentences[0]}. {sentences[1]}."
+    return sentences[0]
+
+def words(text: str) -> list:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+def f1(overlap: int, candidate_total: int, reference_total: int) -> float:
+    if not overlap:
+        return 0.0
+    precision, recall = overlap / candidate_total, overlap / reference_total
+    return 2 * precision * recall / (precision + recall)
+
+def rouge_n(candidate: str, reference: str, n: int) -> float:
+    def grams(tokens: list) -> Counter:
+        return Counter(tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+    candidate_grams, reference_grams = grams(words(candidate)), grams(words(reference))
+    overlap = sum((candidate_grams & reference_grams).values())
+    return f1(overlap, sum(candidate_grams.values()), sum(reference_grams.values()))
+
+def rouge_l(candidate: str, reference: str) -> float:
+    """F1 over the longest common subsequence of words"""
+    a, b = words(candidate), words(reference)
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return f1(previous[-1], len(a), len(b))
+
+def quality(corpus: list, summarize) -> tuple:
+    scores = [
+        (rouge_n(summary, article["reference"], 1), rouge_n(summary, article["reference"], 2),
+         rouge_l(summary, article["reference"]), len(summary))
+        for article in corpus
+        for summary in [summarize(article["title"], article["content"])]
+    ]
+    return tuple(statistics.mean(column) for column in zip(*scores))
+
+def newsapi_excerpt(content: str) -> str:
+    """Content the way NewsAPI delivers it"""
+    return f"{content[:200]}… [+{len(content) - 200} chars]"
+
+def throughput(corpus: list, method: str) -> tuple:
+    """Articles per CPU second and median milliseconds per batch"""
+    batch = [corpus[i % len(corpus)] for i in range(BATCH_SIZE)]
+    cpu_start = time.process_time()
+    timings = []
+    for _ in range(BATCHES):
+        start = time.perf_counter()
+        extractive_summarizer.summarize_many(batch, method)
+        timings.append((time.perf_counter() - start) * 1000)
+    cpu_seconds = time.process_time() - cpu_start
+    return BATCH_SIZE * BATCHES / cpu_seconds, statistics.median(timings)
+
+def main():
+    corpus = json.loads(CORPUS.read_text())
+
+    print(f"📚 {len(corpus)} fixture articles, summaries capped at {extractive_summarizer.max_length} chars\n")
+    print(f"{'engine':<18} | {'ROUGE-1':>7} | {'ROUGE-2':>7} | {'ROUGE-L':>7} | {'avg chars':>9}")
+    print("-" * 62)
+    engines = {"previous fallback": previous_fallback}
+    for method in METHODS:
+        engines[method] = lambda title, content, method=method: extractive_summarizer.summarize(title, content, method)
+    for name, summarize in engines.items():
+        r1, r2, rl, chars = quality(corpus, summarize)
+        print(f"{name:<18} | {r1:>7.3f} | {r2:>7.3f} | {rl:>7.3f} | {chars:>9.0f}")
+
+    print(f"\n{'NewsAPI excerpts':<18} | {'summaries leaking the [+N chars] marker':>40}")
+    print("-" * 62)
+    for name, summarize in engines.items():
+        leaked = sum("chars]" in summarize(article["title"], newsapi_excerpt(article["content"])) for article in corpus)
+        print(f"{name:<18} | {f'{leaked}/{len(corpus)}':>40}")
+
+    print(f"\n{'method':<18} | {'articles/s/core':>15} | {f'ms per {BATCH_SIZE}':>10}")
+    print("-" * 50)
+    for method in METHODS:
+        per_second, batch_ms = throughput(corpus, method)
+        print(f"{method:<18} | {per_second:>15.0f} | {batch_ms:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark: model tiers, request deadlines and hedged calls
+
+Runs AIService against the stand-in Gemini server (benchmarks/stand_in_gemini.py,
+started in-process on a free port) through the real google-genai client, with
+injected latency: a fast model with an occasional slow tail, and a slower
+model behind it. Compares end-to-end summary latency and model calls for:
+- pro only: one slow tier, as AIService ran before tiering
+- flash > pro: the fast tier first, escalating on timeout
+- flash > pro, hedged: as above, plus a duplicate call past the fast tier's p95
+Needs no API key, database or network access beyond localhost.
+
+Usage:
+    python benchmarks/bench_model_tiering.py
+"""
+
+import asyncio
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+import uvicorn
+
+from config import settings
+from services.ai_service import MIN_LATENCY_SAMPLES, AIService
+from stand_in_gemini import Latency, create_app
+
+FAST, SLOW = "gemini-2.5-flash", "gemini-2.5-pro"
+LATENCY = {FAST: 0.3, SLOW: 1.5}
+TAIL_PROBABILITY = 0.1
+TAIL_SECONDS = 2.5
+REQUESTS = 120
+CONCURRENCY = 8
+
+CONFIGURATIONS = [
+    ("pro only", f"{SLOW}:10", False),
+    ("flash > pro", f"{FAST}:1.5,{SLOW}:10", False),
+    ("flash > pro, hedged", f"{FAST}:1.5,{SLOW}:10", True),
+]
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_stand_in(latency: Latency) -> uvicorn.Server:
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(create_app(latency), host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    settings.GEMINI_BASE_URL = f"http://127.0.0.1:{port}"
+    return server
+
+def percentile(samples: list, fraction: float) -> float:
+    samples = sorted(samples)
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+async def run(service: AIService) -> list:
+    """End-to-end milliseconds per summary, REQUESTS of them CONCURRENCY at a time"""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    timings = []
+
+    async def summarize(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            await service.generate_summary(f"Title {i}", f"Content of article {i}.", fallback=False)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(summarize(i) for i in range(REQUESTS)))
+    return timings
+
+async def main():
+    latency = Latency(LATENCY, jitter=0.2, tail_probability=TAIL_PROBABILITY, tail_seconds=TAIL_SECONDS, seed=7)
+    server = start_stand_in(latency)
+
+    print(f"🧪 Stand-in Gemini at {settings.GEMINI_BASE_URL}: {LATENCY}, "
+          f"{TAIL_PROBABILITY:.0%} of calls +{TAIL_SECONDS}s")
+    print(f"{REQUESTS} summaries, {CONCURRENCY} at a time, deadline {settings.SUMMARY_DEADLINE_SECONDS:g}s; "
+          f"hedging starts after {MIN_LATENCY_SAMPLES} samples\n")
+    print(f"{'policy':<20} | {'p50 ms':>7} | {'p95 ms':>7} | {'p99 ms':>7} | {'max ms':>7} | "
+          f"{'calls':>5} | {'escalated':>9} | {'hedges':>6} | {'wins':>4}")
+    print("-" * 99)
+
+    for name, tiers, hedge in CONFIGURATIONS:
+        settings.GEMINI_MODEL_TIERS = tiers
+        settings.GEMINI_HEDGE_ENABLED = hedge
+        service = AIService()
+        service.start()
+        timings = await run(service)
+        await service.close()
+        print(f"{name:<20} | {statistics.median(timings):>7.0f} | {percentile(timings, 0.95):>7.0f} | "
+              f"{percentile(timings, 0.99):>7.0f} | {max(timings):>7.0f} | {service.calls:>5} | "
+              f"{service.escalations:>9} | {service.hedges:>6} | {service.hedge_wins:>4}")
+
+    server.should_exit = True
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark: single articles table vs. monthly range partitions (PostgreSQL)
+
+Builds two scratch tables with the articles indexes, one plain and one
+partitioned by month on published_at, and seeds both with the same synthetic
+rows spread over the last two years (1M by default). It then times 500-row
+insert batches and the typical read queries against each, and reports how
+many tables each query plan touches. The scratch tables are dropped afterwards.
+
+Usage:
+    python benchmarks/bench_partitioning.py [row_count]
+"""
+
+import asyncio
+import json
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from config import settings
+from database import close_database, database, init_database
+from services.partition_service import add_months, month_start
+
+FLAT_TABLE = "bench_articles_flat"
+PARTITIONED_TABLE = "bench_articles_partitioned"
+MONTHS = 24
+WRITE_BATCHES = 20
+WRITE_BATCH_SIZE = 500
+RUNS = 10
+
+COLUMNS = """
+    id VARCHAR(36) NOT NULL,
+    title VARCHAR(500) NOT NULL,
+    source_name VARCHAR(100) NOT NULL,
+    original_excerpt TEXT NOT NULL,
+    published_at TIMESTAMP NOT NULL,
+    topic VARCHAR(50) NOT NULL,
+    url VARCHAR(1000) NOT NULL,
+    region VARCHAR(20) DEFAULT 'Global'
+"""
+
+QUERIES = {
+    "topic, last 7 days": """
+        SELECT id, title FROM {table}
+        WHERE topic = 'Technology' AND published_at >= now()::timestamp - interval '7 days'
+        ORDER BY published_at DESC LIMIT 20
+    """,
+    "count, last 30 days": """
+        SELECT COUNT(*) FROM {table}
+        WHERE published_at >= now()::timestamp - interval '30 days'
+    """,
+    "by topic, 6 months ago": """
+        SELECT topic, COUNT(*) FROM {table}
+        WHERE published_at >= date_trunc('month', now()::timestamp) - interval '6 months'
+          AND published_at < date_trunc('month', now()::timestamp) - interval '5 months'
+        GROUP BY topic
+    """,
+}
+
+def insert_rows_sql(table: str, first: int, count: int, start: datetime, span_seconds: int) -> str:
+    """Server-side generated rows so seeding isn't bound by client round trips"""
+    return f"""
+        INSERT INTO {table} (id, title, source_name, original_excerpt, published_at, topic, url)
+        SELECT
+            md5(g::text),
+            'Bench article ' || g,
+            'Bench',
+            repeat('Synthetic excerpt for the partitioning benchmark. ', 4),
+            TIMESTAMP '{start:%Y-%m-%d %H:%M:%S}' + (random() * {span_seconds}) * interval '1 second',
+            (ARRAY['World', 'Technology', 'Business', 'Sports', 'Science'])[1 + g % 5],
+            'https://bench.example.com/' || g
+        FROM generate_series({first}, {first + count - 1}) g
+    """
+
+async def create_tables():
+    """Both scratch tables, with the same indexes as articles"""
+    await database.execute(f"CREATE TABLE {FLAT_TABLE} ({COLUMNS}, PRIMARY KEY (id))")
+    await database.execute(f"CREATE UNIQUE INDEX ON {FLAT_TABLE} (url)")
+
+    await database.execute(
+        f"CREATE TABLE {PARTITIONED_TABLE} ({COLUMNS}, PRIMARY KEY (id, published_at)) PARTITION BY RANGE (published_at)"
+    )
+    await database.execute(f"CREATE UNIQUE INDEX ON {PARTITIONED_TABLE} (url, published_at)")
+    first_month = add_months(month_start(datetime.utcnow()), -MONTHS)
+    for i in range(MONTHS + 2):
+        start, end = add_months(first_month, i), add_months(first_month, i + 1)
+        await database.execute(f"""
+            CREATE TABLE {PARTITIONED_TABLE}_{i} PARTITION OF {PARTITIONED_TABLE}
+            FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')
+        """)
+
+    for table in (FLAT_TABLE, PARTITIONED_TABLE):
+        await database.execute(f"CREATE INDEX ON {table} (published_at)")
+        await database.execute(f"CREATE INDEX ON {table} (topic, published_at)")
+        await database.execute(f"CREATE INDEX ON {table} (source_name, published_at)")
+
+async def seed(row_count: int):
+    first_month = add_months(month_start(datetime.utcnow()), -MONTHS)
+    span_seconds = int((datetime.utcnow() - first_month).total_seconds())
+    for table in (FLAT_TABLE, PARTITIONED_TABLE):
+        for first in range(0, row_count, 100_000):
+            await database.execute(
+                insert_rows_sql(table, first, min(100_000, row_count - first), first_month, span_seconds)
+            )
+        await database.execute(f"ANALYZE {table}")
+
+async def time_writes(table: str, first_id: int) -> float:
+    """Median latency of a 500-row insert of fresh articles"""
+    timings = []
+    for batch in range(WRITE_BATCHES):
+        query = insert_rows_sql(
+            table, first_id + batch * WRITE_BATCH_SIZE, WRITE_BATCH_SIZE, month_start(datetime.utcnow()), 3600
+        )
+        start = time.perf_counter()
+        await database.execute(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+async def time_query(query: str) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        await database.fetch_all(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+async def tables_scanned(query: str) -> int:
+    """Distinct tables in the query plan, i.e. partitions left after pruning"""
+    row = await database.fetch_one(f"EXPLAIN (FORMAT JSON) {query}")
+    plan = row["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    relations = set()
+
+    def walk(node: dict):
+        if "Relation Name" in node:
+            relations.add(node["Relation Name"])
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan[0]["Plan"])
+    return len(relations)
+
+async def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    await init_database()
+
+    try:
+        print(f"🌱 Seeding {row_count} rows into each table...")
+        await create_tables()
+        await seed(row_count)
+
+        print(f"\n{'workload':<24} | {'flat (ms)':>9} | {'partitioned (ms)':>16} | {'tables scanned':>14}")
+        print("-" * 73)
+
+        flat_ms = await time_writes(FLAT_TABLE, row_count)
+        partitioned_ms = await time_writes(PARTITIONED_TABLE, row_count)
+        print(f"{'insert 500 rows':<24} | {flat_ms:>9.2f} | {partitioned_ms:>16.2f} | {'':>14}")
+
+        for name, template in QUERIES.items():
+            flat_ms = await time_query(template.format(table=FLAT_TABLE))
+            partitioned_query = template.format(table=PARTITIONED_TABLE)
+            partitioned_ms = await time_query(partitioned_query)
+            scanned = await tables_scanned(partitioned_query)
+            print(f"{name:<24} | {flat_ms:>9.2f} | {partitioned_ms:>16.2f} | {scanned:>14}")
+    finally:
+        await database.execute(f"DROP TABLE IF EXISTS {FLAT_TABLE}")
+        await database.execute(f"DROP TABLE IF EXISTS {PARTITIONED_TABLE}")
+        await close_database()
+
+if __name__ == "__main__":
+    if settings.DB_TYPE == "mysql":
+        print("❌ This benchmark needs PostgreSQL")
+        sys.exit(1)
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark: SELECT * vs. column-projected article pages
+
+For 100-row pages, compares the old SELECT * query with each named field set
+in models.ARTICLE_FIELD_SETS: time to fetch and decode the rows, and the size
+of the JSON payload /api/news/articles would send. Uses the articles already
+in the configured database (Last 30 days).
+
+Usage:
+    python benchmarks/bench_projection.py
+"""
+
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models import ARTICLE_FIELD_SETS, ArticleFilter, DateRangeEnum
+from services.database_service import db_service
+
+PAGE_SIZE = 100
+RUNS = 20
+
+def median_ms(timings: list) -> float:
+    return statistics.median(timings) * 1000
+
+async def bench_select_star() -> tuple:
+    """The previous query: every column of every row"""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        rows = await db_service.db.fetch_all(
+            "SELECT * FROM articles ORDER BY published_at DESC LIMIT :limit", {"limit": PAGE_SIZE}
+        )
+        decoded = [dict(row._mapping) for row in rows]
+        timings.append(time.perf_counter() - start)
+    payload = json.dumps(decoded, default=str).encode()
+    return len(rows), median_ms(timings), len(payload)
+
+async def bench_field_set(name: str) -> tuple:
+    """get_articles_from_db plus serialization for one field set"""
+    filters = ArticleFilter(date_range=DateRangeEnum.LAST_30_DAYS, limit=PAGE_SIZE, fields=name)
+    include = set(ARTICLE_FIELD_SETS[name])
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        articles = await db_service.get_articles_from_db(filters)
+        timings.append(time.perf_counter() - start)
+    payload = json.dumps(
+        [article.model_dump(mode="json", include=include, warnings=False) for article in articles]
+    ).encode()
+    return len(articles), median_ms(timings), len(payload)
+
+async def main():
+    await db_service.init_db()
+
+    try:
+        print(f"{'query':<10} | {'rows':>5} | {'fetch+decode (ms)':>17} | {'payload (KB)':>12}")
+        print("-" * 54)
+
+        rows, ms, size = await bench_select_star()
+        print(f"{'SELECT *':<10} | {rows:>5} | {ms:>17.2f} | {size / 1024:>12.1f}")
+
+        for name in ARTICLE_FIELD_SETS:
+            rows, ms, size = await bench_field_set(name)
+            print(f"{name:<10} | {rows:>5} | {ms:>17.2f} | {size / 1024:>12.1f}")
+    finally:
+        await db_service.db.disconnect()
+
+if __name__ == "__main__":
+    asyncio.run(main())
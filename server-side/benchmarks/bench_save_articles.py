@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark: bulk upsert vs. per-article loop in save_articles
+
+Times the old SELECT-then-INSERT loop against DatabaseService.save_articles
+for 100- and 1000-article batches, both for fresh articles and for a replay
+of the same batch (all duplicates). Runs against the configured database and
+removes its rows afterwards.
+
+Usage:
+    python benchmarks/bench_save_articles.py
+"""
+
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models import Article, NewsSource, TopicEnum
+from services.database_service import db_service
+
+BENCH_URL_PREFIX = "https://bench.example.com/"
+BATCH_SIZES = [100, 1000]
+
+def make_articles(count: int) -> list:
+    """Synthetic articles with unique urls"""
+    now = datetime.utcnow()
+    run_id = uuid.uuid4().hex[:8]
+    return [
+        Article(
+            id=str(uuid.uuid4()),
+            title=f"Benchmark article {i} of run {run_id}",
+            source=NewsSource(name="Bench", favicon="📰", color="from-blue-500 to-purple-500"),
+            original_excerpt="Synthetic excerpt used to benchmark article writes. " * 4,
+            published_at=now - timedelta(minutes=i),
+            topic=TopicEnum.TECHNOLOGY,
+            url=f"{BENCH_URL_PREFIX}{run_id}/{i}",
+        )
+        for i in range(count)
+    ]
+
+async def legacy_save(articles: list):
+    """The previous implementation: one SELECT and one INSERT per article"""
+    for article in articles:
+        existing = await db_service.db.fetch_one(
+            "SELECT id FROM articles WHERE url = :url", {"url": str(article.url)}
+        )
+        if not existing:
+            await db_service.db.execute(
+                """
+                INSERT INTO articles (
+                    id, title, source_name, source_favicon, source_color,
+                    original_excerpt, published_at, topic, url, image_url,
+                    view_count, like_count, region
+                ) VALUES (
+                    :id, :title, :source_name, :source_favicon, :source_color,
+                    :original_excerpt, :published_at, :topic, :url, :image_url,
+                    :view_count, :like_count, :region
+                )
+                """,
+                {
+                    "id": article.id,
+                    "title": article.title,
+                    "source_name": article.source.name,
+                    "source_favicon": article.source.favicon,
+                    "source_color": article.source.color,
+                    "original_excerpt": article.original_excerpt,
+                    "published_at": article.published_at,
+                    "topic": article.topic.value,
+                    "url": str(article.url),
+                    "image_url": None,
+                    "view_count": article.view_count,
+                    "like_count": article.like_count,
+                    "region": "Global",
+                },
+            )
+
+async def timed(fn, articles: list) -> float:
+    start = time.perf_counter()
+    await fn(articles)
+    return time.perf_counter() - start
+
+async def main():
+    await db_service.init_db()
+    print(f"{'batch':>6} | {'strategy':<8} | {'fresh (s)':>10} | {'replay (s)':>10}")
+    print("-" * 46)
+
+    try:
+        for size in BATCH_SIZES:
+            for name, fn in (("loop", legacy_save), ("bulk", db_service.save_articles)):
+                articles = make_articles(size)
+                fresh = await timed(fn, articles)
+                replay = await timed(fn, articles)
+                print(f"{size:>6} | {name:<8} | {fresh:>10.3f} | {replay:>10.3f}")
+    finally:
+        await db_service.db.execute(
+            "DELETE FROM articles WHERE url LIKE :prefix", {"prefix": f"{BENCH_URL_PREFIX}%"}
+        )
+        await db_service.db.disconnect()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark: ILIKE '%q%' scans vs. indexed full-text search
+
+Seeds synthetic articles (100k by default) into the configured database,
+then times the old ILIKE predicate against the full-text path used by
+get_articles_from_db for a handful of search terms. Seeded rows are removed
+afterwards. Run migrations/add_fulltext_search.py first.
+
+Usage:
+    python benchmarks/bench_search.py [row_count]
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from config import settings
+from models import Article, NewsSource, TopicEnum
+from services.database_service import db_service
+
+BENCH_URL_PREFIX = "https://bench.example.com/search/"
+SEARCH_TERMS = ["climate summit", "election", "quantum computing", "merger"]
+RUNS_PER_TERM = 5
+
+VOCABULARY = (
+    "market economy climate summit election government policy quantum computing "
+    "startup merger acquisition research study space mission football final "
+    "streaming platform vaccine trial energy grid central bank inflation"
+).split()
+
+def make_articles(count: int) -> list:
+    """Synthetic articles with random titles and excerpts"""
+    now = datetime.utcnow()
+    topics = list(TopicEnum)
+    return [
+        Article(
+            id=str(uuid.uuid4()),
+            title=" ".join(random.choices(VOCABULARY, k=8)).capitalize(),
+            source=NewsSource(name="Bench", favicon="📰", color="from-blue-500 to-purple-500"),
+            original_excerpt=" ".join(random.choices(VOCABULARY, k=40)),
+            published_at=now - timedelta(minutes=random.randint(0, 60 * 24 * 30)),
+            topic=random.choice(topics),
+            url=f"{BENCH_URL_PREFIX}{i}",
+        )
+        for i in range(count)
+    ]
+
+async def time_query(query: str, params: dict) -> float:
+    """Median latency in milliseconds over RUNS_PER_TERM runs"""
+    timings = []
+    for _ in range(RUNS_PER_TERM):
+        start = time.perf_counter()
+        await db_service.db.fetch_all(query, params)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+async def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    await db_service.init_db()
+
+    try:
+        print(f"🌱 Seeding {row_count} articles...")
+        for start in range(0, row_count, 10_000):
+            await db_service.save_articles(make_articles(min(10_000, row_count - start)))
+
+        ilike_operator = "LIKE" if settings.DB_TYPE == "mysql" else "ILIKE"
+        ilike_query = f"""
+        SELECT id FROM articles
+        WHERE title {ilike_operator} :search OR original_excerpt {ilike_operator} :search
+        ORDER BY published_at DESC LIMIT 20
+        """
+        fulltext_query = f"""
+        SELECT id FROM articles
+        WHERE {db_service._fulltext_condition()}
+        ORDER BY {db_service._fulltext_match_expression()} DESC LIMIT 20
+        """
+
+        print(f"\n{'term':<20} | {'ILIKE (ms)':>10} | {'full-text (ms)':>14}")
+        print("-" * 51)
+        for term in SEARCH_TERMS:
+            ilike_ms = await time_query(ilike_query, {"search": f"%{term}%"})
+            fulltext_ms = await time_query(fulltext_query, {"search": term})
+            print(f"{term:<20} | {ilike_ms:>10.1f} | {fulltext_ms:>14.1f}")
+    finally:
+        await db_service.db.execute(
+            "DELETE FROM articles WHERE url LIKE :prefix", {"prefix": f"{BENCH_URL_PREFIX}%"}
+        )
+        await db_service.db.disconnect()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+⏱️ Micro-benchmark: validated vs. trusted Article serialization
+
+Times turning a 100-row page of database rows into the JSON body of
+/api/news/articles, per row:
+- before: validate each row into an Article, then let FastAPI's
+  response_model pass dump, re-validate and encode the list
+- after: model_construct each row, then dump the list straight to JSON bytes
+Needs no database; the rows are synthetic.
+
+Usage:
+    python benchmarks/bench_serialization.py
+"""
+
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pydantic import TypeAdapter
+
+from models import ARTICLE_FIELD_SETS, Article, NewsSource, TopicEnum, dump_articles_json
+from services.database_service import db_service, projection_columns
+
+PAGE_SIZE = 100
+RUNS = 200
+
+response_adapter = TypeAdapter(List[Article])
+
+def make_rows(count: int) -> list:
+    """Rows shaped like a SELECT of the detail projection"""
+    now = datetime.utcnow()
+    return [
+        {
+            "id": f"bench-{i}",
+            "published_at": now - timedelta(minutes=i),
+            "title": f"Benchmark headline number {i} about markets and policy",
+            "source_name": "Bench Wire",
+            "source_favicon": "📰",
+            "source_color": "from-blue-500 to-purple-500",
+            "original_excerpt": "Synthetic excerpt used to benchmark article serialization. " * 4,
+            "summary": "A short synthetic summary of the benchmark article.",
+            "topic": "Business",
+            "url": f"https://bench.example.com/articles/{i}",
+            "image_url": f"https://bench.example.com/images/{i}.jpg",
+            "view_count": i,
+            "like_count": i // 2,
+        }
+        for i in range(count)
+    ]
+
+def before(rows: list) -> bytes:
+    """Validated Articles plus FastAPI's response_model round trip"""
+    articles = [
+        Article(
+            id=row["id"],
+            title=row["title"],
+            source=NewsSource(name=row["source_name"], favicon=row["source_favicon"], color=row["source_color"]),
+            original_excerpt=row["original_excerpt"],
+            summary=row["summary"],
+            published_at=row["published_at"],
+            topic=TopicEnum(row["topic"]),
+            url=row["url"],
+            image_url=row["image_url"],
+            view_count=row["view_count"],
+            like_count=row["like_count"],
+        )
+        for row in rows
+    ]
+    content = [article.model_dump() for article in articles]
+    validated = response_adapter.validate_python(content)
+    return json.dumps(response_adapter.dump_python(validated, mode="json")).encode()
+
+def after(rows: list, columns: list) -> bytes:
+    """Trusted rows: construct without validation, dump straight to bytes"""
+    articles = [db_service._row_to_article(row, columns) for row in rows]
+    return dump_articles_json(articles)
+
+def per_row_us(fn) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) / PAGE_SIZE * 1_000_000
+
+def main():
+    rows = make_rows(PAGE_SIZE)
+    columns = projection_columns(ARTICLE_FIELD_SETS["detail"])
+
+    # Both paths must produce the same document
+    assert json.loads(before(rows)) == json.loads(after(rows, columns))
+
+    before_us = per_row_us(lambda: before(rows))
+    after_us = per_row_us(lambda: after(rows, columns))
+
+    print(f"{'path':<8} | {'per row (µs)':>12} | {'per page (ms)':>13}")
+    print("-" * 39)
+    print(f"{'before':<8} | {before_us:>12.2f} | {before_us * PAGE_SIZE / 1000:>13.3f}")
+    print(f"{'after':<8} | {after_us:>12.2f} | {after_us * PAGE_SIZE / 1000:>13.3f}")
+    print(f"\n⚡ {before_us / after_us:.1f}x faster per row")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+🧪 Stand-in Gemini server with injected latency
+
+Serves the two REST endpoints AIService calls, generateContent and
+streamGenerateContent (SSE), with canned summaries after a configurable
+per-model delay, so model tiering, deadlines and hedging can be exercised
+locally. Point the backend at it with GEMINI_BASE_URL=http://127.0.0.1:8090
+(any GEMINI_API_KEY works).
+
+Usage:
+    python benchmarks/stand_in_gemini.py [--port 8090]
+        [--latency gemini-2.5-flash=0.4 --latency gemini-2.5-pro=2.5]
+        [--jitter 0.2] [--tail-probability 0.05 --tail-seconds 8]
+        [--error-rate 0.0] [--empty-rate 0.0]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from typing import Dict
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+
+SUMMARY = (
+    "The article reports a significant development and explains who is affected. "
+    "It closes with what officials expect to happen next."
+)
+DEFAULT_LATENCY = 1.0
+
+class Latency:
+    """Delay per model: base latency, uniform jitter and an occasional slow tail"""
+
+    def __init__(self, per_model: Dict[str, float] = None, jitter: float = 0.0,
+                 tail_probability: float = 0.0, tail_seconds: float = 0.0,
+                 error_rate: float = 0.0, empty_rate: float = 0.0, seed: int = None):
+        self.per_model = per_model or {}
+        self.jitter = jitter
+        self.tail_probability = tail_probability
+        self.tail_seconds = tail_seconds
+        self.error_rate = error_rate
+        self.empty_rate = empty_rate
+        self.random = random.Random(seed)
+        self.requests: Dict[str, int] = {}
+
+    def delay(self, model: str) -> float:
+        self.requests[model] = self.requests.get(model, 0) + 1
+        seconds = self.per_model.get(model, DEFAULT_LATENCY) * (1 + self.random.uniform(-self.jitter, self.jitter))
+        if self.random.random() < self.tail_probability:
+            seconds += self.tail_seconds
+        return max(seconds, 0.0)
+
+    def outcome(self) -> str:
+        roll = self.random.random()
+        if roll < self.error_rate:
+            return "error"
+        if roll < self.error_rate + self.empty_rate:
+            return "empty"
+        return "ok"
+
+def response_body(text: str) -> dict:
+    return {
+        "candidates": [{"content": {"parts": [{"text": text}], "role": "model"}, "finishReason": "STOP"}],
+        "modelVersion": "stand-in",
+    }
+
+def create_app(latency: Latency) -> FastAPI:
+    app = FastAPI(title="Stand-in Gemini")
+
+    @app.post("/{version}/models/{model}:generateContent")
+    async def generate_content(version: str, model: str):
+        await asyncio.sleep(latency.delay(model))
+        outcome = latency.outcome()
+        if outcome == "error":
+            raise HTTPException(status_code=503, detail="Injected error")
+        return response_body("" if outcome == "empty" else SUMMARY)
+
+    @app.post("/{version}/models/{model}:streamGenerateContent")
+    async def stream_generate_content(version: str, model: str):
+        # Time to first chunk carries the latency; the rest arrives word by word
+        await asyncio.sleep(latency.delay(model))
+        outcome = latency.outcome()
+        if outcome == "error":
+            raise HTTPException(status_code=503, detail="Injected error")
+
+        async def chunks():
+            if outcome == "empty":
+                yield f"data: {json.dumps(response_body(''))}\n\n"
+                return
+            for word in SUMMARY.split(" "):
+                yield f"data: {json.dumps(response_body(word + ' '))}\n\n"
+                await asyncio.sleep(0.02)
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    @app.get("/stats")
+    async def stats():
+        return {"requests": latency.requests}
+
+    return app
+
+def parse_latencies(entries: list) -> Dict[str, float]:
+    per_model = {}
+    for entry in entries:
+        model, _, seconds = entry.partition("=")
+        per_model[model] = float(seconds)
+    return per_model
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Stand-in Gemini server with injected latency")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", action="append", default=[], metavar="MODEL=SECONDS")
+    parser.add_argument("--jitter", type=float, default=0.2, help="fraction of the base latency")
+    parser.add_argument("--tail-probability", type=float, default=0.0)
+    parser.add_argument("--tail-seconds", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--empty-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    latency = Latency(
+        parse_latencies(args.latency), args.jitter, args.tail_probability, args.tail_seconds,
+        args.error_rate, args.empty_rate,
+    )
+    print("=" * 60)
+    print(f"🧪 Stand-in Gemini on http://127.0.0.1:{args.port}")
+    print(f"⏱️ Latency: {latency.per_model or 'default'} (default {DEFAULT_LATENCY}s)")
+    print("=" * 60)
+    uvicorn.run(create_app(latency), host="127.0.0.1", port=args.port, log_level="warning")
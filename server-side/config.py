@@ -3,6 +3,14 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+def _replica_urls(database_url: str, primary_host: str, port: int, replica_hosts: list) -> list:
+    """Replica URLs reuse the primary's driver, credentials and database name"""
+    urls = []
+    for host in replica_hosts:
+        target = host if ":" in host else f"{host}:{port}"
+        urls.append(database_url.replace(f"@{primary_host}:{port}/", f"@{target}/"))
+    return urls
+
 class Settings:
     # API Keys
     NEWS_API_KEY = os.getenv("NEWS_API_KEY", "your_newsapi_key_here")
@@ -28,12 +36,56 @@ class Settings:
         DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
         SYNC_DATABASE_URL = f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     
-    # Connection Pool Settings
-    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 20))
-    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 30))
-    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+    # Read Replica Settings (comma-separated hosts, optionally host:port)
+    DB_READ_REPLICA_HOSTS = [host.strip() for host in os.getenv("DB_READ_REPLICA_HOSTS", "").split(",") if host.strip()]
+    DATABASE_REPLICA_URLS = _replica_urls(DATABASE_URL, DB_HOST, DB_PORT, DB_READ_REPLICA_HOSTS)
+    DB_REPLICA_BALANCING = os.getenv("DB_REPLICA_BALANCING", "round_robin")  # round_robin or least_connections
+    DB_REPLICA_RETRY_SECONDS = int(os.getenv("DB_REPLICA_RETRY_SECONDS", 30))
+    DB_READ_YOUR_WRITES_SECONDS = float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", 5))  # 0 disables
+    
+    # Connection Pool Settings (one async pool per worker, per database host)
+    DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", 2))
+    DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", os.getenv("DB_POOL_SIZE", 10)))
+    DB_POOL_WAIT_SAMPLES = int(os.getenv("DB_POOL_WAIT_SAMPLES", 1000))  # checkouts kept for wait percentiles
     DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 3600))
     
+    # Query Instrumentation Settings (per-statement timing and slow-query log)
+    QUERY_LOG_ENABLED = os.getenv("QUERY_LOG_ENABLED", "True").lower() == "true"
+    QUERY_LOG_MAX_FINGERPRINTS = int(os.getenv("QUERY_LOG_MAX_FINGERPRINTS", 500))
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 200))
+    SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "True").lower() == "true"
+    SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS = int(os.getenv("SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS", 300))  # per fingerprint
+    SLOW_QUERY_RECENT_LIMIT = int(os.getenv("SLOW_QUERY_RECENT_LIMIT", 200))
+    SLOW_QUERY_LOG_FILE = os.getenv("SLOW_QUERY_LOG_FILE", "logs/slow_queries.log")  # empty disables the file
+    SLOW_QUERY_LOG_MAX_BYTES = int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", 10 * 1024 * 1024))
+    SLOW_QUERY_LOG_BACKUP_COUNT = int(os.getenv("SLOW_QUERY_LOG_BACKUP_COUNT", 5))
+    
+    # Admin API Settings (/api/admin/*: pool, query and partition stats)
+    ADMIN_API_ENABLED = os.getenv("ADMIN_API_ENABLED", "False").lower() == "true"
+    ADMIN_API_TOKEN = os.getenv("ADMIN_API_TOKEN", "")  # sent as X-Admin-Token; required when enabled
+    
+    # Bulk Write Settings
+    DB_BULK_BATCH_SIZE = int(os.getenv("DB_BULK_BATCH_SIZE", 500))
+    ARTICLE_UPSERT_MODE = os.getenv("ARTICLE_UPSERT_MODE", "nothing")  # nothing or update
+    
+    # Article Partitioning Settings (PostgreSQL only; see migrations/partition_articles.py)
+    # Turns on partition maintenance. Upserts detect a partitioned table themselves: its unique key is
+    # (url, published_at), so a stored url keeps its first published_at rather than being stored again
+    ARTICLE_PARTITIONING_ENABLED = os.getenv("ARTICLE_PARTITIONING_ENABLED", "False").lower() == "true" and DB_TYPE != "mysql"
+    ARTICLE_PARTITION_MONTHS_AHEAD = int(os.getenv("ARTICLE_PARTITION_MONTHS_AHEAD", 3))
+    ARTICLE_RETENTION_MONTHS = int(os.getenv("ARTICLE_RETENTION_MONTHS", 12))  # 0 keeps every partition
+    ARTICLE_RETENTION_MODE = os.getenv("ARTICLE_RETENTION_MODE", "archive")  # archive or detach
+    PARTITION_MAINTENANCE_INTERVAL_HOURS = float(os.getenv("PARTITION_MAINTENANCE_INTERVAL_HOURS", 24))
+    
+    # Interaction Tracking Settings (write-behind buffer)
+    INTERACTION_FLUSH_INTERVAL_SECONDS = float(os.getenv("INTERACTION_FLUSH_INTERVAL_SECONDS", 5))
+    INTERACTION_FLUSH_BATCH_SIZE = int(os.getenv("INTERACTION_FLUSH_BATCH_SIZE", 500))
+    INTERACTION_MAX_PENDING = int(os.getenv("INTERACTION_MAX_PENDING", 50000))
+    
+    # Search Settings (LIKE search is used until migrations/add_fulltext_search.py has run)
+    FULLTEXT_SEARCH_ENABLED = os.getenv("FULLTEXT_SEARCH_ENABLED", "True").lower() == "true"
+    SEARCH_RECENCY_HALF_LIFE_DAYS = float(os.getenv("SEARCH_RECENCY_HALF_LIFE_DAYS", 2))
+    
     # API Settings
     HOST = os.getenv("HOST", "0.0.0.0")
     PORT = int(os.getenv("PORT", 8000))
@@ -43,12 +95,87 @@ class Settings:
     NEWS_API_BASE_URL = "https://newsapi.org/v2"
     MAX_ARTICLES_PER_REQUEST = 100
     
+    # NewsAPI HTTP Client Settings
+    NEWS_API_MAX_CONNECTIONS = int(os.getenv("NEWS_API_MAX_CONNECTIONS", 20))
+    NEWS_API_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("NEWS_API_MAX_KEEPALIVE_CONNECTIONS", 10))
+    NEWS_API_KEEPALIVE_EXPIRY = float(os.getenv("NEWS_API_KEEPALIVE_EXPIRY", 30))
+    NEWS_API_HTTP2 = os.getenv("NEWS_API_HTTP2", "True").lower() == "true"
+    NEWS_API_CONNECT_TIMEOUT = float(os.getenv("NEWS_API_CONNECT_TIMEOUT", 5))
+    NEWS_API_READ_TIMEOUT = float(os.getenv("NEWS_API_READ_TIMEOUT", 10))
+    
     # AI Settings
     OPENAI_MODEL = "gpt-4"
-    MAX_SUMMARY_LENGTH = 300
+    GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-pro")
+    GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", 8))  # per worker
+    GEMINI_TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT_SECONDS", 30))
+    GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL", "")  # e.g. a local stand-in server; empty for Google's endpoint
+    # Fastest first as "model:timeout_seconds,..."; a tier is escalated past on error, timeout or empty output
+    GEMINI_MODEL_TIERS = os.getenv("GEMINI_MODEL_TIERS", f"gemini-2.5-flash:10,{GEMINI_MODEL}:{GEMINI_TIMEOUT_SECONDS:g}")
+    SUMMARY_DEADLINE_SECONDS = float(os.getenv("SUMMARY_DEADLINE_SECONDS", 20))  # across every tier of one request
+    # Send a duplicate request once a call outlives the model's p95; the first answer wins
+    GEMINI_HEDGE_ENABLED = os.getenv("GEMINI_HEDGE_ENABLED", "True").lower() == "true"
+    GEMINI_HEDGE_MIN_DELAY_MS = int(os.getenv("GEMINI_HEDGE_MIN_DELAY_MS", 200))
+    MAX_SUMMARY_LENGTH = 300  # characters, asked of the model in the prompt
+    # Inputs estimated above the budget are summarized chunk by chunk, then reduced
+    SUMMARY_INPUT_TOKEN_BUDGET = int(os.getenv("SUMMARY_INPUT_TOKEN_BUDGET", 3000))
+    SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", 1500))
+    SUMMARY_MAX_CHUNKS = int(os.getenv("SUMMARY_MAX_CHUNKS", 8))  # text beyond this many chunks is dropped
+    
+    # Extractive Summary Settings (local, no model call)
+    EXTRACTIVE_METHOD = os.getenv("EXTRACTIVE_METHOD", "textrank")  # textrank or centroid
+    LLM_EXPECTED_LATENCY_MS = int(os.getenv("LLM_EXPECTED_LATENCY_MS", 3000))  # until enough calls are measured
+    LLM_DEGRADED_AFTER_FAILURES = int(os.getenv("LLM_DEGRADED_AFTER_FAILURES", 3))
+    LLM_DEGRADED_COOLDOWN_SECONDS = int(os.getenv("LLM_DEGRADED_COOLDOWN_SECONDS", 60))
+    SUMMARY_LOW_PRIORITY_ENGINE = os.getenv("SUMMARY_LOW_PRIORITY_ENGINE", "extractive")  # extractive or llm
     
     # Cache Settings
-    CACHE_DURATION_MINUTES = 30
+    CACHE_DURATION_MINUTES = int(os.getenv("CACHE_DURATION_MINUTES", 30))
+    CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 1000))
+    CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", 50 * 1024 * 1024))
+    
+    # Stale-while-revalidate: fresh until the soft TTL, served stale and refreshed
+    # in the background until the hard TTL, refreshed inline after that
+    SWR_ENABLED = os.getenv("SWR_ENABLED", "True").lower() == "true"
+    SWR_SOFT_TTL_SECONDS = int(os.getenv("SWR_SOFT_TTL_SECONDS", CACHE_DURATION_MINUTES * 60))
+    SWR_HARD_TTL_SECONDS = int(os.getenv("SWR_HARD_TTL_SECONDS", CACHE_DURATION_MINUTES * 60 * 4))
+    
+    # Summary Cache Settings: in-process LRU in front of the summaries table
+    SUMMARY_CACHE_TTL_SECONDS = int(os.getenv("SUMMARY_CACHE_TTL_SECONDS", 6 * 3600))
+    SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", 5000))
+    SUMMARY_CACHE_MAX_BYTES = int(os.getenv("SUMMARY_CACHE_MAX_BYTES", 5 * 1024 * 1024))
+    SUMMARY_STORE_TTL_DAYS = int(os.getenv("SUMMARY_STORE_TTL_DAYS", 90))  # 0 keeps rows forever
+    SUMMARY_STORE_MAX_ROWS = int(os.getenv("SUMMARY_STORE_MAX_ROWS", 500000))  # least recently used evicted first
+    SUMMARY_STORE_TOUCH_INTERVAL_SECONDS = int(os.getenv("SUMMARY_STORE_TOUCH_INTERVAL_SECONDS", 3600))
+    SUMMARY_STORE_PRUNE_INTERVAL_HOURS = float(os.getenv("SUMMARY_STORE_PRUNE_INTERVAL_HOURS", 6))
+    
+    # Batch Summarization Settings
+    SUMMARY_BATCH_MAX_ITEMS = int(os.getenv("SUMMARY_BATCH_MAX_ITEMS", 100))
+    SUMMARY_BATCH_CONCURRENCY = int(os.getenv("SUMMARY_BATCH_CONCURRENCY", 4))  # misses generated at once per batch
+    
+    # Background Summarization Settings
+    SUMMARY_PIPELINE_ENABLED = os.getenv("SUMMARY_PIPELINE_ENABLED", "True").lower() == "true"
+    SUMMARY_PIPELINE_WORKERS = int(os.getenv("SUMMARY_PIPELINE_WORKERS", 2))
+    SUMMARY_PIPELINE_BATCH_SIZE = int(os.getenv("SUMMARY_PIPELINE_BATCH_SIZE", 10))
+    SUMMARY_PIPELINE_CONCURRENCY = int(os.getenv("SUMMARY_PIPELINE_CONCURRENCY", 2))  # model calls per worker
+    SUMMARY_PIPELINE_POLL_SECONDS = int(os.getenv("SUMMARY_PIPELINE_POLL_SECONDS", 60))
+    SUMMARY_PIPELINE_LOOKBACK_HOURS = int(os.getenv("SUMMARY_PIPELINE_LOOKBACK_HOURS", 48))
+    SUMMARY_PIPELINE_ENQUEUE_LIMIT = int(os.getenv("SUMMARY_PIPELINE_ENQUEUE_LIMIT", 1000))
+    SUMMARY_PIPELINE_LEASE_SECONDS = int(os.getenv("SUMMARY_PIPELINE_LEASE_SECONDS", 300))
+    SUMMARY_PIPELINE_MAX_ATTEMPTS = int(os.getenv("SUMMARY_PIPELINE_MAX_ATTEMPTS", 5))
+    SUMMARY_PIPELINE_RETRY_BASE_SECONDS = int(os.getenv("SUMMARY_PIPELINE_RETRY_BASE_SECONDS", 60))
+    # Queued articles get model summaries when trending; the rest follow SUMMARY_LOW_PRIORITY_ENGINE
+    SUMMARY_TRENDING_MIN_INTERACTIONS = int(os.getenv("SUMMARY_TRENDING_MIN_INTERACTIONS", 5))  # views + likes on the article
+    SUMMARY_TRENDING_TOPICS = int(os.getenv("SUMMARY_TRENDING_TOPICS", 3))  # topics drawing the most views and likes
+    SUMMARY_TRENDING_LOOKBACK_HOURS = int(os.getenv("SUMMARY_TRENDING_LOOKBACK_HOURS", 6))
+    
+    # Background Ingestion Settings
+    INGESTION_ENABLED = os.getenv("INGESTION_ENABLED", "True").lower() == "true"
+    INGESTION_INTERVAL_MINUTES = int(os.getenv("INGESTION_INTERVAL_MINUTES", 15))
+    INGESTION_CONCURRENCY = int(os.getenv("INGESTION_CONCURRENCY", 4))
+    INGESTION_PAGE_SIZE = int(os.getenv("INGESTION_PAGE_SIZE", 50))
+    # The interval is stretched so a day of cycles fits the NewsAPI plan (100 requests/day on the free tier)
+    NEWS_API_DAILY_REQUEST_LIMIT = int(os.getenv("NEWS_API_DAILY_REQUEST_LIMIT", 100))  # 0 for no limit
+    INGESTION_LEASE_RETRY_SECONDS = int(os.getenv("INGESTION_LEASE_RETRY_SECONDS", 60))  # standby workers
     
     # CORS Settings
     ALLOWED_ORIGINS = [
@@ -1,41 +1,266 @@
 from sqlalchemy import create_engine, Column, String, DateTime, Integer, Text, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import NullPool
 from databases import Database
+from collections import deque
+from contextvars import ContextVar
 from datetime import datetime
+from typing import List, Optional
+import itertools
+import time
 import uuid
 import asyncio
 import logging
 
 from config import settings
+from services.query_log import query_log
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Database setup with connection pooling for RDS
-engine = create_engine(
-    settings.SYNC_DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_timeout=settings.DB_POOL_TIMEOUT,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-    pool_pre_ping=True,  # Validate connections before use
-    echo=settings.DEBUG,
-    connect_args={
-        "sslmode": settings.DB_SSL_MODE,
-        "connect_timeout": 10,
-    } if settings.DB_TYPE == "postgresql" else {
-        "connect_timeout": 10,
+def _pool_options() -> dict:
+    """Pool sizing passed through to asyncpg / aiomysql"""
+    options = {
+        "min_size": settings.DB_POOL_MIN_SIZE,
+        "max_size": settings.DB_POOL_MAX_SIZE,
     }
-)
+    if settings.DB_TYPE == "mysql":
+        options["pool_recycle"] = settings.DB_POOL_RECYCLE
+    else:
+        options["max_inactive_connection_lifetime"] = settings.DB_POOL_RECYCLE
+    return options
 
-# Async database connection
-database = Database(settings.DATABASE_URL)
+class MeteredDatabase:
+    """databases.Database wrapper that records pool checkout waits and connections in use"""
+    
+    def __init__(self, url: str, name: str = "primary", **options):
+        self._database = Database(url, **options)
+        self.name = name
+        self.max_size = options.get("max_size")
+        self.checkouts = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self._waits = deque(maxlen=settings.DB_POOL_WAIT_SAMPLES)
+    
+    @property
+    def is_connected(self) -> bool:
+        return self._database.is_connected
+    
+    async def connect(self):
+        await self._database.connect()
+    
+    async def disconnect(self):
+        await self._database.disconnect()
+    
+    def connection(self):
+        return self._database.connection()
+    
+    def transaction(self, *args, **kwargs):
+        return self._database.transaction(*args, **kwargs)
+    
+    async def _run(self, method: str, *args):
+        # Entering the connection is where a task waits for a free pool slot
+        connection = self._database.connection()
+        start = time.perf_counter()
+        async with connection:
+            self._waits.append(time.perf_counter() - start)
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            try:
+                return await query_log.run(
+                    self.name, method, args[0], args[1],
+                    lambda: getattr(connection, method)(*args),
+                    self._explain
+                )
+            finally:
+                self.in_use -= 1
+    
+    async def _explain(self, query: str, values: Optional[dict]) -> List[str]:
+        """EXPLAIN output as text lines; not recorded in the query log itself"""
+        rows = await self._database.fetch_all(query, values)
+        return [" | ".join(str(value) for value in row._mapping.values()) for row in rows]
+    
+    async def fetch_all(self, query, values: Optional[dict] = None):
+        return await self._run("fetch_all", query, values)
+    
+    async def fetch_one(self, query, values: Optional[dict] = None):
+        return await self._run("fetch_one", query, values)
+    
+    async def execute(self, query, values: Optional[dict] = None):
+        return await self._run("execute", query, values)
+    
+    async def execute_many(self, query, values: list):
+        return await self._run("execute_many", query, values)
+    
+    def get_pool_stats(self) -> dict:
+        """Checkout counts and pool wait percentiles over the recent sample window"""
+        waits = sorted(self._waits)
+        
+        def percentile_ms(fraction: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(len(waits) * fraction))] * 1000, 3)
+        
+        return {
+            "connected": self.is_connected,
+            "max_size": self.max_size,
+            "checkouts": self.checkouts,
+            "in_use": self.in_use,
+            "max_in_use": self.max_in_use,
+            "wait_ms": {
+                "p50": percentile_ms(0.5),
+                "p95": percentile_ms(0.95),
+                "p99": percentile_ms(0.99),
+                "max": percentile_ms(1.0),
+            },
+        }
+
+# Single async connection pool shared by the whole app; opened and closed by the lifespan
+database = MeteredDatabase(settings.DATABASE_URL, **_pool_options())
+
+def get_sync_engine():
+    """Short-lived sync engine for schema migrations; the app itself never uses it"""
+    return create_engine(
+        settings.SYNC_DATABASE_URL,
+        poolclass=NullPool,
+        echo=settings.DEBUG,
+        connect_args={
+            "sslmode": settings.DB_SSL_MODE,
+            "connect_timeout": 10,
+        } if settings.DB_TYPE == "postgresql" else {
+            "connect_timeout": 10,
+        }
+    )
+
+# Monotonic deadline until which reads in this context must see the primary
+_primary_reads_until: ContextVar[float] = ContextVar("primary_reads_until", default=0.0)
+
+# Per-request record of committed writes, shared with tasks the request starts
+_request_writes: ContextVar[Optional[dict]] = ContextVar("request_writes", default=None)
+
+class ReplicaRouter:
+    """Routes read-only queries to healthy read replicas and everything else to the primary"""
+    
+    def __init__(self, primary: MeteredDatabase, replica_urls: List[str]):
+        self.primary = primary
+        self.replicas = [
+            MeteredDatabase(url, name=f"replica_{i}", **_pool_options())
+            for i, url in enumerate(replica_urls)
+        ]
+        self.in_flight = [0] * len(self.replicas)
+        self.unhealthy_until = [0.0] * len(self.replicas)
+        self.reads_by_target = {"primary": 0, **{f"replica_{i}": 0 for i in range(len(self.replicas))}}
+        self.failovers = 0
+        self._round_robin = itertools.count()
+    
+    async def connect(self):
+        """Connect every replica; one that can't connect starts out unhealthy"""
+        for i, replica in enumerate(self.replicas):
+            if replica.is_connected:
+                continue
+            try:
+                await replica.connect()
+                logger.info(f"✅ Connected to read replica {i}")
+            except Exception as e:
+                self._mark_unhealthy(i, e)
+    
+    async def disconnect(self):
+        for replica in self.replicas:
+            if replica.is_connected:
+                await replica.disconnect()
+    
+    def mark_write(self):
+        """After a committed write: pin this context's reads to the primary for the read-your-writes window"""
+        if settings.DB_READ_YOUR_WRITES_SECONDS > 0:
+            _primary_reads_until.set(time.monotonic() + settings.DB_READ_YOUR_WRITES_SECONDS)
+            writes = _request_writes.get()
+            if writes is not None:
+                writes["committed"] = True
+    
+    def track_writes(self) -> dict:
+        """Start recording whether the current request commits a write; {"committed": bool}"""
+        writes = {"committed": False}
+        _request_writes.set(writes)
+        return writes
+    
+    def pin_primary(self, seconds: float):
+        """Force reads in this context to the primary, e.g. for a client that just wrote"""
+        _primary_reads_until.set(time.monotonic() + seconds)
+    
+    def _mark_unhealthy(self, index: int, error: Exception):
+        self.unhealthy_until[index] = time.monotonic() + settings.DB_REPLICA_RETRY_SECONDS
+        logger.warning(f"⚠️ Read replica {index} marked unhealthy for {settings.DB_REPLICA_RETRY_SECONDS}s: {error}")
+    
+    def _choose_replica(self) -> Optional[int]:
+        """Pick a replica index, or None when reads must go to the primary"""
+        if not self.replicas or time.monotonic() < _primary_reads_until.get():
+            return None
+        
+        now = time.monotonic()
+        healthy = [
+            i for i, replica in enumerate(self.replicas)
+            if replica.is_connected and self.unhealthy_until[i] <= now
+        ]
+        if not healthy:
+            return None
+        
+        if settings.DB_REPLICA_BALANCING == "least_connections":
+            return min(healthy, key=lambda i: self.in_flight[i])
+        return healthy[next(self._round_robin) % len(healthy)]
+    
+    async def _read(self, method: str, query, values: Optional[dict]):
+        index = self._choose_replica()
+        if index is not None:
+            self.in_flight[index] += 1
+            try:
+                result = await getattr(self.replicas[index], method)(query, values)
+                self.reads_by_target[f"replica_{index}"] += 1
+                return result
+            except Exception as e:
+                replica_error = e
+            finally:
+                self.in_flight[index] -= 1
+            
+            # Retry on the primary; only blame the replica if the primary succeeds
+            result = await getattr(self.primary, method)(query, values)
+            self._mark_unhealthy(index, replica_error)
+            self.failovers += 1
+            self.reads_by_target["primary"] += 1
+            return result
+        
+        self.reads_by_target["primary"] += 1
+        return await getattr(self.primary, method)(query, values)
+    
+    async def fetch_all(self, query, values: Optional[dict] = None):
+        return await self._read("fetch_all", query, values)
+    
+    async def fetch_one(self, query, values: Optional[dict] = None):
+        return await self._read("fetch_one", query, values)
+    
+    def get_stats(self) -> dict:
+        """Routing counters and per-replica health"""
+        now = time.monotonic()
+        return {
+            "balancing": settings.DB_REPLICA_BALANCING,
+            "read_your_writes_seconds": settings.DB_READ_YOUR_WRITES_SECONDS,
+            "failovers": self.failovers,
+            "reads": self.reads_by_target,
+            "replicas": [
+                {
+                    "index": i,
+                    "connected": replica.is_connected,
+                    "healthy": self.unhealthy_until[i] <= now,
+                    "in_flight": self.in_flight[i],
+                    "pool": replica.get_pool_stats(),
+                }
+                for i, replica in enumerate(self.replicas)
+            ],
+        }
+
+read_router = ReplicaRouter(database, settings.DATABASE_REPLICA_URLS)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 class ArticleDB(Base):
@@ -48,6 +273,7 @@ class ArticleDB(Base):
     source_color = Column(String(100), default="from-blue-500 to-purple-500")
     original_excerpt = Column(Text, nullable=False)
     summary = Column(Text, nullable=True)
+    summary_engine = Column(String(20), nullable=True)  # llm or extractive; a model summary replaces an extractive one
     published_at = Column(DateTime, nullable=False, index=True)
     topic = Column(String(50), nullable=False, index=True)
     url = Column(String(1000), nullable=False)
@@ -56,6 +282,7 @@ class ArticleDB(Base):
     like_count = Column(Integer, default=0)
     is_trending = Column(Boolean, default=False, index=True)
     region = Column(String(20), default="Global", index=True)
+    content_hash = Column(String(64), nullable=True, index=True)  # key into summaries
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -65,6 +292,8 @@ class ArticleDB(Base):
         Index('idx_source_published', 'source_name', 'published_at'),
         Index('idx_region_topic', 'region', 'topic'),
         Index('idx_trending_published', 'is_trending', 'published_at'),
+        # Conflict target for bulk upserts; MySQL can only index a url prefix
+        Index('uq_articles_url', 'url', unique=True, mysql_length=768),
     )
 
 class UserInteractionDB(Base):
@@ -76,6 +305,58 @@ class UserInteractionDB(Base):
     user_ip = Column(String(45), nullable=True)  # For anonymous tracking
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
 
+class SummaryDB(Base):
+    """AI summaries shared by every article with the same normalized title and content"""
+    __tablename__ = "summaries"
+    
+    content_hash = Column(String(64), primary_key=True)
+    model = Column(String(100), primary_key=True)
+    prompt_version = Column(String(20), primary_key=True)
+    summary = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_used_at = Column(DateTime, default=datetime.utcnow, index=True)  # LRU eviction
+
+class SummaryJobDB(Base):
+    """Queue of articles waiting for a background summary; workers lease rows in batches"""
+    __tablename__ = "summary_jobs"
+    
+    article_id = Column(String(36), primary_key=True)
+    priority = Column(Integer, default=0, nullable=False)  # 1 for trending articles
+    published_at = Column(DateTime, nullable=False)
+    enqueued_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    lease_token = Column(String(36), nullable=True, index=True)
+    lease_expires_at = Column(DateTime, nullable=True)  # also the retry time after a failure
+    last_error = Column(Text, nullable=True)
+    
+    __table_args__ = (
+        Index('idx_summary_jobs_priority', 'priority', 'published_at'),
+    )
+
+class SchedulerLeaseDB(Base):
+    """Which worker runs a once-per-deployment background job; a lease lapses when its holder stops renewing"""
+    __tablename__ = "scheduler_leases"
+    
+    name = Column(String(50), primary_key=True)
+    holder = Column(String(36), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+class ArticleStatsHourlyDB(Base):
+    """Incrementally maintained rollup behind /stats and /trending"""
+    __tablename__ = "article_stats_hourly"
+    
+    bucket_hour = Column(DateTime, primary_key=True)  # published_at truncated to the hour
+    topic = Column(String(50), primary_key=True)
+    source_name = Column(String(100), primary_key=True)
+    region = Column(String(20), primary_key=True)
+    article_count = Column(Integer, nullable=False, default=0)
+    view_count = Column(Integer, nullable=False, default=0)
+    like_count = Column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        Index('idx_stats_topic_hour', 'topic', 'bucket_hour'),
+    )
+
 class TrendingTopicDB(Base):
     __tablename__ = "trending_topics"
     
@@ -88,40 +369,41 @@ class TrendingTopicDB(Base):
     date = Column(DateTime, default=datetime.utcnow, index=True)
 
 async def init_database():
-    """Initialize database connection and create tables"""
+    """Open the async pool (primary and replicas) and warm it before serving traffic"""
     try:
-        # Connect to database
-        await database.connect()
-        logger.info("✅ Connected to Amazon RDS database")
+        if not database.is_connected:
+            await database.connect()
+            logger.info("✅ Connected to Amazon RDS database")
+        await read_router.connect()
         
-        # Create tables
-        Base.metadata.create_all(bind=engine)
-        logger.info("✅ Database tables created/verified")
+        # Check out min_size connections at once so the first requests don't pay for the handshakes
+        await asyncio.gather(*(
+            database.fetch_one("SELECT 1") for _ in range(settings.DB_POOL_MIN_SIZE)
+        ))
+        logger.info(f"✅ Database pool warmed ({settings.DB_POOL_MIN_SIZE}-{settings.DB_POOL_MAX_SIZE} connections)")
         
     except Exception as e:
         logger.error(f"❌ Database initialization failed: {e}")
         raise
 
+def create_tables():
+    """Create any missing tables (run from setup/migration scripts, not at app startup)"""
+    engine = get_sync_engine()
+    try:
+        Base.metadata.create_all(bind=engine)
+        logger.info("✅ Database tables created/verified")
+    finally:
+        engine.dispose()
+
 async def close_database():
     """Close database connection"""
     try:
+        await read_router.disconnect()
         await database.disconnect()
         logger.info("✅ Database connection closed")
     except Exception as e:
         logger.error(f"❌ Error closing database: {e}")
 
-def get_db():
-    """Dependency to get database session"""
-    db = SessionLocal()
-    try:
-        yield db
-    except Exception as e:
-        logger.error(f"Database session error: {e}")
-        db.rollback()
-        raise
-    finally:
-        db.close()
-
 async def get_async_db():
     """Get async database connection"""
     return database
@@ -132,7 +414,12 @@ async def check_database_health():
     try:
         query = "SELECT 1"
         result = await database.fetch_one(query)
-        return {"status": "healthy", "connection": "active"}
+        return {
+            "status": "healthy",
+            "connection": "active",
+            "pool": database.get_pool_stats(),
+            "replicas": read_router.get_stats()["replicas"]
+        }
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
         return {"status": "unhealthy", "error": str(e)}
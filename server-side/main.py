@@ -1,14 +1,74 @@
-from fastapi import FastAPI
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from config import settings
+from database import close_database, init_database, read_router
+
 # Import routers
+from routers.admin import router as admin_router
 from routers.ai import router as ai_router
 from routers.news import router as news_router
+from services.ai_service import ai_service
+from services.database_service import db_service
+from services.ingestion_service import ingestion_service
+from services.interaction_buffer import interaction_buffer
+from services.news_service import news_service
+from services.partition_service import partition_service
+from services.summary_pipeline import summary_pipeline
+from services.summary_store import summary_store
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open and warm the single async RDS pool before the first request
+    await init_database()
+    
+    # Search falls back to LIKE until the full-text migration has run
+    await db_service.detect_fulltext_search()
+    
+    # The upsert conflict key depends on whether articles has been partitioned
+    await db_service.detect_article_partitioning()
+    
+    # One pooled NewsAPI client per worker, shared by requests and ingestion
+    await news_service.start()
+    
+    # Keep RDS warm in the background so requests never wait on NewsAPI
+    if settings.INGESTION_ENABLED:
+        ingestion_service.start()
+    
+    # Create next months' article partitions ahead of time and retire expired ones
+    if settings.ARTICLE_PARTITIONING_ENABLED:
+        partition_service.start()
+    
+    # Room in the thread pool for Gemini calls, including abandoned hedges
+    ai_service.start()
+    
+    # Views and likes are buffered in memory and flushed to RDS in batches
+    interaction_buffer.start()
+    
+    # Expire and evict rows from the persistent summary cache tier
+    summary_store.start()
+    
+    # Summarize new articles before their first reader asks
+    if settings.SUMMARY_PIPELINE_ENABLED:
+        summary_pipeline.start()
+    yield
+    await ingestion_service.stop()
+    await summary_pipeline.stop()
+    await interaction_buffer.stop()
+    await partition_service.stop()
+    await summary_store.stop()
+    await news_service.close()
+    await ai_service.close()
+    await close_database()
 
 app = FastAPI(
     title="📰 Global News Digest AI",
     description="A modern news API powered by AI for summarization and analytics.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -25,9 +85,41 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Cache", "X-Cache-Tier", "X-Summary-Engine"],
 )
 
+# Read-your-writes across requests: a client that just wrote reads from the
+# primary until replicas have had time to catch up
+READ_YOUR_WRITES_COOKIE = "db_primary_until"
+
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    if settings.DB_READ_YOUR_WRITES_SECONDS <= 0:
+        return await call_next(request)
+    
+    try:
+        remaining = float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) - time.time()
+    except ValueError:
+        remaining = 0
+    if remaining > 0:
+        read_router.pin_primary(remaining)
+    
+    # Only requests that committed a write pin the client; buffered views and likes
+    # and summaries served from cache don't
+    writes = read_router.track_writes()
+    response = await call_next(request)
+    
+    if writes["committed"] and response.status_code < 400:
+        response.set_cookie(
+            READ_YOUR_WRITES_COOKIE,
+            str(time.time() + settings.DB_READ_YOUR_WRITES_SECONDS),
+            max_age=int(settings.DB_READ_YOUR_WRITES_SECONDS) + 1,
+            httponly=True
+        )
+    return response
+
 # Include routers
+app.include_router(admin_router)
 app.include_router(ai_router)
 app.include_router(news_router)
 
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+🔎 Full-Text Search Migration Script for Amazon RDS
+
+Adds index-backed full-text search over article titles and excerpts:
+- PostgreSQL: a generated, weighted tsvector column kept up to date on every
+  insert/update, plus a GIN index on it
+- MySQL: a FULLTEXT index on (title, original_excerpt)
+
+Safe to run more than once.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from database import get_sync_engine
+from config import settings
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+engine = get_sync_engine()
+
+POSTGRES_STATEMENTS = [
+    """
+    ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(original_excerpt, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_articles_search ON articles USING GIN (search_vector)",
+]
+
+def apply_fulltext_search(conn):
+    """Create the full-text column/index for the configured database type"""
+    if settings.DB_TYPE == "mysql":
+        exists = conn.execute(text("""
+            SELECT COUNT(*) FROM information_schema.statistics
+            WHERE table_schema = DATABASE()
+              AND table_name = 'articles'
+              AND index_name = 'idx_articles_fulltext'
+        """)).scalar()
+        if not exists:
+            conn.execute(text(
+                "ALTER TABLE articles ADD FULLTEXT INDEX idx_articles_fulltext (title, original_excerpt)"
+            ))
+    else:
+        for statement in POSTGRES_STATEMENTS:
+            conn.execute(text(statement))
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🌟 GLOBAL NEWS DIGEST AI - FULL-TEXT SEARCH MIGRATION")
+    print("=" * 60)
+    print(f"📍 Database: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
+    print(f"🔧 Database Type: {settings.DB_TYPE}")
+    
+    try:
+        with engine.begin() as conn:
+            apply_fulltext_search(conn)
+        print("✅ Full-text search index ready")
+        print("\n🎉 Full-text search migration completed!")
+    except Exception as e:
+        print(f"❌ Full-text search migration failed: {e}")
+        logger.error(f"Full-text search migration error: {e}")
+        sys.exit(1)
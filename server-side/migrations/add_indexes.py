@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+🗂️ Index Migration Script for Amazon RDS
+
+create_all() only creates missing tables, so indexes added to the models later
+never reach an existing database. This script removes duplicate article urls
+(required by the unique url index used for bulk upserts) and then creates any
+index declared in the models that the database doesn't have yet.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from database import Base, get_sync_engine
+from config import settings
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+engine = get_sync_engine()
+
+def remove_duplicate_urls():
+    """Keep one row per article url so the unique index can be built"""
+    if settings.DB_TYPE == "mysql":
+        query = """
+        DELETE a FROM articles a
+        JOIN articles b ON a.url = b.url AND a.id > b.id
+        """
+    else:
+        query = """
+        DELETE FROM articles a
+        USING articles b
+        WHERE a.url = b.url AND a.id > b.id
+        """
+    
+    with engine.begin() as conn:
+        result = conn.execute(text(query))
+        print(f"🧹 Removed {result.rowcount} duplicate articles")
+
+def create_missing_indexes():
+    """Create every model index that doesn't exist yet"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+            print(f"✅ Index '{index.name}' on '{table.name}' verified")
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🌟 GLOBAL NEWS DIGEST AI - INDEX MIGRATION")
+    print("=" * 60)
+    print(f"📍 Database: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
+    
+    try:
+        remove_duplicate_urls()
+        create_missing_indexes()
+        print("\n🎉 Index migration completed!")
+    except Exception as e:
+        print(f"❌ Index migration failed: {e}")
+        logger.error(f"Index migration error: {e}")
+        sys.exit(1)
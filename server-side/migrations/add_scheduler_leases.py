@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+🔒 Scheduler Lease Migration Script for Amazon RDS
+
+Creates the scheduler_leases table. Background jobs that must run once per
+deployment, not once per uvicorn worker (NewsAPI ingestion), take a lease
+row here; without the table every worker ingests on its own.
+
+Safe to run more than once.
+
+Usage:
+    python migrations/add_scheduler_leases.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from database import SchedulerLeaseDB, get_sync_engine
+from config import settings
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+engine = get_sync_engine()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🌟 GLOBAL NEWS DIGEST AI - SCHEDULER LEASE MIGRATION")
+    print("=" * 60)
+    print(f"📍 Database: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
+
+    try:
+        SchedulerLeaseDB.__table__.create(bind=engine, checkfirst=True)
+        print("✅ Table 'scheduler_leases' verified")
+        print("\n🎉 Scheduler lease migration completed!")
+    except Exception as e:
+        print(f"❌ Scheduler lease migration failed: {e}")
+        logger.error(f"Scheduler lease migration error: {e}")
+        sys.exit(1)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+📬 Summary Queue Migration Script for Amazon RDS
+
+Creates the summary_jobs table, the queue the background summarization
+pipeline leases articles from, and adds articles.summary_engine, which
+marks extractive summaries so a model summary can replace them. Optionally
+enqueues recent articles that still have no summary so the pipeline starts
+with a full backlog.
+
+Safe to run more than once.
+
+Usage:
+    python migrations/add_summary_jobs.py [--enqueue]
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import inspect, text
+
+from database import SummaryJobDB, get_sync_engine
+from config import settings
+from services.database_service import db_service
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+engine = get_sync_engine()
+
+def add_summary_engine_column():
+    """Add summary_engine to articles (and the retention archive, which mirrors its columns) if missing"""
+    inspector = inspect(engine)
+    for table in ("articles", "articles_archive"):
+        if not inspector.has_table(table):
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table)}
+        if "summary_engine" not in columns:
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN summary_engine VARCHAR(20)"))
+            print(f"✅ Added {table}.summary_engine")
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🌟 GLOBAL NEWS DIGEST AI - SUMMARY QUEUE MIGRATION")
+    print("=" * 60)
+    print(f"📍 Database: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
+
+    try:
+        SummaryJobDB.__table__.create(bind=engine, checkfirst=True)
+        print("✅ Table 'summary_jobs' verified")
+        add_summary_engine_column()
+
+        if "--enqueue" in sys.argv:
+            enqueued = asyncio.run(db_service.enqueue_summary_jobs())
+            print(f"✅ Enqueued {enqueued} articles from the last {settings.SUMMARY_PIPELINE_LOOKBACK_HOURS}h")
+
+        print("\n🎉 Summary queue migration completed!")
+    except Exception as e:
+        print(f"❌ Summary queue migration failed: {e}")
+        logger.error(f"Summary queue migration error: {e}")
+        sys.exit(1)
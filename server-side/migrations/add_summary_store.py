@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+🧠 Summary Store Migration Script for Amazon RDS
+
+Creates the summaries table (AI summaries keyed by a hash of the normalized
+title and content plus model and prompt version), adds articles.content_hash
+and backfills it for existing articles so they can share stored summaries.
+Also adds summaries.last_used_at, used to evict the least recently used rows.
+
+Safe to run more than once.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import inspect, text
+
+from database import ArticleDB, SummaryDB, get_sync_engine
+from config import settings
+from services.content_hash import content_hash
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+engine = get_sync_engine()
+
+BACKFILL_BATCH_SIZE = 1000
+
+def add_last_used_column():
+    """Add summaries.last_used_at (LRU eviction) to tables created before it existed"""
+    columns = {column["name"] for column in inspect(engine).get_columns("summaries")}
+    if "last_used_at" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE summaries ADD COLUMN last_used_at TIMESTAMP NULL"))
+            conn.execute(text("UPDATE summaries SET last_used_at = created_at"))
+        print("✅ Added summaries.last_used_at")
+    
+    for index in SummaryDB.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+def add_content_hash_column():
+    """Add articles.content_hash and its index if missing"""
+    columns = {column["name"] for column in inspect(engine).get_columns("articles")}
+    if "content_hash" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE articles ADD COLUMN content_hash VARCHAR(64)"))
+        print("✅ Added articles.content_hash")
+    
+    for index in ArticleDB.__table__.indexes:
+        if "content_hash" in index.columns:
+            index.create(bind=engine, checkfirst=True)
+
+def backfill_content_hashes():
+    """Hash existing articles in batches"""
+    total = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(text(
+                "SELECT id, title, original_excerpt FROM articles WHERE content_hash IS NULL LIMIT :limit"
+            ), {"limit": BACKFILL_BATCH_SIZE}).fetchall()
+            if not rows:
+                break
+            
+            conn.execute(
+                text("UPDATE articles SET content_hash = :content_hash WHERE id = :id"),
+                [{"id": row.id, "content_hash": content_hash(row.title, row.original_excerpt)} for row in rows]
+            )
+        total += len(rows)
+        print(f"   hashed {total} articles...")
+    
+    print(f"✅ Backfilled content hashes for {total} articles")
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🌟 GLOBAL NEWS DIGEST AI - SUMMARY STORE MIGRATION")
+    print("=" * 60)
+    print(f"📍 Database: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
+    
+    try:
+        SummaryDB.__table__.create(bind=engine, checkfirst=True)
+        print("✅ Table 'summaries' verified")
+        add_last_used_column()
+        add_content_hash_column()
+        backfill_content_hashes()
+        print("\n🎉 Summary store migration completed!")
+    except Exception as e:
+        print(f"❌ Summary store migration failed: {e}")
+        logger.error(f"Summary store migration error: {e}")
+        sys.exit(1)
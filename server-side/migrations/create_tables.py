@@ -14,13 +14,18 @@ from pathlib import Path
 # Add parent directory to path to import modules
 sys.path.append(str(Path(__file__).parent.parent))
 
-from database import Base, engine, init_database
+from database import Base, get_sync_engine, init_database
 from config import settings
+from migrations.add_fulltext_search import apply_fulltext_search
+from migrations.partition_articles import convert_articles_table
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Migrations run DDL over a short-lived sync engine; the app only uses the async pool
+engine = get_sync_engine()
+
 async def create_tables():
     """Create all database tables"""
     try:
@@ -34,6 +39,14 @@ async def create_tables():
         # Create all tables
         Base.metadata.create_all(bind=engine)
         
+        # Full-text search column and index live outside the ORM models
+        with engine.begin() as conn:
+            apply_fulltext_search(conn)
+        
+        # Monthly partitions for articles (PostgreSQL only)
+        if settings.ARTICLE_PARTITIONING_ENABLED:
+            await convert_articles_table(drop_legacy=True)
+        
         print("✅ All tables created successfully!")
         print("\n📋 Created tables:")
         for table_name in Base.metadata.tables.keys():
@@ -52,7 +65,7 @@ async def verify_tables():
         from database import database
         
         # Check if tables exist
-        tables_to_check = ['articles', 'user_interactions', 'trending_topics']
+        tables_to_check = ['articles', 'user_interactions', 'trending_topics', 'article_stats_hourly', 'summaries', 'summary_jobs', 'scheduler_leases']
         
         for table in tables_to_check:
             query = f"SELECT COUNT(*) as count FROM {table}"
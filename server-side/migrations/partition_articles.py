@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+🗓️ Article Partitioning Migration for Amazon RDS (PostgreSQL)
+
+Converts the articles table into a table range-partitioned by month on
+published_at, so range queries only scan the months they ask for and each
+month's indexes stay small. The existing table is renamed to
+articles_unpartitioned, its rows are copied into the new monthly partitions,
+and it is kept until you drop it (or pass --drop-legacy).
+
+Partitions for upcoming months are created here and, while the API runs with
+ARTICLE_PARTITIONING_ENABLED=true, by the background partition maintenance.
+
+The unique index on url becomes (url, published_at), since it must include
+the partition key. Workers detect the conversion at startup (or after a
+failed save) and upsert on the new key. Before inserting, they give each
+already-stored url its stored published_at, so a story NewsAPI re-dates
+still updates its row instead of being stored twice.
+
+Usage:
+    python migrations/partition_articles.py                        # convert + create upcoming partitions
+    python migrations/partition_articles.py --drop-legacy          # ...and drop articles_unpartitioned
+    python migrations/partition_articles.py --retention [--dry-run] # retire partitions past retention
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from config import settings
+from database import ArticleDB, close_database, database, init_database
+from migrations.add_fulltext_search import POSTGRES_STATEMENTS
+from services.partition_service import ARTICLE_COLUMNS, partition_service
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+LEGACY_TABLE = "articles_unpartitioned"
+
+def partitioned_index_statements() -> list:
+    """Model indexes for the partitioned parent; unique indexes must include published_at"""
+    statements = []
+    for index in ArticleDB.__table__.indexes:
+        if index.name == "uq_articles_url":
+            statements.append("CREATE UNIQUE INDEX uq_articles_url ON articles (url, published_at)")
+        else:
+            statements.append(str(CreateIndex(index).compile(dialect=postgresql.dialect())))
+    return statements
+
+async def convert_articles_table(drop_legacy: bool = False) -> bool:
+    """Swap articles for a monthly-partitioned copy; returns False if it already is one"""
+    if await partition_service.is_partitioned():
+        return False
+
+    async with database.transaction():
+        await database.execute("LOCK TABLE articles IN ACCESS EXCLUSIVE MODE")
+
+        # Move the old table and its index names out of the way
+        indexes = await database.fetch_all(
+            "SELECT indexname FROM pg_indexes WHERE schemaname = 'public' AND tablename = 'articles'"
+        )
+        await database.execute(f"ALTER TABLE articles RENAME TO {LEGACY_TABLE}")
+        for index in indexes:
+            await database.execute(f"ALTER INDEX {index['indexname']} RENAME TO {index['indexname'][:56]}_legacy")
+
+        await database.execute(f"""
+            CREATE TABLE articles (LIKE {LEGACY_TABLE} INCLUDING DEFAULTS INCLUDING GENERATED)
+            PARTITION BY RANGE (published_at)
+        """)
+        await database.execute("ALTER TABLE articles ADD PRIMARY KEY (id, published_at)")
+        for statement in partitioned_index_statements() + POSTGRES_STATEMENTS:
+            await database.execute(statement)
+
+        oldest = await database.fetch_one(f"SELECT MIN(published_at) AS oldest FROM {LEGACY_TABLE}")
+        created = await partition_service.ensure_partitions(first_month=oldest["oldest"])
+        print(f"✅ Created {len(created)} monthly partitions")
+
+        columns = ", ".join(ARTICLE_COLUMNS)
+        await database.execute(f"INSERT INTO articles ({columns}) SELECT {columns} FROM {LEGACY_TABLE}")
+        copied = await database.fetch_one("SELECT COUNT(*) AS count FROM articles")
+        print(f"✅ Copied {copied['count']} articles into the partitioned table")
+
+        if drop_legacy:
+            await database.execute(f"DROP TABLE {LEGACY_TABLE}")
+            print(f"🗑️ Dropped {LEGACY_TABLE}")
+
+    return True
+
+async def main():
+    await init_database()
+
+    try:
+        if "--retention" in sys.argv:
+            result = await partition_service.apply_retention(dry_run="--dry-run" in sys.argv)
+            action = "Would retire" if result["dry_run"] else "Retired"
+            print(f"🗄️ {action} {len(result['retired'])} partitions older than {result['cutoff']} ({result['mode']})")
+            for name in result["retired"]:
+                print(f"   - {name}")
+            if result["archived_rows"]:
+                print(f"📦 Archived {result['archived_rows']} rows")
+            return
+
+        if await convert_articles_table(drop_legacy="--drop-legacy" in sys.argv):
+            print("✅ articles is now partitioned by month")
+            if "--drop-legacy" not in sys.argv:
+                print(f"💡 Drop {LEGACY_TABLE} once you've checked the copy")
+        else:
+            created = await partition_service.ensure_partitions()
+            print(f"✅ articles is already partitioned; created {len(created)} new partitions")
+
+        for partition in await partition_service.list_partitions():
+            print(f"   - {partition['name']}: ~{partition['approximate_rows']} rows")
+    finally:
+        await close_database()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🌟 GLOBAL NEWS DIGEST AI - ARTICLE PARTITIONING")
+    print("=" * 60)
+    print(f"📍 Database: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
+
+    if settings.DB_TYPE == "mysql":
+        print("❌ Article partitioning is only supported on PostgreSQL")
+        sys.exit(1)
+
+    try:
+        asyncio.run(main())
+        print("\n🎉 Article partitioning completed!")
+    except Exception as e:
+        print(f"❌ Article partitioning failed: {e}")
+        logger.error(f"Article partitioning error: {e}")
+        sys.exit(1)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+📊 Statistics Rollup Reconciliation for Amazon RDS
+
+/stats and /trending read the incrementally maintained article_stats_hourly
+rollup. This job compares it with a fresh aggregate of the raw articles table
+and, with --rebuild (or when --fix is given and drift is found), rebuilds it.
+
+Usage:
+    python migrations/reconcile_rollups.py           # check only
+    python migrations/reconcile_rollups.py --fix     # rebuild if drift is found
+    python migrations/reconcile_rollups.py --rebuild # always rebuild
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from database import ArticleStatsHourlyDB, get_sync_engine
+from services.database_service import db_service
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+engine = get_sync_engine()
+
+async def reconcile(fix: bool, rebuild: bool):
+    """Check the rollup against the raw tables and rebuild when asked"""
+    await db_service.init_db()
+    
+    try:
+        if not rebuild:
+            report = await db_service.check_rollups()
+            print(f"🔍 Checked {report['buckets_checked']} buckets")
+            
+            if report["consistent"]:
+                print("✅ Rollup matches the raw articles table")
+                return
+            
+            print(f"⚠️ {report['mismatch_count']} buckets drifted, for example:")
+            for mismatch in report["mismatches"][:10]:
+                print(
+                    f"   - {mismatch['bucket_hour']} {mismatch['topic']}/{mismatch['source_name']}/{mismatch['region']}: "
+                    f"expected {mismatch['expected']}, found {mismatch['actual']}"
+                )
+            
+            if not fix:
+                sys.exit(1)
+        
+        buckets = await db_service.rebuild_rollups()
+        print(f"✅ Rollup rebuilt with {buckets} buckets")
+    finally:
+        await db_service.db.disconnect()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🌟 GLOBAL NEWS DIGEST AI - ROLLUP RECONCILIATION")
+    print("=" * 60)
+    
+    # Make sure the rollup table exists on databases created before it was added
+    ArticleStatsHourlyDB.__table__.create(bind=engine, checkfirst=True)
+    
+    asyncio.run(reconcile(fix="--fix" in sys.argv, rebuild="--rebuild" in sys.argv))
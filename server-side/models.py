@@ -1,4 +1,4 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, HttpUrl, TypeAdapter, field_validator
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -35,6 +35,7 @@ class Article(BaseModel):
     source: NewsSource
     original_excerpt: str
     summary: Optional[str] = None
+    summary_engine: Optional[str] = None  # "extractive" summaries are replaced once the model summarizes the article
     published_at: datetime
     topic: TopicEnum
     url: HttpUrl
@@ -43,6 +44,42 @@ class Article(BaseModel):
     view_count: int = 0
     like_count: int = 0
 
+# Named projections for article listings; "detail" is the full Article
+ARTICLE_FIELD_SETS = {
+    "detail": [
+        "id", "title", "source", "original_excerpt", "summary", "summary_engine", "published_at",
+        "topic", "url", "image_url", "is_loading_summary", "view_count", "like_count"
+    ],
+    "card": [
+        "id", "title", "source", "published_at", "topic", "url", "image_url",
+        "view_count", "like_count"
+    ],
+    "headline": ["id", "title", "source", "published_at", "topic", "url"],
+}
+
+# Serializes article lists straight to JSON bytes, without a FastAPI response_model pass
+_article_list_adapter = TypeAdapter(List[Article])
+
+def dump_articles_json(articles: List[Article], fields: Optional[List[str]] = None) -> bytes:
+    """JSON bytes for a list of articles, limited to fields when given"""
+    include = {"__all__": set(fields)} if fields else None
+    # Rows built with model_construct hold plain str urls; skip the HttpUrl type warnings
+    return _article_list_adapter.dump_json(articles, include=include, warnings=False)
+
+def resolve_article_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Expand a field-set name or comma-separated field list; raises ValueError on unknown fields"""
+    if not fields:
+        return None
+    if fields in ARTICLE_FIELD_SETS:
+        return ARTICLE_FIELD_SETS[fields]
+    
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in ARTICLE_FIELD_SETS["detail"]]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    # Keep the Article field order so equivalent lists share a cache entry
+    return [field for field in ARTICLE_FIELD_SETS["detail"] if field in requested]
+
 class ArticleCreate(BaseModel):
     title: str
     source_name: str
@@ -60,14 +97,67 @@ class ArticleFilter(BaseModel):
     search_query: Optional[str] = None
     page: int = 1
     limit: int = 20
+    cursor: Optional[str] = None
+    fields: Optional[str] = None
+
+    @field_validator("source")
+    @classmethod
+    def normalize_source(cls, value: Optional[str]) -> Optional[str]:
+        """"All" or blank means no source filter; the query and cache key see the same stripped name"""
+        value = value.strip() if value else None
+        return value if value and value != "All" else None
+
+    @field_validator("search_query")
+    @classmethod
+    def normalize_search_query(cls, value: Optional[str]) -> Optional[str]:
+        value = " ".join(value.split()) if value else ""
+        return value or None
+
+    def cache_key(self) -> str:
+        """Normalized key so equivalent filters share cache and in-flight entries"""
+        # Search matching is case-insensitive, so case doesn't split the key
+        search = self.search_query.lower() if self.search_query else None
+        return "|".join(str(part) for part in (
+            self.region.value if self.region else None,
+            self.topic.value if self.topic else None,
+            self.source,
+            self.date_range.value if self.date_range else None,
+            search,
+            self.page,
+            self.limit,
+            self.cursor,
+            ",".join(resolve_article_fields(self.fields) or ARTICLE_FIELD_SETS["detail"]),
+        ))
 
 class SummaryRequest(BaseModel):
     title: str
     content: str
+    article_id: Optional[str] = None  # also store the summary on this article
+    latency_budget_ms: Optional[int] = None  # below the model's p95, an extractive summary is returned
 
 class SummaryResponse(BaseModel):
     summary: str
 
+class BatchSummaryRequest(BaseModel):
+    items: List[SummaryRequest] = []
+    article_ids: List[str] = []  # summarized from their stored title and excerpt
+    latency_budget_ms: Optional[int] = None  # for article_ids and items without their own budget
+
+class BatchSummaryResult(BaseModel):
+    index: int  # position across items, then article_ids
+    article_id: Optional[str] = None
+    summary: Optional[str] = None  # the fallback summary when error is set
+    cache_tier: Optional[str] = None  # "memory" or "database" on a hit
+    engine: Optional[str] = None  # "llm" or "extractive"
+    error: Optional[str] = None
+
+class BatchSummaryResponse(BaseModel):
+    results: List[BatchSummaryResult]
+    unique: int
+    hits: int
+    generated: int
+    errors: int
+
 class TrendingTopic(BaseModel):
     name: str
     count: int
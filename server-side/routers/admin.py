@@ -0,0 +1,57 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from config import settings
+from database import database, read_router
+from services.partition_service import partition_service
+from services.query_log import query_log
+
+async def require_admin_token(x_admin_token: str = Header(None)):
+    """Hide the admin API unless it's enabled, and require its token"""
+    if not settings.ADMIN_API_ENABLED or not settings.ADMIN_API_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.ADMIN_API_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+router = APIRouter(prefix="/api/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+@router.get("/database")
+async def get_database_stats():
+    """Get connection pool, read replica routing and health stats"""
+    return {
+        "pool": database.get_pool_stats(),
+        "replicas": read_router.get_stats()
+    }
+
+@router.get("/partitions")
+async def get_partition_stats():
+    """Get article partitions and retention job status"""
+    return await partition_service.get_stats()
+
+@router.get("/queries")
+async def get_query_stats(
+    sort: str = Query("total_ms", description="total_ms, mean_ms, p95_ms, max_ms, calls or slow_calls"),
+    limit: int = Query(20, ge=1, le=500, description="Fingerprints to return")
+):
+    """Get per-statement timing, row counts and latency histograms"""
+    if sort not in ("total_ms", "mean_ms", "p95_ms", "max_ms", "calls", "slow_calls"):
+        raise HTTPException(status_code=400, detail=f"Unknown sort: {sort}")
+    return {
+        "summary": query_log.get_stats(),
+        "queries": query_log.top(sort, limit)
+    }
+
+@router.get("/queries/slow")
+async def get_slow_queries(limit: int = Query(50, ge=1, le=500, description="Slow queries to return")):
+    """Get the most recent slow queries with their EXPLAIN plans"""
+    return {
+        "threshold_ms": query_log.threshold_ms,
+        "slow_queries": query_log.recent_slow(limit)
+    }
+
+@router.delete("/queries")
+async def reset_query_stats():
+    """Clear query stats and the recent slow-query list"""
+    query_log.reset()
+    return {"message": "Query stats reset"}
@@ -1,23 +1,162 @@
-from fastapi import APIRouter, HTTPException
-from models import SummaryRequest, SummaryResponse
-from services.ai_service import ai_service
+import json
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from config import settings
+from models import BatchSummaryRequest, BatchSummaryResponse, BatchSummaryResult, SummaryRequest, SummaryResponse
+from services.ai_service import ENGINE_EXTRACTIVE, ENGINE_LLM, ai_service
+from services.content_hash import content_hash
+from services.database_service import db_service
+from services.summary_pipeline import summary_pipeline
+from services.summary_store import summary_store
 
 router = APIRouter(prefix="/api/ai", tags=["ai"])
 
 @router.post("/summarize", response_model=SummaryResponse)
-async def summarize_article(request: SummaryRequest):
+async def summarize_article(request: SummaryRequest, response: Response):
     """Generate AI summary for an article"""
     try:
         if not request.title or not request.content:
             raise HTTPException(status_code=400, detail="Title and content are required")
         
-        summary = await ai_service.generate_summary(request.title, request.content)
+        # Syndicated copies of a story share one stored summary
+        summary, tier, engine = await summary_store.summarize(
+            request.title, request.content, request.article_id, request.latency_budget_ms
+        )
+        response.headers["X-Cache"] = "HIT" if tier else "MISS"
+        response.headers["X-Summary-Engine"] = engine
+        if tier:
+            response.headers["X-Cache-Tier"] = tier
         
         return SummaryResponse(summary=summary)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating summary: {str(e)}")
 
+def _sse(event: str, data: dict) -> str:
+    """One Server-Sent Events frame with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@router.post("/summarize/stream")
+async def stream_summary(request: SummaryRequest, http_request: Request):
+    """Stream an AI summary as Server-Sent Events: chunk frames, then done (or error)"""
+    if not request.title or not request.content:
+        raise HTTPException(status_code=400, detail="Title and content are required")
+    
+    key, cached, tier = await summary_store.lookup(request.title, request.content, request.article_id)
+    engine = ENGINE_LLM
+    if cached is None and ai_service.choose_engine(request.latency_budget_ms) == ENGINE_EXTRACTIVE:
+        cached, engine = ai_service.generate_extractive_summary(request.title, request.content), ENGINE_EXTRACTIVE
+    
+    async def events():
+        if cached is not None:
+            yield _sse("done", {"summary": cached, "cache_tier": tier, "engine": engine})
+            return
+        
+        parts = []
+        chunks = summary_store.stream(key, request.title, request.content, request.article_id)
+        try:
+            async for chunk in chunks:
+                if await http_request.is_disconnected():
+                    # Closing the generator cancels the model call
+                    return
+                parts.append(chunk)
+                yield _sse("chunk", {"text": chunk})
+        except Exception as e:
+            fallback = ai_service.generate_extractive_summary(request.title, request.content)
+            yield _sse("error", {"error": str(e) or type(e).__name__, "summary": fallback, "engine": ENGINE_EXTRACTIVE})
+            return
+        finally:
+            await chunks.aclose()
+        yield _sse("done", {"summary": "".join(parts), "cache_tier": None, "engine": ENGINE_LLM})
+    
+    headers = {
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+        "X-Cache": "HIT" if tier else "MISS",
+        "X-Summary-Engine": engine,
+    }
+    if tier:
+        headers["X-Cache-Tier"] = tier
+    return StreamingResponse(events(), media_type="text/event-stream", headers=headers)
+
+@router.post("/summarize/batch", response_model=BatchSummaryResponse)
+async def summarize_articles(request: BatchSummaryRequest):
+    """Generate AI summaries for many articles in one round trip"""
+    total = len(request.items) + len(request.article_ids)
+    if total == 0:
+        raise HTTPException(status_code=400, detail="items or article_ids are required")
+    if total > settings.SUMMARY_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {settings.SUMMARY_BATCH_MAX_ITEMS} summaries per batch"
+        )
+    
+    try:
+        results = [None] * total
+        entries = []
+        positions = []
+        for index, item in enumerate(request.items):
+            if not item.title or not item.content:
+                results[index] = BatchSummaryResult(
+                    index=index, article_id=item.article_id, error="Title and content are required"
+                )
+                continue
+            entries.append({
+                "title": item.title,
+                "content": item.content,
+                "article_id": item.article_id,
+                "latency_budget_ms": item.latency_budget_ms,
+            })
+            positions.append(index)
+        
+        articles = await db_service.get_articles_for_summary(list(dict.fromkeys(request.article_ids)))
+        for offset, article_id in enumerate(request.article_ids):
+            index = len(request.items) + offset
+            article = articles.get(article_id)
+            if article is None:
+                results[index] = BatchSummaryResult(index=index, article_id=article_id, error="Article not found")
+                continue
+            entries.append({**article, "article_id": article_id})
+            positions.append(index)
+        
+        # Cache hits come back straight away; misses share a bounded number of model calls
+        summaries = await summary_store.summarize_many(entries, latency_budget_ms=request.latency_budget_ms)
+        for index, entry, summary in zip(positions, entries, summaries):
+            results[index] = BatchSummaryResult(
+                index=index,
+                article_id=entry["article_id"],
+                summary=summary["summary"],
+                cache_tier=summary["tier"],
+                engine=summary["engine"],
+                error=summary["error"],
+            )
+        
+        return BatchSummaryResponse(
+            results=results,
+            unique=len({content_hash(entry["title"], entry["content"]) for entry in entries}),
+            hits=sum(1 for result in results if result.cache_tier),
+            generated=sum(1 for result in results if result.engine and not result.cache_tier and not result.error),
+            errors=sum(1 for result in results if result.error),
+        )
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating summaries: {str(e)}")
+
+@router.get("/stats")
+async def get_ai_stats():
+    """Get Gemini call counters, concurrency and timeouts"""
+    return ai_service.get_stats()
+
+@router.get("/summaries/stats")
+async def get_summary_store_stats():
+    """Get summary store hit ratio and model calls saved"""
+    return summary_store.get_stats()
+
+@router.get("/summaries/queue")
+async def get_summary_queue_stats():
+    """Get background summarization queue depth and throughput"""
+    return await summary_pipeline.get_stats()
+
 @router.post("/analyze-sentiment")
 async def analyze_sentiment(text: str):
     """Analyze sentiment of text (placeholder for future feature)"""
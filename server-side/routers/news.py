@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Path, Query, Request, Response
 from typing import List, Optional
-from sqlalchemy.orm import Session
-
-from database import get_db
-from models import Article, ArticleFilter, NewsStats, TrendingTopic
+from models import Article, ArticleFilter, NewsStats, TrendingTopic, dump_articles_json, resolve_article_fields
 from services.news_service import news_service
 from services.ai_service import ai_service
+from services.cache import article_cache
+from services.database_service import db_service, encode_cursor, decode_cursor
+from services.ingestion_service import ingestion_service
+from services.interaction_buffer import interaction_buffer
 
 router = APIRouter(prefix="/api/news", tags=["news"])
 
+# Article ids are UUIDs; anything else would be refused by the String(36) columns when the buffer flushes
+ARTICLE_ID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
 @router.get("/articles", response_model=List[Article])
 async def get_articles(
     region: Optional[str] = Query("Global", description="Region filter"),
@@ -18,9 +22,17 @@ async def get_articles(
     search_query: Optional[str] = Query(None, description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Articles per page"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor; overrides page"),
+    fields: Optional[str] = Query(None, description="Field set (detail, card, headline) or comma-separated fields")
 ):
     """Get filtered news articles"""
+    try:
+        if cursor:
+            decode_cursor(cursor)
+        projection = resolve_article_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         filters = ArticleFilter(
             region=region,
@@ -29,11 +41,24 @@ async def get_articles(
             date_range=date_range,
             search_query=search_query,
             page=page,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            fields=fields
         )
         
         articles = await news_service.fetch_news(filters)
-        return articles
+        
+        # Articles are validated on the way into RDS, so skip response_model re-validation
+        # and serialize straight to JSON bytes (only the requested fields for projections)
+        response = Response(content=dump_articles_json(articles, projection), media_type="application/json")
+        
+        # A full page means there may be more; hand back a cursor to seek past it.
+        # Search pages are relevance-ranked, so they keep paging by page number.
+        if len(articles) == limit and not search_query:
+            last = articles[-1]
+            response.headers["X-Next-Cursor"] = encode_cursor(last.published_at, last.id)
+        
+        return response
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching articles: {str(e)}")
@@ -42,7 +67,20 @@ async def get_articles(
 async def get_trending_topics():
     """Get trending topics"""
     try:
-        # Fetch recent articles to analyze trends
+        # Read the statistics rollup maintained as articles and interactions are written
+        trending_topics = await db_service.get_trending_topics()
+        if trending_topics:
+            return [
+                TrendingTopic(
+                    name=topic["name"],
+                    count=topic["count"],
+                    trend_type=topic["trend_type"],
+                    emoji=topic["emoji"]
+                )
+                for topic in trending_topics
+            ]
+        
+        # Nothing in RDS yet: fall back to analyzing recent articles
         filters = ArticleFilter(limit=100)
         articles = await news_service.fetch_news(filters)
         
@@ -77,21 +115,24 @@ async def get_trending_topics():
 async def get_news_stats():
     """Get news statistics"""
     try:
-        # Fetch articles for stats
-        filters = ArticleFilter(limit=100)
-        articles = await news_service.fetch_news(filters)
-        
-        # Calculate statistics
-        total_articles = len(articles)
-        articles_by_topic = {}
-        articles_by_source = {}
+        # Read the statistics rollup maintained as articles are written
+        stats = await db_service.get_statistics()
+        total_articles = stats["total_articles"]
+        articles_by_topic = stats["articles_by_topic"]
+        articles_by_source = stats["articles_by_source"]
         
-        for article in articles:
-            topic = article.topic.value
-            source = article.source.name
+        # Nothing in RDS yet: fall back to counting recent articles
+        if not total_articles:
+            filters = ArticleFilter(limit=100)
+            articles = await news_service.fetch_news(filters)
             
-            articles_by_topic[topic] = articles_by_topic.get(topic, 0) + 1
-            articles_by_source[source] = articles_by_source.get(source, 0) + 1
+            total_articles = len(articles)
+            for article in articles:
+                topic = article.topic.value
+                source = article.source.name
+                
+                articles_by_topic[topic] = articles_by_topic.get(topic, 0) + 1
+                articles_by_source[source] = articles_by_source.get(source, 0) + 1
         
         # Get trending topics
         trending_response = await get_trending_topics()
@@ -106,6 +147,20 @@ async def get_news_stats():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching stats: {str(e)}")
 
+@router.get("/ingestion/stats")
+async def get_ingestion_stats():
+    """Get background ingestion scheduler stats"""
+    return ingestion_service.get_stats()
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """Get response cache and request coalescing stats for article fetches"""
+    return {
+        "cache": article_cache.get_stats(),
+        "stale_while_revalidate": news_service.get_swr_stats(),
+        "single_flight": news_service.single_flight.get_stats()
+    }
+
 @router.get("/sources")
 async def get_news_sources():
     """Get available news sources"""
@@ -121,14 +176,21 @@ async def get_news_sources():
     ]
     return sources
 
+@router.get("/interactions/stats")
+async def get_interaction_stats():
+    """Get write-behind interaction buffer stats"""
+    return interaction_buffer.get_stats()
+
 @router.post("/articles/{article_id}/view")
-async def increment_view_count(article_id: str):
+async def increment_view_count(request: Request, article_id: str = Path(..., pattern=ARTICLE_ID_PATTERN)):
     """Increment view count for an article"""
-    # In a real implementation, you'd update the database
+    # Buffered and written to RDS in batches
+    interaction_buffer.record(article_id, "view", request.client.host if request.client else None)
     return {"message": "View count incremented", "article_id": article_id}
 
 @router.post("/articles/{article_id}/like")
-async def toggle_like(article_id: str):
+async def toggle_like(request: Request, article_id: str = Path(..., pattern=ARTICLE_ID_PATTERN)):
     """Toggle like status for an article"""
-    # In a real implementation, you'd update the database
+    # Buffered and written to RDS in batches
+    interaction_buffer.record(article_id, "like", request.client.host if request.client else None)
     return {"message": "Like toggled", "article_id": article_id}
@@ -1,21 +1,23 @@
 import openai
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List, Optional, Tuple
 import asyncio
+import os
+import math
+import re
 import requests
+import time
 from config import settings
+from services.extractive_summarizer import extractive_summarizer
 from google import genai
 from google.genai import types
 
 
-class AIService:
-    def __init__(self):
-        self.max_length = settings.MAX_SUMMARY_LENGTH
+# Bump whenever the prompt changes so stored summaries from the old prompt aren't reused
+SUMMARY_PROMPT_VERSION = "2"
 
-    async def generate_summary(self, title: str, content: str) -> str:
-        """Generate AI summary for an article"""
-        try:
-            # Create a more engaging prompt
-            prompt = f"""
+SUMMARY_PROMPT = """
             You are a professional news summarizer with a vibrant personality. 
             Create a concise, informative summary that captures the key points of this news article in 1-3 sentences. 
             Focus on the most important facts and implications while maintaining an engaging tone.
@@ -25,39 +27,505 @@ class AIService:
 
             Provide a clear, concise summary that captures the essential information and significance of this news story. 
             Make it engaging and informative!
+            {length_instruction}
+            """
+
+# Map step for long articles: condense one chunk into notes for the reduce step
+CHUNK_PROMPT = """
+            You are condensing part {part} of {parts} of a long news article so it can be summarized as a whole.
+            List the key facts, figures, names and developments in this part in at most {max_words} words.
+            Reply with plain sentences only, no headings or commentary.
+
+            Title: {title}
+            Part {part} of {parts}:
+            {content}
             """
-    
-            client = genai.Client(api_key=settings.GEMINI_API_KEY)
 
-            response = client.models.generate_content(
-                model="gemini-2.5-pro",
-                contents=prompt
+# Reduce step: the final summary from every chunk's notes, in the same voice as SUMMARY_PROMPT
+REDUCE_PROMPT = """
+            You are a professional news summarizer with a vibrant personality. 
+            Below are notes on consecutive parts of one long news article. 
+            Create a concise, informative summary of the whole article in 1-3 sentences. 
+            Focus on the most important facts and implications while maintaining an engaging tone.
+
+            Title: {title}
+            {notes}
+
+            Provide a clear, concise summary that captures the essential information and significance of this news story. 
+            Make it engaging and informative!
+            {length_instruction}
+            """
+
+# Summary engines, and the request priority that may be served extractively
+ENGINE_LLM = "llm"
+ENGINE_EXTRACTIVE = "extractive"
+PRIORITY_LOW = "low"
+
+# Calls measured before their p95 replaces LLM_EXPECTED_LATENCY_MS
+MIN_LATENCY_SAMPLES = 20
+
+# Rough size estimate for English prose; only used to decide when to chunk
+CHARS_PER_TOKEN = 4
+
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count without a tokenizer round trip"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+def split_into_chunks(text: str, max_tokens: int) -> List[str]:
+    """Split text into chunks of at most max_tokens, breaking between paragraphs or sentences"""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    pieces = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        for sentence in SENTENCE_BOUNDARY.split(paragraph.strip()):
+            # A single overlong sentence is broken between words
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(" ", 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                pieces.append(sentence[:cut])
+                sentence = sentence[cut:].lstrip()
+            if sentence:
+                pieces.append(sentence)
+
+    chunks = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+# Upper bounds of the per-model latency histogram in milliseconds; the last bucket is open-ended
+MODEL_LATENCY_BUCKETS_MS = [250, 500, 1000, 2000, 3000, 5000, 8000, 13000, 20000, 30000, float("inf")]
+
+def parse_model_tiers(spec: str) -> List[Tuple[str, float]]:
+    """[(model, timeout_seconds), ...] from "model:timeout,model:timeout", fastest first"""
+    tiers = []
+    for entry in spec.split(","):
+        model, _, timeout = entry.strip().partition(":")
+        if model:
+            tiers.append((model, float(timeout) if timeout else settings.GEMINI_TIMEOUT_SECONDS))
+    return tiers
+
+class ModelLatency:
+    """Latency histogram and outcome counts for one model"""
+
+    def __init__(self):
+        self.histogram = [0] * len(MODEL_LATENCY_BUCKETS_MS)
+        self.samples = deque(maxlen=500)
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.cancelled = 0
+
+    def record(self, elapsed_ms: float):
+        self.samples.append(elapsed_ms)
+        for i, bound in enumerate(MODEL_LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.histogram[i] += 1
+                break
+
+    def percentile_ms(self, fraction: float) -> Optional[float]:
+        """Percentile of recent successful calls; None until MIN_LATENCY_SAMPLES are measured"""
+        if len(self.samples) < MIN_LATENCY_SAMPLES:
+            return None
+        samples = sorted(self.samples)
+        return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+    def as_dict(self) -> dict:
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return round(value, 1) if value is not None else None
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "p50_ms": rounded(self.percentile_ms(0.5)),
+            "p95_ms": rounded(self.percentile_ms(0.95)),
+            "p99_ms": rounded(self.percentile_ms(0.99)),
+            "histogram_ms": {
+                ("inf" if bound == float("inf") else str(bound)): count
+                for bound, count in zip(MODEL_LATENCY_BUCKETS_MS, self.histogram)
+            },
+        }
+
+
+class AIService:
+    def __init__(self):
+        self.max_length = settings.MAX_SUMMARY_LENGTH
+        self.tiers = parse_model_tiers(settings.GEMINI_MODEL_TIERS)
+        # Names the tier policy in summary cache keys: any tier may have written a summary
+        self.model = ">".join(model for model, _ in self.tiers)[:100]
+        self.prompt_version = SUMMARY_PROMPT_VERSION
+        self.timeout_seconds = max(timeout for _, timeout in self.tiers)
+        self.deadline_seconds = settings.SUMMARY_DEADLINE_SECONDS
+        self._client: Optional[genai.Client] = None
+        # Caps concurrent Gemini calls per worker; the rest queue here
+        self._semaphore = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+        self.latency = {model: ModelLatency() for model, _ in self.tiers}
+        self.waiting = 0
+        self.in_flight = 0
+        self.calls = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.escalations = 0
+        self.deadline_exceeded = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.streams = 0
+        self.streams_cancelled = 0
+        self.map_reduce_summaries = 0
+        self.chunks_summarized = 0
+        self.chunks_dropped = 0
+        self.consecutive_failures = 0
+        self.degraded_until = 0.0
+        self.extractive_summaries = 0
+        self.routed_extractive = {"latency_budget": 0, "degraded": 0, "low_priority": 0}
+
+    @property
+    def client(self) -> genai.Client:
+        """One Gemini client per worker, so its HTTP connections are reused"""
+        if self._client is None:
+            http_options = {"timeout": int(self.timeout_seconds * 1000)}
+            if settings.GEMINI_BASE_URL:
+                http_options["base_url"] = settings.GEMINI_BASE_URL
+            self._client = genai.Client(api_key=settings.GEMINI_API_KEY, http_options=http_options)
+        return self._client
+
+    def start(self):
+        """Size the event loop's default thread pool, which runs the SDK's blocking HTTP calls"""
+        # A cancelled call (a hedge's loser, a timed-out tier) keeps its thread until its HTTP
+        # request ends, so the pool leaves room for them beside the calls holding semaphore slots
+        workers = min(32, (os.cpu_count() or 1) + 4) + 2 * settings.GEMINI_MAX_CONCURRENCY
+        # The SDK's async client runs its calls with asyncio.to_thread, so this has to be the
+        # loop's default pool; the loop shuts it down when it closes
+        loop = asyncio.get_running_loop()
+        previous = getattr(loop, "_default_executor", None)
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=workers))
+        if previous is not None:
+            # Work already submitted to the replaced pool finishes, then its threads exit
+            previous.shutdown(wait=False)
+
+    async def close(self):
+        """Release the Gemini client's connections"""
+        if self._client is not None:
+            aclose = getattr(self._client.aio, "aclose", None)
+            if aclose:
+                await aclose()
+            self._client = None
+
+    async def _acquire(self, timeout: Optional[float] = None):
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout)
+        finally:
+            self.waiting -= 1
+        self.in_flight += 1
+
+    def _release(self):
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    async def _call_model(self, model: str, prompt: str, deadline: float) -> str:
+        """One Gemini call on the async API, within the semaphore; queueing and the call share the deadline"""
+        loop = asyncio.get_running_loop()
+        stats = self.latency[model]
+        try:
+            await self._acquire(max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            stats.timeouts += 1
+            raise
+        self.calls += 1
+        stats.calls += 1
+        start = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(
+                self.client.aio.models.generate_content(model=model, contents=prompt),
+                timeout=max(deadline - loop.time(), 0)
             )
+            stats.record((time.perf_counter() - start) * 1000)
+            return response.text or ""
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            stats.timeouts += 1
+            raise
+        except asyncio.CancelledError:
+            # The other half of a hedged pair answered first
+            stats.cancelled += 1
+            raise
+        except Exception:
+            self.errors += 1
+            stats.errors += 1
+            raise
+        finally:
+            self._release()
 
+    def _hedge_delay(self, model: str) -> Optional[float]:
+        """Seconds to wait before hedging a call to this model; None when hedging is off or p95 unknown"""
+        if not settings.GEMINI_HEDGE_ENABLED:
+            return None
+        p95 = self.latency[model].percentile_ms(0.95)
+        if p95 is None:
+            return None
+        return max(p95, settings.GEMINI_HEDGE_MIN_DELAY_MS) / 1000
 
-            summary = response.text
-            
-            # Ensure summary isn't too long
-            if len(summary) > self.max_length:
-                summary = summary[:self.max_length] + "..."
+    async def _hedged_call(self, model: str, prompt: str, deadline: float) -> str:
+        """Call a model, and if it is slower than its p95, race a second identical call; the loser is cancelled"""
+        loop = asyncio.get_running_loop()
+        primary = asyncio.create_task(self._call_model(model, prompt, deadline))
+        delay = self._hedge_delay(model)
+        if delay is None or loop.time() + delay >= deadline:
+            return await primary
+
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            self.hedges += 1
+            hedge = asyncio.create_task(self._call_model(model, prompt, deadline))
+            pending.add(hedge)
+            failure = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.hedge_wins += int(task is hedge)
+                        return task.result()
+                    failure = failure or task.exception()
+            raise failure
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _generate_content(self, prompt: str, deadline: float) -> str:
+        """Try each model tier in turn within the request deadline; escalate on error, timeout or empty output"""
+        loop = asyncio.get_running_loop()
+        failure: Exception = asyncio.TimeoutError()
+        for tier, (model, timeout) in enumerate(self.tiers):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self.deadline_exceeded += 1
+                break
+            if tier:
+                self.escalations += 1
+            try:
+                text = await self._hedged_call(model, prompt, loop.time() + min(timeout, remaining))
+            except Exception as e:
+                failure = e
+                continue
+            if text.strip():
+                return text
+            failure = ValueError(f"{model} returned an empty response")
+        raise failure
+
+    async def _stream_content(self, prompt: str, deadline: float) -> AsyncIterator[str]:
+        """Text chunks from a streaming Gemini call; escalates to the next tier only before the first chunk"""
+        loop = asyncio.get_running_loop()
+        await self._acquire(max(deadline - loop.time(), 0))
+        self.streams += 1
+        try:
+            for tier, (model, timeout) in enumerate(self.tiers):
+                last_tier = tier == len(self.tiers) - 1
+                call_deadline = min(deadline, loop.time() + timeout)
+                self.calls += 1
+                self.latency[model].calls += 1
+                if tier:
+                    self.escalations += 1
+                # The pinned SDK's async stream reads the HTTP response on the event loop, so the
+                # blocking stream is read in a worker thread instead
+                stream = self.client.models.generate_content_stream(model=model, contents=prompt)
+                reading = None
+                sent = False
+                try:
+                    while True:
+                        reading = loop.run_in_executor(None, next, stream, None)
+                        chunk = await asyncio.wait_for(
+                            asyncio.shield(reading), timeout=max(call_deadline - loop.time(), 0)
+                        )
+                        reading = None
+                        if chunk is None:
+                            if not sent:
+                                # Nothing has reached the reader yet, so the next tier can still answer
+                                raise ValueError(f"{model} returned an empty response")
+                            self.consecutive_failures = 0
+                            return
+                        if chunk.text:
+                            sent = sent or bool(chunk.text.strip())
+                            yield chunk.text
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    self.latency[model].timeouts += 1
+                    if sent or last_tier:
+                        self._record_failure()
+                        raise
+                except (asyncio.CancelledError, GeneratorExit):
+                    # Closed early because the reader went away; closing the stream stops the model too
+                    self.streams_cancelled += 1
+                    self.latency[model].cancelled += 1
+                    raise
+                except Exception:
+                    self.errors += 1
+                    self.latency[model].errors += 1
+                    if sent or last_tier:
+                        self._record_failure()
+                        raise
+                finally:
+                    # A generator can't be closed mid-read; close it once the pending read returns
+                    if reading is not None and not reading.done():
+                        reading.add_done_callback(lambda _, stream=stream: stream.close())
+                    else:
+                        stream.close()
+        finally:
+            self._release()
+
+    def _record_failure(self):
+        """Enough failed requests in a row mark the model degraded for a cooldown; the next call after it probes again"""
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= settings.LLM_DEGRADED_AFTER_FAILURES:
+            self.degraded_until = time.monotonic() + settings.LLM_DEGRADED_COOLDOWN_SECONDS
+
+    def is_degraded(self) -> bool:
+        return time.monotonic() < self.degraded_until
+
+    def expected_latency_ms(self) -> float:
+        """p95 of the first tier's recent calls, or the configured estimate until enough are measured"""
+        p95 = self.latency[self.tiers[0][0]].percentile_ms(0.95)
+        return p95 if p95 is not None else float(settings.LLM_EXPECTED_LATENCY_MS)
+
+    def choose_engine(self, latency_budget_ms: Optional[float] = None, priority: Optional[str] = None) -> str:
+        """Extractive when the budget can't fit a model call, the model is degraded, or the request is low priority"""
+        if latency_budget_ms is not None and latency_budget_ms < self.expected_latency_ms():
+            self.routed_extractive["latency_budget"] += 1
+            return ENGINE_EXTRACTIVE
+        if self.is_degraded():
+            self.routed_extractive["degraded"] += 1
+            return ENGINE_EXTRACTIVE
+        if priority == PRIORITY_LOW and settings.SUMMARY_LOW_PRIORITY_ENGINE == ENGINE_EXTRACTIVE:
+            self.routed_extractive["low_priority"] += 1
+            return ENGINE_EXTRACTIVE
+        return ENGINE_LLM
+
+    def generate_extractive_summary(self, title: str, content: str) -> str:
+        """Local TextRank/centroid summary; milliseconds on CPU, no model call"""
+        self.extractive_summaries += 1
+        return extractive_summarizer.summarize(title, content)
+
+    def generate_extractive_summaries(self, articles: List[dict]) -> List[str]:
+        """Local summaries for a batch of {title, content} articles, scored together"""
+        self.extractive_summaries += len(articles)
+        return extractive_summarizer.summarize_many(articles)
+
+    def _length_instruction(self) -> str:
+        return (
+            f"Keep the summary under {self.max_length} characters (about {self.max_length // 6} words) "
+            "and end on a complete sentence."
+        )
+
+    async def _summary_prompt(self, title: str, content: str, deadline: float) -> str:
+        """Prompt for the final summary; long content is condensed chunk by chunk first, within the same deadline"""
+        if estimate_tokens(title) + estimate_tokens(content) <= settings.SUMMARY_INPUT_TOKEN_BUDGET:
+            return SUMMARY_PROMPT.format(title=title, content=content, length_instruction=self._length_instruction())
+
+        chunks = split_into_chunks(content, settings.SUMMARY_CHUNK_TOKENS)
+        if len(chunks) > settings.SUMMARY_MAX_CHUNKS:
+            # Bounds cost and latency on huge inputs; the lede carries the story
+            self.chunks_dropped += len(chunks) - settings.SUMMARY_MAX_CHUNKS
+            chunks = chunks[:settings.SUMMARY_MAX_CHUNKS]
+
+        # Map: chunks are condensed in parallel, within the concurrency semaphore; the first
+        # failure cancels the rest so they don't hold semaphore slots for a doomed request
+        max_words = max(self.max_length // 6 * 2, 40)
+        tasks = [
+            asyncio.create_task(self._generate_content(CHUNK_PROMPT.format(
+                title=title, part=i + 1, parts=len(chunks), content=chunk, max_words=max_words
+            ), deadline))
+            for i, chunk in enumerate(chunks)
+        ]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            failure = None
+            for task in done:
+                failure = failure or task.exception()
+            if failure:
+                raise failure
+        finally:
+            for task in tasks:
+                task.cancel()
+        notes = [task.result() for task in tasks]
+        self.map_reduce_summaries += 1
+        self.chunks_summarized += len(chunks)
+
+        # Reduce: one final summary over every chunk's notes
+        return REDUCE_PROMPT.format(
+            title=title,
+            notes="\n".join(f"Part {i + 1} notes: {note.strip()}" for i, note in enumerate(notes)),
+            length_instruction=self._length_instruction(),
+        )
+
+    async def stream_summary(self, title: str, content: str) -> AsyncIterator[str]:
+        """Summary text as the model produces it; for long content only the reduce step streams"""
+        deadline = asyncio.get_running_loop().time() + self.deadline_seconds
+        try:
+            prompt = await self._summary_prompt(title, content, deadline)
+        except Exception:
+            self._record_failure()
+            raise
+        chunks = self._stream_content(prompt, deadline)
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    async def generate_summary(
+        self,
+        title: str,
+        content: str,
+        fallback: bool = True,
+        latency_budget_ms: Optional[float] = None,
+        priority: Optional[str] = None,
+    ) -> str:
+        """Generate AI summary for an article; with fallback=False, model errors are raised"""
+        if self.choose_engine(latency_budget_ms, priority) == ENGINE_EXTRACTIVE:
+            if not fallback and self.is_degraded():
+                # Callers that cache model output must not receive an extractive summary as one
+                raise RuntimeError("Model degraded")
+            return self.generate_extractive_summary(title, content)
+
+        try:
+            # One deadline covers the whole request: every map chunk, the reduce step and all tiers
+            deadline = asyncio.get_running_loop().time() + self.deadline_seconds
+            prompt = await self._summary_prompt(title, content, deadline)
+
+            # Awaits the async API, so the event loop keeps serving other requests meanwhile
+            summary = await self._generate_content(prompt, deadline)
+            self.consecutive_failures = 0
             
-            return summary
+            # Length is asked for in the prompt; slicing would cut the summary mid-sentence
+            return summary.strip()
 
         except Exception as e:
+            # Counted once per request, however many chunk or tier calls failed
+            self._record_failure()
+            if not fallback:
+                raise
             print(f"Error generating summary: {e}")
             # Return a fallback summary
             return self._generate_fallback_summary(title, content)
 
     def _generate_fallback_summary(self, title: str, content: str) -> str:
-        """Generate a simple fallback summary when AI fails"""
-        # Simple extractive summary - take first sentence or two
-        sentences = content.split('. ')
-        if len(sentences) >= 2:
-            return f"{sentences[0]}. {sentences[1]}."
-        elif len(sentences) == 1:
-            return sentences[0]
-        else:
-            return "This article discusses important developments in the news."
+        """Generate a fallback summary when AI fails"""
+        return self.generate_extractive_summary(title, content)
 
     async def generate_trending_insights(self, articles: list) -> dict:
         """Generate insights about trending topics"""
@@ -96,5 +564,37 @@ class AIService:
             print(f"Error generating trending insights: {e}")
             return {"trending_topics": []}
 
+    def get_stats(self) -> dict:
+        """Gemini call counters, tiering, hedging and per-model latency"""
+        return {
+            "model": self.model,
+            "tiers": [{"model": model, "timeout_seconds": timeout} for model, timeout in self.tiers],
+            "deadline_seconds": self.deadline_seconds,
+            "max_concurrency": settings.GEMINI_MAX_CONCURRENCY,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "escalations": self.escalations,
+            "deadline_exceeded": self.deadline_exceeded,
+            "hedging": {
+                "enabled": settings.GEMINI_HEDGE_ENABLED,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+            },
+            "streams": self.streams,
+            "streams_cancelled": self.streams_cancelled,
+            "map_reduce_summaries": self.map_reduce_summaries,
+            "chunks_summarized": self.chunks_summarized,
+            "chunks_dropped": self.chunks_dropped,
+            "expected_latency_ms": round(self.expected_latency_ms(), 1),
+            "degraded": self.is_degraded(),
+            "consecutive_failures": self.consecutive_failures,
+            "extractive_summaries": self.extractive_summaries,
+            "routed_extractive": self.routed_extractive,
+            "models": {model: stats.as_dict() for model, stats in self.latency.items()},
+        }
+
 # Global instance
 ai_service = AIService()
@@ -0,0 +1,149 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from config import settings
+
+class TTLCache:
+    """Bounded in-process cache with TTL expiry and LRU eviction by count and size"""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        max_bytes: int,
+        sizeof: Callable[[Any], int] = lambda value: len(repr(value)),
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        # key -> (value, stored_at, size); ordered from least to most recently used
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = Lock()
+        self.current_bytes = 0
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.stale_marks = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expired entry"""
+        value, _ = self.get_with_age(key)
+        return value
+
+    def get_with_age(self, key: Hashable) -> Tuple[Optional[Any], Optional[float]]:
+        """Return (value, age in seconds), or (None, None) on a miss or expired entry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, None
+
+            value, stored_at, _ = entry
+            age = time.monotonic() - stored_at
+            if age > self.ttl_seconds:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value, age
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None, stale_age: Optional[float] = None):
+        """Store a value; one computed before the last invalidation is dropped, or stored stale_age old if given"""
+        size = self.sizeof(value)
+        with self._lock:
+            stored_at = time.monotonic()
+            if generation is not None and generation != self.generation:
+                if stale_age is None:
+                    return
+                stored_at -= stale_age
+            if size > self.max_bytes:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, stored_at, size)
+            self.current_bytes += size
+
+            while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one key, or everything when no key is given"""
+        with self._lock:
+            self.invalidations += 1
+            if key is None:
+                self._entries.clear()
+                self.current_bytes = 0
+                self.generation += 1
+            elif key in self._entries:
+                self._remove(key)
+
+    def mark_stale(self, age: float):
+        """Age every entry to at least age seconds instead of dropping it, e.g. so it is served stale and revalidated"""
+        with self._lock:
+            self.stale_marks += 1
+            self.generation += 1
+            oldest_allowed = time.monotonic() - age
+            for key, (value, stored_at, size) in self._entries.items():
+                self._entries[key] = (value, min(stored_at, oldest_allowed), size)
+
+    def _remove(self, key: Hashable):
+        _, _, size = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def get_stats(self) -> dict:
+        """Hit/miss/eviction metrics and current occupancy"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "stale_marks": self.stale_marks,
+        }
+
+def _articles_size(articles: list) -> int:
+    """Approximate in-memory footprint of a list of Article models"""
+    size = 0
+    for article in articles:
+        # Projected articles only carry some of their fields
+        for field in ("title", "original_excerpt", "summary", "url", "image_url"):
+            size += len(str(getattr(article, field, None) or ""))
+        size += 256
+    return size
+
+# Global instance for generated summaries, keyed by (content_hash, model, prompt_version);
+# the summaries table behind it is the persistent tier
+summary_cache = TTLCache(
+    ttl_seconds=settings.SUMMARY_CACHE_TTL_SECONDS,
+    max_entries=settings.SUMMARY_CACHE_MAX_ENTRIES,
+    max_bytes=settings.SUMMARY_CACHE_MAX_BYTES,
+    sizeof=lambda summary: len(summary) + 64,
+)
+
+# Global instance for fetch_news results, keyed by ArticleFilter.cache_key().
+# With stale-while-revalidate on, entries live until the hard TTL.
+article_cache = TTLCache(
+    ttl_seconds=settings.SWR_HARD_TTL_SECONDS if settings.SWR_ENABLED else settings.CACHE_DURATION_MINUTES * 60,
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    max_bytes=settings.CACHE_MAX_BYTES,
+    sizeof=_articles_size,
+)
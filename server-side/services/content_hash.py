@@ -0,0 +1,18 @@
+import hashlib
+import re
+import unicodedata
+
+# NewsAPI truncates content and appends e.g. "… [+2345 chars]"
+TRUNCATION_MARKER = re.compile(r"\s*(…|\.\.\.)?\s*\[\+\d+ chars\]\s*$")
+WHITESPACE = re.compile(r"\s+")
+
+def normalize_text(text: str) -> str:
+    """Canonical form of article text, so syndicated copies compare equal"""
+    text = unicodedata.normalize("NFKC", text or "")
+    text = TRUNCATION_MARKER.sub("", text)
+    return WHITESPACE.sub(" ", text).strip().lower()
+
+def content_hash(title: str, content: str) -> str:
+    """SHA-256 of the normalized title and content"""
+    canonical = f"{normalize_text(title)}\n{normalize_text(content)}"
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -1,73 +1,333 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, func
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+import base64
+import json
 import logging
+import uuid
 
-from database import ArticleDB, UserInteractionDB, TrendingTopicDB, get_async_db
-from models import Article, NewsSource, TopicEnum, ArticleFilter
+from config import settings
+from database import ArticleDB, UserInteractionDB, TrendingTopicDB, get_async_db, read_router
+from models import Article, NewsSource, TopicEnum, ArticleFilter, ARTICLE_FIELD_SETS, resolve_article_fields
+from services.ai_service import ENGINE_EXTRACTIVE, ENGINE_LLM
+from services.cache import article_cache
+from services.content_hash import content_hash
 
 logger = logging.getLogger(__name__)
 
+ARTICLE_INSERT_COLUMNS = [
+    "id", "title", "source_name", "source_favicon", "source_color",
+    "original_excerpt", "published_at", "topic", "url", "image_url",
+    "view_count", "like_count", "region", "content_hash", "created_at", "updated_at"
+]
+
+# Columns refreshed when an already-stored url is upserted in "update" mode
+ARTICLE_UPDATE_COLUMNS = ["title", "original_excerpt", "image_url", "content_hash"]
+
+# Article columns that feed the statistics rollup
+ROLLUP_SOURCE_COLUMNS = ["published_at", "topic", "source_name", "region", "view_count", "like_count"]
+
+# Columns backing each Article response field
+ARTICLE_FIELD_COLUMNS = {
+    "id": ["id"],
+    "title": ["title"],
+    "source": ["source_name", "source_favicon", "source_color"],
+    "original_excerpt": ["original_excerpt"],
+    "summary": ["summary"],
+    "summary_engine": ["summary_engine"],
+    "published_at": ["published_at"],
+    "topic": ["topic"],
+    "url": ["url"],
+    "image_url": ["image_url"],
+    "is_loading_summary": [],
+    "view_count": ["view_count"],
+    "like_count": ["like_count"],
+}
+
+def projection_columns(fields: List[str]) -> List[str]:
+    """SQL columns for a projection; id and published_at are always kept for cursors"""
+    columns = ["id", "published_at"]
+    for field in fields:
+        for column in ARTICLE_FIELD_COLUMNS[field]:
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+# Rollup dimensions: (bucket_hour, topic, source_name, region)
+ROLLUP_KEY_COLUMNS = ["bucket_hour", "topic", "source_name", "region"]
+
+def to_naive_utc(value: datetime) -> datetime:
+    """published_at is stored as naive UTC"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def rollup_key(row) -> tuple:
+    """Rollup bucket for an article row"""
+    bucket_hour = to_naive_utc(row["published_at"]).replace(minute=0, second=0, microsecond=0)
+    return (bucket_hour, row["topic"], row["source_name"], row["region"] or "Global")
+
+def encode_cursor(published_at: datetime, article_id: str) -> str:
+    """Opaque keyset cursor pointing just past (published_at, id)"""
+    payload = json.dumps([published_at.isoformat(), article_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        published_at, article_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        published_at = datetime.fromisoformat(published_at)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    
+    return to_naive_utc(published_at), str(article_id)
+
 class DatabaseService:
     def __init__(self):
         self.db = None
+        # Read-only queries go through the replica router; writes use self.db (the primary)
+        self.reader = read_router
+        # Whether the full-text column/index exists; checked on first use
+        self.fulltext_search: Optional[bool] = None
+        # Decides the upsert conflict target; detected from the schema, not ARTICLE_PARTITIONING_ENABLED
+        self.articles_partitioned: Optional[bool] = None
     
     async def init_db(self):
-        """Initialize async database connection"""
+        """Connect lazily when used outside the app lifespan (scripts, benchmarks)"""
         self.db = await get_async_db()
+        if not self.db.is_connected:
+            await self.db.connect()
+        await self.reader.connect()
     
-    async def save_articles(self, articles: List[Article]) -> bool:
-        """Save articles to RDS database"""
+    async def save_articles(self, articles: List[Article], region: str = "Global") -> dict:
+        """Bulk upsert articles into RDS and return inserted/updated/skipped counts"""
+        counts = {"inserted": 0, "updated": 0, "skipped": 0}
         try:
             if not self.db:
                 await self.init_db()
             
+            # A statement can't touch the same url twice, so keep the first occurrence
+            unique_articles = {}
             for article in articles:
-                # Check if article already exists
-                existing_query = """
-                SELECT id FROM articles WHERE url = :url
-                """
-                existing = await self.db.fetch_one(existing_query, {"url": str(article.url)})
-                
-                if not existing:
-                    # Insert new article
-                    insert_query = """
-                    INSERT INTO articles (
-                        id, title, source_name, source_favicon, source_color,
-                        original_excerpt, published_at, topic, url, image_url,
-                        view_count, like_count, region
-                    ) VALUES (
-                        :id, :title, :source_name, :source_favicon, :source_color,
-                        :original_excerpt, :published_at, :topic, :url, :image_url,
-                        :view_count, :like_count, :region
-                    )
-                    """
-                    
-                    values = {
-                        "id": article.id,
-                        "title": article.title,
-                        "source_name": article.source.name,
-                        "source_favicon": article.source.favicon,
-                        "source_color": article.source.color,
-                        "original_excerpt": article.original_excerpt,
-                        "published_at": article.published_at,
-                        "topic": article.topic.value,
-                        "url": str(article.url),
-                        "image_url": str(article.image_url) if article.image_url else None,
-                        "view_count": article.view_count,
-                        "like_count": article.like_count,
-                        "region": "Global"
-                    }
-                    
-                    await self.db.execute(insert_query, values)
+                unique_articles.setdefault(str(article.url), article)
+            counts["skipped"] += len(articles) - len(unique_articles)
             
-            logger.info(f"✅ Saved {len(articles)} articles to RDS")
-            return True
+            now = datetime.utcnow()
+            rows = [self._article_values(article, region, now) for article in unique_articles.values()]
+            batch_size = settings.DB_BULK_BATCH_SIZE
+            
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                if settings.DB_TYPE == "mysql":
+                    batch_counts = await self._upsert_batch_mysql(batch)
+                else:
+                    batch_counts = await self._upsert_batch_postgres(batch)
+                for key, value in batch_counts.items():
+                    counts[key] += value
+            
+            # Cached article lists no longer reflect the table; with SWR they keep being
+            # served while one background refresh per key picks up the new rows
+            if counts["inserted"] or counts["updated"]:
+                if settings.SWR_ENABLED:
+                    article_cache.mark_stale(settings.SWR_SOFT_TTL_SECONDS)
+                else:
+                    article_cache.invalidate()
+                self.reader.mark_write()
+            
+            logger.info(
+                f"✅ Saved articles to RDS: {counts['inserted']} inserted, "
+                f"{counts['updated']} updated, {counts['skipped']} skipped"
+            )
+            return counts
             
         except Exception as e:
             logger.error(f"❌ Error saving articles to RDS: {e}")
-            return False
+            counts["skipped"] = len(articles) - counts["inserted"] - counts["updated"]
+            # The table may have been converted since startup; look again on the next save
+            self.articles_partitioned = None
+            return counts
+    
+    def _article_values(self, article: Article, region: str, now: datetime) -> dict:
+        """Column values for one article row"""
+        return {
+            "id": article.id,
+            "title": article.title,
+            "source_name": article.source.name,
+            "source_favicon": article.source.favicon,
+            "source_color": article.source.color,
+            "original_excerpt": article.original_excerpt,
+            "published_at": to_naive_utc(article.published_at),
+            "topic": article.topic.value,
+            "url": str(article.url),
+            "image_url": str(article.image_url) if article.image_url else None,
+            "view_count": article.view_count,
+            "like_count": article.like_count,
+            "region": region,
+            "content_hash": content_hash(article.title, article.original_excerpt),
+            "created_at": now,
+            "updated_at": now
+        }
+    
+    def _multi_row_values(self, rows: List[dict]) -> tuple:
+        """Build a multi-row VALUES clause with uniquely named parameters"""
+        placeholders = []
+        params = {}
+        for i, row in enumerate(rows):
+            placeholders.append("(" + ", ".join(f":{column}_{i}" for column in ARTICLE_INSERT_COLUMNS) + ")")
+            for column in ARTICLE_INSERT_COLUMNS:
+                params[f"{column}_{i}"] = row[column]
+        return ",\n".join(placeholders), params
+    
+    async def _upsert_batch_postgres(self, rows: List[dict]) -> dict:
+        """One INSERT ... ON CONFLICT round trip for a batch"""
+        if self.articles_partitioned is None:
+            await self.detect_article_partitioning()
+        if self.articles_partitioned:
+            # A partitioned table's unique key must include the partition key, so it is
+            # (url, published_at), and that alone would store a url again when NewsAPI
+            # reports a new published_at; keep each stored url's published_at instead
+            await self._keep_stored_published_at(rows)
+            conflict_columns = "url, published_at"
+        else:
+            conflict_columns = "url"
+        values_clause, params = self._multi_row_values(rows)
+        
+        if settings.ARTICLE_UPSERT_MODE == "update":
+            # xmax = 0 only for freshly inserted tuples; unchanged rows aren't returned
+            conflict_clause = f"""
+            ON CONFLICT ({conflict_columns}) DO UPDATE SET
+                {", ".join(f"{column} = EXCLUDED.{column}" for column in ARTICLE_UPDATE_COLUMNS)},
+                updated_at = EXCLUDED.updated_at
+            WHERE ({", ".join(f"articles.{column}" for column in ARTICLE_UPDATE_COLUMNS)})
+                IS DISTINCT FROM ({", ".join(f"EXCLUDED.{column}" for column in ARTICLE_UPDATE_COLUMNS)})
+            RETURNING (xmax = 0) AS inserted, {", ".join(ROLLUP_SOURCE_COLUMNS)}
+            """
+        else:
+            conflict_clause = f"""
+            ON CONFLICT ({conflict_columns}) DO NOTHING
+            RETURNING TRUE AS inserted, {", ".join(ROLLUP_SOURCE_COLUMNS)}
+            """
+        
+        query = f"""
+        INSERT INTO articles ({", ".join(ARTICLE_INSERT_COLUMNS)})
+        VALUES {values_clause}
+        {conflict_clause}
+        """
+        
+        async with self.db.transaction():
+            returned = await self.db.fetch_all(query, params)
+            inserted_rows = [row for row in returned if row["inserted"]]
+            await self._apply_rollup_deltas(self._article_rollup_deltas(inserted_rows))
+        
+        inserted = len(inserted_rows)
+        updated = len(returned) - inserted
+        return {"inserted": inserted, "updated": updated, "skipped": len(rows) - inserted - updated}
+    
+    async def _keep_stored_published_at(self, rows: List[dict]):
+        """Give rows whose url is already stored that row's published_at, so they conflict with it"""
+        url_params = {f"url_{i}": row["url"] for i, row in enumerate(rows)}
+        stored = {
+            row["url"]: row["published_at"]
+            for row in await self.db.fetch_all(
+                f"SELECT url, published_at FROM articles WHERE url IN ({', '.join(f':{name}' for name in url_params)})",
+                url_params
+            )
+        }
+        for row in rows:
+            row["published_at"] = stored.get(row["url"], row["published_at"])
+    
+    async def _upsert_batch_mysql(self, rows: List[dict]) -> dict:
+        """One existence lookup plus one INSERT ... ON DUPLICATE KEY round trip for a batch"""
+        # MySQL reports no per-row outcome, so classify rows against what is already stored
+        url_params = {f"url_{i}": row["url"] for i, row in enumerate(rows)}
+        existing_query = f"""
+        SELECT url, {", ".join(ARTICLE_UPDATE_COLUMNS)} FROM articles
+        WHERE url IN ({", ".join(f":{name}" for name in url_params)})
+        """
+        existing = {row["url"]: row for row in await self.db.fetch_all(existing_query, url_params)}
+        
+        inserted = sum(1 for row in rows if row["url"] not in existing)
+        updated = 0
+        if settings.ARTICLE_UPSERT_MODE == "update":
+            updated = sum(
+                1 for row in rows
+                if row["url"] in existing
+                and any(existing[row["url"]][column] != row[column] for column in ARTICLE_UPDATE_COLUMNS)
+            )
+            duplicate_clause = ", ".join(
+                f"{column} = VALUES({column})" for column in ARTICLE_UPDATE_COLUMNS + ["updated_at"]
+            )
+        else:
+            duplicate_clause = "id = id"
+        
+        values_clause, params = self._multi_row_values(rows)
+        query = f"""
+        INSERT INTO articles ({", ".join(ARTICLE_INSERT_COLUMNS)})
+        VALUES {values_clause}
+        ON DUPLICATE KEY UPDATE {duplicate_clause}
+        """
+        
+        async with self.db.transaction():
+            await self.db.execute(query, params)
+            new_rows = [row for row in rows if row["url"] not in existing]
+            await self._apply_rollup_deltas(self._article_rollup_deltas(new_rows))
+        return {"inserted": inserted, "updated": updated, "skipped": len(rows) - inserted - updated}
+    
+    def _article_rollup_deltas(self, rows) -> dict:
+        """Rollup increments contributed by newly inserted article rows"""
+        deltas = {}
+        for row in rows:
+            key = rollup_key(row)
+            articles, views, likes = deltas.get(key, (0, 0, 0))
+            deltas[key] = (articles + 1, views + (row["view_count"] or 0), likes + (row["like_count"] or 0))
+        return deltas
+    
+    async def _apply_rollup_deltas(self, deltas: dict):
+        """Add (articles, views, likes) increments to their hourly rollup buckets"""
+        if not deltas:
+            return
+        
+        placeholders = []
+        params = {}
+        for i, (key, (articles, views, likes)) in enumerate(sorted(deltas.items())):
+            placeholders.append(
+                f"(:bucket_hour_{i}, :topic_{i}, :source_name_{i}, :region_{i}, :articles_{i}, :views_{i}, :likes_{i})"
+            )
+            for column, value in zip(ROLLUP_KEY_COLUMNS, key):
+                params[f"{column}_{i}"] = value
+            params[f"articles_{i}"] = articles
+            params[f"views_{i}"] = views
+            params[f"likes_{i}"] = likes
+        
+        if settings.DB_TYPE == "mysql":
+            conflict_clause = """
+            ON DUPLICATE KEY UPDATE
+                article_count = article_count + VALUES(article_count),
+                view_count = view_count + VALUES(view_count),
+                like_count = like_count + VALUES(like_count)
+            """
+        else:
+            conflict_clause = f"""
+            ON CONFLICT ({", ".join(ROLLUP_KEY_COLUMNS)}) DO UPDATE SET
+                article_count = article_stats_hourly.article_count + EXCLUDED.article_count,
+                view_count = article_stats_hourly.view_count + EXCLUDED.view_count,
+                like_count = article_stats_hourly.like_count + EXCLUDED.like_count
+            """
+        
+        query = f"""
+        INSERT INTO article_stats_hourly ({", ".join(ROLLUP_KEY_COLUMNS)}, article_count, view_count, like_count)
+        VALUES {", ".join(placeholders)}
+        {conflict_clause}
+        """
+        await self.db.execute(query, params)
+    
+    async def has_articles(self) -> bool:
+        """Whether any article has been stored yet"""
+        if not self.db:
+            await self.init_db()
+        return await self.reader.fetch_one("SELECT 1 AS found FROM articles LIMIT 1") is not None
     
     async def get_articles_from_db(self, filters: ArticleFilter) -> List[Article]:
         """Get articles from RDS database with filters"""
@@ -79,14 +339,32 @@ class DatabaseService:
             where_conditions = []
             query_params = {}
             
+            # Region filter ("Global" spans every region)
+            if filters.region and filters.region != "Global":
+                where_conditions.append("region = :region")
+                query_params["region"] = filters.region.value
+            
             # Topic filter
             if filters.topic and filters.topic != "All":
                 where_conditions.append("topic = :topic")
                 query_params["topic"] = filters.topic
             
             # Search query filter
-            if filters.search_query:
-                where_conditions.append("(title ILIKE :search OR original_excerpt ILIKE :search)")
+            rank_column = ""
+            if filters.search_query and self.fulltext_search is None:
+                await self.detect_fulltext_search()
+            if filters.search_query and self.fulltext_search:
+                match_expression = self._fulltext_match_expression()
+                where_conditions.append(self._fulltext_condition())
+                query_params["search"] = filters.search_query
+                # Relevance decays hyperbolically with age: half the score after one half-life
+                rank_column = f""",
+                ({match_expression}) / (1 + {self._age_in_days_expression()} / :half_life_days) AS search_rank"""
+                query_params["now"] = datetime.utcnow()
+                query_params["half_life_days"] = settings.SEARCH_RECENCY_HALF_LIFE_DAYS
+            elif filters.search_query:
+                like = "LIKE" if settings.DB_TYPE == "mysql" else "ILIKE"
+                where_conditions.append(f"(title {like} :search OR original_excerpt {like} :search)")
                 query_params["search"] = f"%{filters.search_query}%"
             
             # Date range filter
@@ -96,47 +374,48 @@ class DatabaseService:
                 query_params["date_from"] = date_from
             
             # Source filter
-            if filters.source and filters.source != "All":
+            if filters.source:
                 where_conditions.append("source_name = :source")
                 query_params["source"] = filters.source
             
+            # Keyset pagination: seek past the last row of the previous page
+            # instead of scanning and discarding OFFSET rows
+            if filters.cursor:
+                cursor_published_at, cursor_id = decode_cursor(filters.cursor)
+                where_conditions.append("(published_at, id) < (:cursor_published_at, :cursor_id)")
+                query_params["cursor_published_at"] = cursor_published_at
+                query_params["cursor_id"] = cursor_id
+                page_clause = "LIMIT :limit"
+            else:
+                page_clause = "LIMIT :limit OFFSET :offset"
+                query_params["offset"] = (filters.page - 1) * filters.limit
+            
             # Build final query
             where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
             
+            # id breaks ties so pages stay stable for articles published at the same instant.
+            # Cursor pages are recency-ordered, so relevance ranking applies to page mode only.
+            order_clause = "published_at DESC, id DESC"
+            if rank_column and not filters.cursor:
+                order_clause = f"search_rank DESC, {order_clause}"
+            
+            # Only pull the columns the requested projection serializes
+            fields = resolve_article_fields(filters.fields) or ARTICLE_FIELD_SETS["detail"]
+            columns = projection_columns(fields)
+            
             query = f"""
-            SELECT * FROM articles 
+            SELECT {", ".join(columns)}{rank_column} FROM articles 
             WHERE {where_clause}
-            ORDER BY published_at DESC
-            LIMIT :limit OFFSET :offset
+            ORDER BY {order_clause}
+            {page_clause}
             """
             
             query_params["limit"] = filters.limit
-            query_params["offset"] = (filters.page - 1) * filters.limit
-            
-            rows = await self.db.fetch_all(query, query_params)
-            
-            # Convert to Article objects
-            articles = []
-            for row in rows:
-                article = Article(
-                    id=row["id"],
-                    title=row["title"],
-                    source=NewsSource(
-                        name=row["source_name"],
-                        favicon=row["source_favicon"],
-                        color=row["source_color"]
-                    ),
-                    original_excerpt=row["original_excerpt"],
-                    summary=row["summary"],
-                    published_at=row["published_at"],
-                    topic=TopicEnum(row["topic"]),
-                    url=row["url"],
-                    image_url=row["image_url"],
-                    view_count=row["view_count"],
-                    like_count=row["like_count"]
-                )
-                articles.append(article)
             
+            rows = await self.reader.fetch_all(query, query_params)
+            
+            # Rows were validated when they were written, so build Articles without re-validating
+            articles = [self._row_to_article(row, columns) for row in rows]
             logger.info(f"✅ Retrieved {len(articles)} articles from RDS")
             return articles
             
@@ -144,88 +423,670 @@ class DatabaseService:
             logger.error(f"❌ Error getting articles from RDS: {e}")
             return []
     
-    async def update_article_summary(self, article_id: str, summary: str) -> bool:
-        """Update article summary in RDS"""
+    def _row_to_article(self, row, columns: List[str]) -> Article:
+        """Build an unvalidated Article holding only the selected columns"""
+        values = {column: row[column] for column in columns}
+        article = {
+            key: values[key]
+            for key in ("id", "title", "original_excerpt", "summary", "summary_engine", "published_at", "url",
+                        "image_url", "view_count", "like_count")
+            if key in values
+        }
+        if "topic" in values:
+            article["topic"] = TopicEnum(values["topic"])
+        if "source_name" in values:
+            article["source"] = NewsSource.model_construct(
+                name=values["source_name"],
+                favicon=values["source_favicon"],
+                color=values["source_color"]
+            )
+        return Article.model_construct(**article)
+    
+    async def detect_article_partitioning(self) -> bool:
+        """Whether articles is a partitioned table, which fixes the upsert conflict target"""
+        if settings.DB_TYPE == "mysql":
+            self.articles_partitioned = False
+            return False
+        if not self.db:
+            await self.init_db()
+        
+        try:
+            row = await self.db.fetch_one("""
+                SELECT EXISTS (
+                    SELECT 1 FROM pg_partitioned_table p
+                    JOIN pg_class c ON c.oid = p.partrelid
+                    WHERE c.relname = 'articles' AND c.relnamespace = to_regnamespace(current_schema())
+                ) AS partitioned
+            """)
+        except Exception as e:
+            # Left undetected so the next save checks again
+            logger.error(f"❌ Error checking whether articles is partitioned: {e}")
+            return settings.ARTICLE_PARTITIONING_ENABLED
+        
+        self.articles_partitioned = bool(row["partitioned"])
+        if self.articles_partitioned != settings.ARTICLE_PARTITIONING_ENABLED:
+            logger.warning(
+                f"⚠️ articles is {'' if self.articles_partitioned else 'not '}partitioned but "
+                f"ARTICLE_PARTITIONING_ENABLED={settings.ARTICLE_PARTITIONING_ENABLED}; upserts follow the table"
+            )
+        return self.articles_partitioned
+    
+    async def detect_fulltext_search(self) -> bool:
+        """Use full-text search only if it is enabled and migrations/add_fulltext_search.py has run"""
+        if not settings.FULLTEXT_SEARCH_ENABLED:
+            self.fulltext_search = False
+            return False
+        if not self.db:
+            await self.init_db()
+        
+        if settings.DB_TYPE == "mysql":
+            query = """
+            SELECT 1 FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = 'articles' AND index_name = 'idx_articles_fulltext'
+            LIMIT 1
+            """
+        else:
+            query = """
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = 'articles' AND column_name = 'search_vector'
+            """
+        try:
+            self.fulltext_search = await self.db.fetch_one(query) is not None
+        except Exception as e:
+            logger.error(f"❌ Error checking for the full-text search index: {e}")
+            self.fulltext_search = False
+        
+        if not self.fulltext_search:
+            logger.warning("⚠️ Full-text search index missing, falling back to LIKE search "
+                           "(run migrations/add_fulltext_search.py)")
+        return self.fulltext_search
+    
+    def _fulltext_condition(self) -> str:
+        """Index-backed full-text predicate (GIN on PostgreSQL, FULLTEXT on MySQL)"""
+        if settings.DB_TYPE == "mysql":
+            return "MATCH(title, original_excerpt) AGAINST (:search IN NATURAL LANGUAGE MODE)"
+        return "search_vector @@ websearch_to_tsquery('english', :search)"
+    
+    def _fulltext_match_expression(self) -> str:
+        """Relevance score of a row for :search"""
+        if settings.DB_TYPE == "mysql":
+            return "MATCH(title, original_excerpt) AGAINST (:search IN NATURAL LANGUAGE MODE)"
+        return "ts_rank_cd(search_vector, websearch_to_tsquery('english', :search))"
+    
+    def _age_in_days_expression(self) -> str:
+        """Age of a row relative to :now, in fractional days"""
+        if settings.DB_TYPE == "mysql":
+            return "(TIMESTAMPDIFF(SECOND, published_at, :now) / 86400.0)"
+        return "(EXTRACT(EPOCH FROM (CAST(:now AS TIMESTAMP) - published_at)) / 86400.0)"
+    
+    async def update_article_summary(
+        self, article_id: Optional[str], summary: str, content_hash: Optional[str] = None
+    ) -> Optional[bool]:
+        """Store a model summary on matching articles; False if they already had it, None on error"""
         try:
             if not self.db:
                 await self.init_db()
             
-            query = """
-            UPDATE articles 
-            SET summary = :summary, updated_at = :updated_at
-            WHERE id = :article_id
-            """
+            targets = []
+            values = {"summary": summary, "extractive": ENGINE_EXTRACTIVE}
+            if article_id:
+                targets.append("id = :article_id")
+                values["article_id"] = article_id
+            if content_hash:
+                targets.append("content_hash = :content_hash")
+                values["content_hash"] = content_hash
+            if not targets:
+                return False
             
-            values = {
-                "summary": summary,
-                "updated_at": datetime.utcnow(),
-                "article_id": article_id
-            }
+            # Most calls re-link a cached summary the articles already carry; those write nothing
+            rows = await self.db.fetch_all(
+                f"""
+                SELECT id, published_at FROM articles
+                WHERE ({" OR ".join(targets)})
+                  AND (summary IS NULL OR summary <> :summary OR summary_engine = :extractive)
+                """,
+                values
+            )
+            if not rows:
+                return False
             
-            await self.db.execute(query, values)
-            logger.info(f"✅ Updated summary for article {article_id}")
+            # published_at is part of the key, so each update touches a single partition
+            now = datetime.utcnow()
+            await self.db.execute_many(
+                """
+                UPDATE articles SET summary = :summary, summary_engine = :summary_engine, updated_at = :updated_at
+                WHERE id = :id AND published_at = :published_at
+                """,
+                [
+                    {
+                        "id": row["id"],
+                        "published_at": row["published_at"],
+                        "summary": summary,
+                        "summary_engine": ENGINE_LLM,
+                        "updated_at": now,
+                    }
+                    for row in rows
+                ]
+            )
+            self.reader.mark_write()
+            logger.info(f"✅ Updated summary for {len(rows)} articles ({article_id or content_hash})")
             return True
             
         except Exception as e:
             logger.error(f"❌ Error updating article summary: {e}")
-            return False
+            return None
+    
+    async def get_stored_summaries(self, content_hashes: List[str], model: str, prompt_version: str) -> dict:
+        """Unexpired stored summaries for many contents in one query, keyed by content hash"""
+        if not content_hashes:
+            return {}
+        if not self.db:
+            await self.init_db()
+        
+        params = {"model": model, "prompt_version": prompt_version}
+        placeholders = []
+        for i, value in enumerate(content_hashes):
+            params[f"content_hash_{i}"] = value
+            placeholders.append(f":content_hash_{i}")
+        ttl_condition = ""
+        if settings.SUMMARY_STORE_TTL_DAYS > 0:
+            ttl_condition = "AND created_at >= :min_created_at"
+            params["min_created_at"] = datetime.utcnow() - timedelta(days=settings.SUMMARY_STORE_TTL_DAYS)
+        
+        rows = await self.reader.fetch_all(
+            f"""
+            SELECT content_hash, summary, last_used_at FROM summaries
+            WHERE content_hash IN ({", ".join(placeholders)}) AND model = :model AND prompt_version = :prompt_version
+            {ttl_condition}
+            """,
+            params
+        )
+        return {
+            row["content_hash"]: {"summary": row["summary"], "last_used_at": row["last_used_at"]}
+            for row in rows
+        }
+    
+    async def get_articles_for_summary(self, article_ids: List[str]) -> dict:
+        """Title and excerpt of each known article, keyed by id"""
+        if not article_ids:
+            return {}
+        if not self.db:
+            await self.init_db()
+        
+        params = {f"id_{i}": article_id for i, article_id in enumerate(article_ids)}
+        rows = await self.reader.fetch_all(
+            f"SELECT id, title, original_excerpt FROM articles WHERE id IN ({', '.join(':' + name for name in params)})",
+            params
+        )
+        return {row["id"]: {"title": row["title"], "content": row["original_excerpt"]} for row in rows}
+    
+    async def save_stored_summary(self, content_hash: str, model: str, prompt_version: str, summary: str):
+        """Insert or replace the stored summary for this content, model and prompt version"""
+        if not self.db:
+            await self.init_db()
+        
+        if settings.DB_TYPE == "mysql":
+            conflict_clause = """
+            ON DUPLICATE KEY UPDATE
+                summary = VALUES(summary), created_at = VALUES(created_at), last_used_at = VALUES(last_used_at)
+            """
+        else:
+            conflict_clause = """
+            ON CONFLICT (content_hash, model, prompt_version) DO UPDATE SET
+                summary = EXCLUDED.summary, created_at = EXCLUDED.created_at, last_used_at = EXCLUDED.last_used_at
+            """
+        
+        now = datetime.utcnow()
+        await self.db.execute(
+            f"""
+            INSERT INTO summaries (content_hash, model, prompt_version, summary, created_at, last_used_at)
+            VALUES (:content_hash, :model, :prompt_version, :summary, :created_at, :last_used_at)
+            {conflict_clause}
+            """,
+            {
+                "content_hash": content_hash,
+                "model": model,
+                "prompt_version": prompt_version,
+                "summary": summary,
+                "created_at": now,
+                "last_used_at": now,
+            }
+        )
+        self.reader.mark_write()
+    
+    async def touch_stored_summaries(self, keys: List[tuple]):
+        """Record a use of many stored summaries, keyed (content_hash, model, prompt_version), for LRU eviction"""
+        if not keys:
+            return
+        now = datetime.utcnow()
+        await self.db.execute_many(
+            """
+            UPDATE summaries SET last_used_at = :now
+            WHERE content_hash = :content_hash AND model = :model AND prompt_version = :prompt_version
+            """,
+            [
+                {"now": now, "content_hash": content_hash, "model": model, "prompt_version": prompt_version}
+                for content_hash, model, prompt_version in keys
+            ]
+        )
+    
+    async def prune_stored_summaries(self) -> dict:
+        """Delete expired summaries, then the least recently used beyond SUMMARY_STORE_MAX_ROWS"""
+        if not self.db:
+            await self.init_db()
+        
+        result = {"expired": 0, "evicted": 0}
+        if settings.SUMMARY_STORE_TTL_DAYS > 0:
+            cutoff = datetime.utcnow() - timedelta(days=settings.SUMMARY_STORE_TTL_DAYS)
+            expired = await self.db.fetch_one(
+                "SELECT COUNT(*) AS count FROM summaries WHERE created_at < :cutoff", {"cutoff": cutoff}
+            )
+            await self.db.execute("DELETE FROM summaries WHERE created_at < :cutoff", {"cutoff": cutoff})
+            result["expired"] = expired["count"]
+        
+        total = await self.db.fetch_one("SELECT COUNT(*) AS count FROM summaries")
+        excess = total["count"] - settings.SUMMARY_STORE_MAX_ROWS
+        if excess > 0:
+            if settings.DB_TYPE == "mysql":
+                query = "DELETE FROM summaries ORDER BY last_used_at ASC LIMIT :excess"
+            else:
+                query = """
+                DELETE FROM summaries WHERE (content_hash, model, prompt_version) IN (
+                    SELECT content_hash, model, prompt_version FROM summaries
+                    ORDER BY last_used_at ASC LIMIT :excess
+                )
+                """
+            await self.db.execute(query, {"excess": excess})
+            result["evicted"] = excess
+        
+        logger.info(f"✅ Pruned summary store: {result['expired']} expired, {result['evicted']} evicted")
+        return result
+    
+    async def _trending_condition(self) -> Tuple[str, dict]:
+        """Condition on articles a for trending articles: flagged, engaged with, or in a topic drawing views"""
+        rows = await self.db.fetch_all(
+            """
+            SELECT topic, SUM(view_count + like_count) AS engagement
+            FROM article_stats_hourly
+            WHERE bucket_hour >= :since
+            GROUP BY topic
+            HAVING SUM(view_count + like_count) > 0
+            ORDER BY engagement DESC
+            LIMIT :limit
+            """,
+            {
+                "since": datetime.utcnow() - timedelta(hours=settings.SUMMARY_TRENDING_LOOKBACK_HOURS),
+                "limit": settings.SUMMARY_TRENDING_TOPICS,
+            }
+        ) if settings.SUMMARY_TRENDING_TOPICS > 0 else []
+        
+        conditions = ["a.is_trending", "a.view_count + a.like_count >= :min_interactions"]
+        params = {"min_interactions": settings.SUMMARY_TRENDING_MIN_INTERACTIONS}
+        topics = {f"trending_topic_{i}": row["topic"] for i, row in enumerate(rows)}
+        if topics:
+            conditions.append(f"a.topic IN ({', '.join(f':{name}' for name in topics)})")
+            params.update(topics)
+        return " OR ".join(conditions), params
+    
+    async def enqueue_summary_jobs(self, limit: Optional[int] = None) -> int:
+        """Queue recent articles that have no summary and aren't queued yet; trending ones get priority"""
+        if not self.db:
+            await self.init_db()
+        
+        trending, trending_params = await self._trending_condition()
+        trending_params["extractive"] = ENGINE_EXTRACTIVE
+        since = datetime.utcnow() - timedelta(hours=settings.SUMMARY_PIPELINE_LOOKBACK_HOURS)
+        # Trending articles summarized extractively are queued again for a model summary
+        unsummarized = f"(a.summary IS NULL OR (a.summary_engine = :extractive AND ({trending})))"
+        
+        # Queued articles that started trending while they waited move up the queue
+        await self.db.execute(
+            f"""
+            UPDATE summary_jobs SET priority = 1
+            WHERE priority = 0 AND lease_token IS NULL AND article_id IN (
+                SELECT a.id FROM articles a
+                WHERE {unsummarized} AND a.published_at >= :since AND ({trending})
+            )
+            """,
+            {"since": since, **trending_params}
+        )
+        
+        candidates = await self.db.fetch_all(
+            f"""
+            SELECT a.id, a.published_at, CASE WHEN ({trending}) THEN 1 ELSE 0 END AS priority
+            FROM articles a
+            WHERE {unsummarized} AND a.published_at >= :since
+              AND NOT EXISTS (SELECT 1 FROM summary_jobs j WHERE j.article_id = a.id)
+            ORDER BY a.published_at DESC
+            LIMIT :limit
+            """,
+            {
+                "since": since,
+                "limit": limit or settings.SUMMARY_PIPELINE_ENQUEUE_LIMIT,
+                **trending_params,
+            }
+        )
+        if not candidates:
+            return 0
+        
+        now = datetime.utcnow()
+        placeholders = []
+        params = {"enqueued_at": now}
+        for i, row in enumerate(candidates):
+            placeholders.append(f"(:article_id_{i}, :priority_{i}, :published_at_{i}, :enqueued_at, 0)")
+            params[f"article_id_{i}"] = row["id"]
+            params[f"priority_{i}"] = row["priority"]
+            params[f"published_at_{i}"] = row["published_at"]
+        
+        # A concurrent enqueue may have claimed some of the same articles
+        if settings.DB_TYPE == "mysql":
+            insert, conflict_clause = "INSERT IGNORE INTO", ""
+        else:
+            insert, conflict_clause = "INSERT INTO", "ON CONFLICT (article_id) DO NOTHING"
+        await self.db.execute(
+            f"""
+            {insert} summary_jobs (article_id, priority, published_at, enqueued_at, attempts)
+            VALUES {", ".join(placeholders)}
+            {conflict_clause}
+            """,
+            params
+        )
+        return len(candidates)
+    
+    async def lease_summary_jobs(self, limit: int) -> Tuple[str, List[dict]]:
+        """Lease the highest-priority ready jobs under a fresh token, with their articles' text"""
+        if not self.db:
+            await self.init_db()
+        
+        token = str(uuid.uuid4())
+        now = datetime.utcnow()
+        params = {
+            "token": token,
+            "now": now,
+            "lease_expires_at": now + timedelta(seconds=settings.SUMMARY_PIPELINE_LEASE_SECONDS),
+            "max_attempts": settings.SUMMARY_PIPELINE_MAX_ATTEMPTS,
+            "limit": limit,
+        }
+        ready_condition = "attempts < :max_attempts AND (lease_expires_at IS NULL OR lease_expires_at < :now)"
+        if settings.DB_TYPE == "mysql":
+            query = f"""
+            UPDATE summary_jobs
+            SET lease_token = :token, lease_expires_at = :lease_expires_at, attempts = attempts + 1
+            WHERE {ready_condition}
+            ORDER BY priority DESC, published_at DESC
+            LIMIT :limit
+            """
+        else:
+            # SKIP LOCKED lets workers lease concurrently without blocking on each other's rows
+            query = f"""
+            UPDATE summary_jobs
+            SET lease_token = :token, lease_expires_at = :lease_expires_at, attempts = attempts + 1
+            WHERE article_id IN (
+                SELECT article_id FROM summary_jobs
+                WHERE {ready_condition}
+                ORDER BY priority DESC, published_at DESC
+                LIMIT :limit
+                FOR UPDATE SKIP LOCKED
+            )
+            """
+        await self.db.execute(query, params)
+        
+        rows = await self.db.fetch_all(
+            """
+            SELECT j.article_id, j.priority, j.published_at, j.enqueued_at, j.attempts,
+                   a.title, a.original_excerpt, a.summary, a.summary_engine
+            FROM summary_jobs j
+            LEFT JOIN articles a ON a.id = j.article_id AND a.published_at = j.published_at
+            WHERE j.lease_token = :token
+            ORDER BY j.priority DESC, j.published_at DESC
+            """,
+            {"token": token}
+        )
+        return token, [dict(row._mapping) for row in rows]
+    
+    async def complete_summary_jobs(self, token: str, jobs: List[dict], summaries: dict):
+        """Write (summary, engine) pairs back to their articles and remove the jobs, in one transaction"""
+        if not jobs:
+            return
+        
+        now = datetime.utcnow()
+        ids = {f"article_id_{i}": job["article_id"] for i, job in enumerate(jobs)}
+        # A reader may have summarized the article while it was queued; keep theirs, unless
+        # it is extractive and this one came from the model
+        replaceable = {
+            ENGINE_LLM: ("(summary IS NULL OR summary_engine = :extractive)", {"extractive": ENGINE_EXTRACTIVE}),
+            ENGINE_EXTRACTIVE: ("summary IS NULL", {}),
+        }
+        async with self.db.transaction():
+            for engine, (condition, condition_params) in replaceable.items():
+                updates = [
+                    {
+                        "id": job["article_id"],
+                        "published_at": job["published_at"],
+                        "summary": summaries[job["article_id"]][0],
+                        "summary_engine": engine,
+                        "updated_at": now,
+                        **condition_params,
+                    }
+                    for job in jobs
+                    if job["article_id"] in summaries and summaries[job["article_id"]][1] == engine
+                ]
+                if updates:
+                    await self.db.execute_many(
+                        f"""
+                        UPDATE articles SET summary = :summary, summary_engine = :summary_engine, updated_at = :updated_at
+                        WHERE id = :id AND published_at = :published_at AND {condition}
+                        """,
+                        updates
+                    )
+            await self.db.execute(
+                f"""
+                DELETE FROM summary_jobs
+                WHERE lease_token = :token AND article_id IN ({", ".join(f":{name}" for name in ids)})
+                """,
+                {"token": token, **ids}
+            )
+        self.reader.mark_write()
+    
+    async def fail_summary_jobs(self, token: str, jobs: List[dict], errors: dict):
+        """Release failed jobs with exponential backoff; they stop retrying after SUMMARY_PIPELINE_MAX_ATTEMPTS"""
+        if not jobs:
+            return
+        
+        now = datetime.utcnow()
+        await self.db.execute_many(
+            """
+            UPDATE summary_jobs SET lease_token = NULL, lease_expires_at = :retry_at, last_error = :error
+            WHERE article_id = :article_id AND lease_token = :token
+            """,
+            [
+                {
+                    "article_id": job["article_id"],
+                    "token": token,
+                    "error": errors[job["article_id"]][:1000],
+                    "retry_at": now + timedelta(
+                        seconds=settings.SUMMARY_PIPELINE_RETRY_BASE_SECONDS * 2 ** max(job["attempts"] - 1, 0)
+                    ),
+                }
+                for job in jobs
+            ]
+        )
+    
+    async def get_summary_queue_depth(self) -> dict:
+        """Queued jobs by state, plus the age of the oldest ready one"""
+        if not self.db:
+            await self.init_db()
+        
+        row = await self.db.fetch_one(
+            """
+            SELECT
+                SUM(CASE WHEN lease_token IS NOT NULL AND lease_expires_at >= :now THEN 1 ELSE 0 END) AS leased,
+                SUM(CASE WHEN attempts < :max_attempts AND (lease_expires_at IS NULL OR lease_expires_at < :now)
+                    THEN 1 ELSE 0 END) AS ready,
+                SUM(CASE WHEN lease_token IS NULL AND lease_expires_at >= :now AND attempts < :max_attempts
+                    THEN 1 ELSE 0 END) AS retrying,
+                SUM(CASE WHEN attempts >= :max_attempts AND (lease_token IS NULL OR lease_expires_at < :now)
+                    THEN 1 ELSE 0 END) AS dead,
+                MIN(CASE WHEN attempts < :max_attempts AND (lease_expires_at IS NULL OR lease_expires_at < :now)
+                    THEN enqueued_at END) AS oldest_ready_at
+            FROM summary_jobs
+            """,
+            {"now": datetime.utcnow(), "max_attempts": settings.SUMMARY_PIPELINE_MAX_ATTEMPTS}
+        )
+        depth = {state: int(row[state] or 0) for state in ("ready", "leased", "retrying", "dead")}
+        oldest = row["oldest_ready_at"]
+        depth["oldest_ready_seconds"] = round((datetime.utcnow() - oldest).total_seconds(), 1) if oldest else 0.0
+        return depth
+    
+    async def acquire_lease(self, name: str, holder: str, seconds: float) -> bool:
+        """Take or renew a named lease; False while another holder's lease is unexpired"""
+        if not self.db:
+            await self.init_db()
+        
+        now = datetime.utcnow()
+        params = {"name": name, "holder": holder, "expires_at": now + timedelta(seconds=seconds)}
+        if settings.DB_TYPE == "mysql":
+            insert, conflict_clause = "INSERT IGNORE INTO", ""
+        else:
+            insert, conflict_clause = "INSERT INTO", "ON CONFLICT (name) DO NOTHING"
+        await self.db.execute(
+            f"{insert} scheduler_leases (name, holder, expires_at) VALUES (:name, :holder, :expires_at) {conflict_clause}",
+            params
+        )
+        # Concurrent takeovers of an expired lease re-check the row after the first one commits
+        await self.db.execute(
+            """
+            UPDATE scheduler_leases SET holder = :holder, expires_at = :expires_at
+            WHERE name = :name AND (holder = :holder OR expires_at < :now)
+            """,
+            {**params, "now": now}
+        )
+        row = await self.db.fetch_one("SELECT holder FROM scheduler_leases WHERE name = :name", {"name": name})
+        return row is not None and row["holder"] == holder
+    
+    async def release_lease(self, name: str, holder: str):
+        """Let another worker take the lease right away"""
+        await self.db.execute(
+            "UPDATE scheduler_leases SET expires_at = :now WHERE name = :name AND holder = :holder",
+            {"name": name, "holder": holder, "now": datetime.utcnow()}
+        )
     
     async def track_interaction(self, article_id: str, interaction_type: str, user_ip: str = None) -> bool:
-        """Track user interactions in RDS"""
+        """Track a single user interaction in RDS"""
+        return await self.record_interactions([{
+            "id": str(uuid.uuid4()),
+            "article_id": article_id,
+            "interaction_type": interaction_type,
+            "user_ip": user_ip,
+            "timestamp": datetime.utcnow()
+        }])
+    
+    async def record_interactions(self, events: List[dict]) -> bool:
+        """Write a batch of interactions: one multi-row insert plus one counter update per article"""
+        if not events:
+            return True
         try:
             if not self.db:
                 await self.init_db()
             
-            # Insert interaction record
-            insert_query = """
-            INSERT INTO user_interactions (article_id, interaction_type, user_ip)
-            VALUES (:article_id, :interaction_type, :user_ip)
-            """
+            # Fold events into per-article counter deltas
+            deltas = {}
+            for event in events:
+                views, likes = deltas.get(event["article_id"], (0, 0))
+                if event["interaction_type"] == "view":
+                    views += 1
+                elif event["interaction_type"] == "like":
+                    likes += 1
+                deltas[event["article_id"]] = (views, likes)
             
-            await self.db.execute(insert_query, {
-                "article_id": article_id,
-                "interaction_type": interaction_type,
-                "user_ip": user_ip
-            })
-            
-            # Update article counters
-            if interaction_type == "view":
-                update_query = "UPDATE articles SET view_count = view_count + 1 WHERE id = :article_id"
-            elif interaction_type == "like":
-                update_query = "UPDATE articles SET like_count = like_count + 1 WHERE id = :article_id"
-            else:
-                return True
+            # Sorted ids give every flush the same lock order on article rows
+            counter_updates = [
+                {"article_id": article_id, "views": views, "likes": likes}
+                for article_id, (views, likes) in sorted(deltas.items())
+                if views or likes
+            ]
             
-            await self.db.execute(update_query, {"article_id": article_id})
-            logger.info(f"✅ Tracked {interaction_type} for article {article_id}")
+            async with self.db.transaction():
+                for start in range(0, len(events), settings.DB_BULK_BATCH_SIZE):
+                    batch = events[start:start + settings.DB_BULK_BATCH_SIZE]
+                    placeholders = []
+                    params = {}
+                    for i, event in enumerate(batch):
+                        placeholders.append(f"(:id_{i}, :article_id_{i}, :interaction_type_{i}, :user_ip_{i}, :timestamp_{i})")
+                        for column in ("id", "article_id", "interaction_type", "user_ip", "timestamp"):
+                            params[f"{column}_{i}"] = event[column]
+                    
+                    insert_query = f"""
+                    INSERT INTO user_interactions (id, article_id, interaction_type, user_ip, timestamp)
+                    VALUES {", ".join(placeholders)}
+                    """
+                    await self.db.execute(insert_query, params)
+                
+                if counter_updates:
+                    articles = await self._interaction_articles(counter_updates)
+                    # published_at is part of the key, so each update touches a single partition
+                    update_query = """
+                    UPDATE articles
+                    SET view_count = view_count + :views, like_count = like_count + :likes
+                    WHERE id = :article_id AND published_at = :published_at
+                    """
+                    await self.db.execute_many(update_query, [
+                        {**update, "published_at": articles[update["article_id"]]["published_at"]}
+                        for update in counter_updates if update["article_id"] in articles
+                    ])
+                    await self._apply_rollup_deltas(self._interaction_rollup_deltas(counter_updates, articles))
+            
+            self.reader.mark_write()
+            logger.info(f"✅ Recorded {len(events)} interactions across {len(deltas)} articles")
             return True
             
         except Exception as e:
-            logger.error(f"❌ Error tracking interaction: {e}")
+            logger.error(f"❌ Error tracking interactions: {e}")
             return False
     
+    async def _interaction_articles(self, counter_updates: List[dict]) -> dict:
+        """Partition key and rollup columns of the articles in a batch, keyed by id"""
+        id_params = {f"id_{i}": update["article_id"] for i, update in enumerate(counter_updates)}
+        query = f"""
+        SELECT id, published_at, topic, source_name, region FROM articles
+        WHERE id IN ({", ".join(f":{name}" for name in id_params)})
+        """
+        return {row["id"]: row for row in await self.db.fetch_all(query, id_params)}
+    
+    def _interaction_rollup_deltas(self, counter_updates: List[dict], rows: dict) -> dict:
+        """Map per-article counter deltas onto the rollup buckets of those articles"""
+        deltas = {}
+        for update in counter_updates:
+            if update["article_id"] not in rows:
+                continue
+            key = rollup_key(rows[update["article_id"]])
+            articles, views, likes = deltas.get(key, (0, 0, 0))
+            deltas[key] = (articles, views + update["views"], likes + update["likes"])
+        return deltas
+    
     async def get_trending_topics(self) -> List[dict]:
         """Get trending topics from RDS"""
         try:
             if not self.db:
                 await self.init_db()
             
-            # Get topic counts from recent articles
+            # Get topic counts from the hourly rollup instead of scanning recent articles
             query = """
             SELECT 
                 topic,
-                COUNT(*) as count,
+                SUM(article_count) as count,
                 SUM(view_count) as total_views,
                 SUM(like_count) as total_likes
-            FROM articles 
-            WHERE published_at >= :date_from
+            FROM article_stats_hourly 
+            WHERE bucket_hour >= :date_from
             GROUP BY topic
-            ORDER BY (COUNT(*) + SUM(view_count) * 0.1 + SUM(like_count) * 0.5) DESC
+            HAVING SUM(article_count) > 0
+            ORDER BY (SUM(article_count) + SUM(view_count) * 0.1 + SUM(like_count) * 0.5) DESC
             LIMIT 10
             """
             
             date_from = datetime.utcnow() - timedelta(days=7)
-            rows = await self.db.fetch_all(query, {"date_from": date_from})
+            rows = await self.reader.fetch_all(query, {"date_from": date_from})
             
             trending_topics = []
             emoji_map = {
@@ -242,11 +1103,11 @@ class DatabaseService:
                 trend_type = "hot" if i == 0 else "trending" if i < 3 else "rising"
                 trending_topics.append({
                     "name": row["topic"],
-                    "count": row["count"],
+                    "count": int(row["count"]),
                     "trend_type": trend_type,
                     "emoji": emoji_map.get(row["topic"], "📰"),
-                    "total_views": row["total_views"],
-                    "total_likes": row["total_likes"]
+                    "total_views": int(row["total_views"] or 0),
+                    "total_likes": int(row["total_likes"] or 0)
                 })
             
             logger.info(f"✅ Retrieved {len(trending_topics)} trending topics from RDS")
@@ -262,31 +1123,32 @@ class DatabaseService:
             if not self.db:
                 await self.init_db()
             
-            # Total articles
-            total_query = "SELECT COUNT(*) as total FROM articles"
-            total_result = await self.db.fetch_one(total_query)
-            total_articles = total_result["total"] if total_result else 0
-            
+            # All counts come from the hourly rollup rather than full-table scans
             # Articles by topic
             topic_query = """
-            SELECT topic, COUNT(*) as count 
-            FROM articles 
+            SELECT topic, SUM(article_count) as count 
+            FROM article_stats_hourly 
             GROUP BY topic 
+            HAVING SUM(article_count) > 0
             ORDER BY count DESC
             """
-            topic_results = await self.db.fetch_all(topic_query)
-            articles_by_topic = {row["topic"]: row["count"] for row in topic_results}
+            topic_results = await self.reader.fetch_all(topic_query)
+            articles_by_topic = {row["topic"]: int(row["count"]) for row in topic_results}
+            
+            # Total articles
+            total_articles = sum(articles_by_topic.values())
             
             # Articles by source
             source_query = """
-            SELECT source_name, COUNT(*) as count 
-            FROM articles 
+            SELECT source_name, SUM(article_count) as count 
+            FROM article_stats_hourly 
             GROUP BY source_name 
+            HAVING SUM(article_count) > 0
             ORDER BY count DESC
             LIMIT 10
             """
-            source_results = await self.db.fetch_all(source_query)
-            articles_by_source = {row["source_name"]: row["count"] for row in source_results}
+            source_results = await self.reader.fetch_all(source_query)
+            articles_by_source = {row["source_name"]: int(row["count"]) for row in source_results}
             
             return {
                 "total_articles": total_articles,
@@ -298,6 +1160,84 @@ class DatabaseService:
             logger.error(f"❌ Error getting statistics: {e}")
             return {"total_articles": 0, "articles_by_topic": {}, "articles_by_source": {}}
     
+    def _hour_bucket_expression(self) -> str:
+        """SQL truncating published_at to the hour"""
+        if settings.DB_TYPE == "mysql":
+            return "TIMESTAMP(DATE(published_at), MAKETIME(HOUR(published_at), 0, 0))"
+        return "date_trunc('hour', published_at)"
+    
+    def _raw_rollup_query(self) -> str:
+        """Aggregate the raw articles table into rollup buckets"""
+        return f"""
+        SELECT
+            {self._hour_bucket_expression()} AS bucket_hour,
+            topic,
+            source_name,
+            COALESCE(region, 'Global') AS region,
+            COUNT(*) AS article_count,
+            COALESCE(SUM(view_count), 0) AS view_count,
+            COALESCE(SUM(like_count), 0) AS like_count
+        FROM articles
+        GROUP BY 1, 2, 3, 4
+        """
+    
+    async def rebuild_rollups(self) -> int:
+        """Reconciliation job: rebuild the statistics rollup from the raw articles table"""
+        if not self.db:
+            await self.init_db()
+        
+        async with self.db.transaction():
+            await self.db.execute("DELETE FROM article_stats_hourly")
+            await self.db.execute(f"""
+            INSERT INTO article_stats_hourly ({", ".join(ROLLUP_KEY_COLUMNS)}, article_count, view_count, like_count)
+            {self._raw_rollup_query()}
+            """)
+            result = await self.db.fetch_one("SELECT COUNT(*) AS buckets FROM article_stats_hourly")
+        
+        # Trending and stats responses may have been built from the old rollup
+        article_cache.invalidate()
+        self.reader.mark_write()
+        logger.info(f"✅ Rebuilt statistics rollup ({result['buckets']} buckets)")
+        return result["buckets"]
+    
+    async def check_rollups(self, max_mismatches: int = 50) -> dict:
+        """Compare the incremental rollup with a fresh aggregate of the raw tables"""
+        if not self.db:
+            await self.init_db()
+        
+        def as_key(row) -> tuple:
+            return (row["bucket_hour"], row["topic"], row["source_name"], row["region"])
+        
+        def as_counts(row) -> tuple:
+            return (int(row["article_count"]), int(row["view_count"]), int(row["like_count"]))
+        
+        raw = {as_key(row): as_counts(row) for row in await self.db.fetch_all(self._raw_rollup_query())}
+        rollup = {
+            as_key(row): as_counts(row)
+            for row in await self.db.fetch_all("SELECT * FROM article_stats_hourly")
+        }
+        
+        mismatches = []
+        for key in sorted(set(raw) | set(rollup), key=str):
+            expected = raw.get(key, (0, 0, 0))
+            actual = rollup.get(key, (0, 0, 0))
+            if expected != actual:
+                mismatches.append({
+                    "bucket_hour": key[0],
+                    "topic": key[1],
+                    "source_name": key[2],
+                    "region": key[3],
+                    "expected": dict(zip(("articles", "views", "likes"), expected)),
+                    "actual": dict(zip(("articles", "views", "likes"), actual)),
+                })
+        
+        return {
+            "consistent": not mismatches,
+            "buckets_checked": len(set(raw) | set(rollup)),
+            "mismatch_count": len(mismatches),
+            "mismatches": mismatches[:max_mismatches],
+        }
+    
     def _get_date_from_range(self, date_range: str) -> datetime:
         """Convert date range to datetime"""
         now = datetime.utcnow()
@@ -0,0 +1,159 @@
+import re
+from typing import List
+
+import numpy as np
+
+from config import settings
+from services.content_hash import TRUNCATION_MARKER
+
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])[\"')\]]*\s+(?=[\"'(\[]*[A-Z0-9])")
+WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+STOP_WORDS = frozenset("""
+a about after again against all also an and any are as at be because been before being between both but by
+can could did do does doing down during each few for from further had has have having he her here hers him
+his how i if in into is it its itself just me more most my no nor not now of off on once only or other our
+ours out over own said same says she should so some such than that the their them then there these they
+this those through to too under until up very was we were what when where which while who whom why will
+with would you your
+""".split())
+
+# PageRank damping; the remaining probability mass jumps back to title-like and early sentences
+DAMPING = 0.85
+ITERATIONS = 30
+
+METHODS = ("textrank", "centroid")
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences of an article body, without NewsAPI's truncation marker"""
+    text = TRUNCATION_MARKER.sub("", text or "")
+    sentences = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = re.sub(r"\s+", " ", paragraph).strip()
+        if paragraph:
+            sentences.extend(sentence.strip() for sentence in SENTENCE_BOUNDARY.split(paragraph) if sentence.strip())
+    return sentences
+
+def tokenize(text: str) -> List[str]:
+    return [word for word in WORD.findall(text.lower()) if word not in STOP_WORDS]
+
+def tfidf_matrix(documents: List[List[str]]) -> np.ndarray:
+    """Row-normalized TF-IDF vectors for tokenized sentences, IDF taken over the same sentences"""
+    return tfidf_blocks([documents])[0]
+
+def tfidf_blocks(blocks: List[List[List[str]]]) -> np.ndarray:
+    """tfidf_matrix for many blocks at once, zero-padded to (blocks, rows, vocabulary); each block keeps its own IDF"""
+    vocabulary_sizes = []
+    block_ids, rows, columns = [], [], []
+    for block, documents in enumerate(blocks):
+        vocabulary = {}
+        for row, tokens in enumerate(documents):
+            for token in tokens:
+                block_ids.append(block)
+                rows.append(row)
+                columns.append(vocabulary.setdefault(token, len(vocabulary)))
+        vocabulary_sizes.append(len(vocabulary))
+
+    shape = (
+        len(blocks),
+        max((len(documents) for documents in blocks), default=0),
+        max(max(vocabulary_sizes, default=0), 1),
+    )
+    cells = np.ravel_multi_index((block_ids, rows, columns), shape) if columns else np.zeros(0, dtype=int)
+    counts = np.bincount(cells, minlength=int(np.prod(shape))).reshape(shape).astype(float)
+
+    document_count = np.array([len(documents) for documents in blocks], dtype=float).reshape(-1, 1, 1)
+    document_frequency = np.count_nonzero(counts, axis=1)[:, np.newaxis, :]
+    idf = np.log((1 + document_count) / (1 + document_frequency)) + 1
+    weights = np.log1p(counts) * idf
+    norms = np.linalg.norm(weights, axis=2, keepdims=True)
+    return np.divide(weights, norms, out=np.zeros_like(weights), where=norms > 0)
+
+class ExtractiveSummarizer:
+    """Local summaries made of an article's most central sentences; no model call, a few ms per article"""
+
+    def __init__(self):
+        self.max_length = settings.MAX_SUMMARY_LENGTH
+        self.method = settings.EXTRACTIVE_METHOD
+        self.summaries = 0
+
+    def score_sentences(self, title: str, sentences: List[str], method: str) -> np.ndarray:
+        """Centrality score for each sentence; the title row biases scores towards the headline's topic"""
+        return self.score_many([(title, sentences)], method)[0]
+
+    def score_many(self, articles: List[tuple], method: str) -> List[np.ndarray]:
+        """score_sentences for many (title, sentences) pairs, as padded matrix operations over the whole batch"""
+        vectors = tfidf_blocks([
+            [tokenize(title)] + [tokenize(sentence) for sentence in sentences] for title, sentences in articles
+        ])
+        title_vectors, sentence_vectors = vectors[:, :1, :], vectors[:, 1:, :]
+        sizes = np.array([len(sentences) for _, sentences in articles])
+        # Padding rows are all zero, so they drop out of every sum below; the mask keeps them out of the priors
+        mask = np.arange(sentence_vectors.shape[1]) < sizes[:, np.newaxis]
+        title_similarity = (sentence_vectors @ title_vectors.transpose(0, 2, 1))[:, :, 0]
+        # News leads with the story, so earlier sentences get a prior (squared for the TextRank jump)
+        position_prior = np.where(mask, 1.0 / np.sqrt(np.arange(1, sentence_vectors.shape[1] + 1)), 0.0)
+
+        if method == "centroid":
+            centroids = sentence_vectors.sum(axis=1, keepdims=True)
+            norms = np.linalg.norm(centroids, axis=2, keepdims=True)
+            centroids = np.divide(centroids, norms, out=np.zeros_like(centroids), where=norms > 0)
+            centrality = (sentence_vectors @ centroids.transpose(0, 2, 1))[:, :, 0]
+            scores = centrality + 0.5 * title_similarity + 0.1 * position_prior
+        else:
+            # TextRank: PageRank over the cosine similarity graph between sentences
+            similarity = sentence_vectors @ sentence_vectors.transpose(0, 2, 1)
+            diagonal = np.arange(similarity.shape[1])
+            similarity[:, diagonal, diagonal] = 0.0
+            out_weight = similarity.sum(axis=2, keepdims=True)
+            transition = np.divide(similarity, out_weight, out=np.zeros_like(similarity), where=out_weight > 0)
+
+            teleport = position_prior ** 2 + title_similarity
+            teleport /= teleport.sum(axis=1, keepdims=True)
+            scores = np.where(mask, 1.0 / sizes[:, np.newaxis], 0.0)
+            transition_t = transition.transpose(0, 2, 1)
+            for _ in range(ITERATIONS):
+                scores = (1 - DAMPING) * teleport + DAMPING * (transition_t @ scores[:, :, np.newaxis])[:, :, 0]
+        return [row[:size] for row, size in zip(scores, sizes)]
+
+    def summarize(self, title: str, content: str, method: str = None) -> str:
+        """Top-scoring sentences in article order, within max_length; always at least one sentence"""
+        return self.summarize_many([{"title": title, "content": content}], method)[0]
+
+    def summarize_many(self, articles: List[dict], method: str = None) -> List[str]:
+        """Summaries for a batch of {title, content} articles, scored together in one set of matrix operations"""
+        self.summaries += len(articles)
+        summaries = []
+        scored = []
+        for article in articles:
+            sentences = split_sentences(article["content"])
+            if not sentences:
+                summaries.append(article["title"] or "This article discusses important developments in the news.")
+            elif len(sentences) == 1:
+                summaries.append(sentences[0])
+            else:
+                scored.append((len(summaries), article["title"] or "", sentences))
+                summaries.append(None)
+
+        if scored:
+            all_scores = self.score_many([(title, sentences) for _, title, sentences in scored], method or self.method)
+            for (index, _, sentences), scores in zip(scored, all_scores):
+                summaries[index] = self._select(sentences, scores)
+        return summaries
+
+    def _select(self, sentences: List[str], scores: np.ndarray) -> str:
+        """Top-scoring sentences in article order, within max_length"""
+        chosen = []
+        length = 0
+        for index in np.argsort(-scores, kind="stable"):
+            sentence = sentences[index]
+            if chosen and length + 1 + len(sentence) > self.max_length:
+                continue
+            chosen.append(index)
+            length += len(sentence) + (1 if length else 0)
+            if length >= self.max_length:
+                break
+        return " ".join(sentences[index] for index in sorted(chosen))
+
+# Global instance
+extractive_summarizer = ExtractiveSummarizer()
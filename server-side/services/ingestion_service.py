@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from config import settings
+from models import ArticleFilter, DateRangeEnum, RegionEnum, TopicEnum
+from services.database_service import db_service
+from services.news_service import news_service
+from services.summary_pipeline import summary_pipeline
+
+logger = logging.getLogger(__name__)
+
+# Lease name in scheduler_leases; one worker per deployment ingests
+INGESTION_LEASE = "ingestion"
+
+class IngestionService:
+    """Periodically pulls every topic/region combination from NewsAPI into RDS"""
+
+    def __init__(self):
+        self.interval_seconds = self._interval_seconds(len(self._combinations()))
+        self.concurrency = settings.INGESTION_CONCURRENCY
+        self.page_size = settings.INGESTION_PAGE_SIZE
+        self.worker_id = str(uuid.uuid4())
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+        self.last_cycle: Optional[dict] = None
+        self.cycles_completed = 0
+
+    def _combinations(self) -> List[tuple]:
+        """(region, topic) pairs covering every NewsAPI request the request path can map to"""
+        regions = [RegionEnum.GLOBAL] + [RegionEnum(region) for region in news_service.region_codes]
+        # Topics sharing a NewsAPI category fetch the same articles, which the url upsert keeps under the first
+        topics = {}
+        for topic, category in news_service.topic_categories.items():
+            topics.setdefault(category, topic)
+        return [(region, topic) for region in regions for topic in topics.values()]
+
+    def _interval_seconds(self, combinations: int) -> float:
+        """Configured interval, stretched so a day of cycles stays within the NewsAPI request limit"""
+        interval = settings.INGESTION_INTERVAL_MINUTES * 60
+        if settings.NEWS_API_DAILY_REQUEST_LIMIT > 0:
+            interval = max(interval, 86400 * combinations / settings.NEWS_API_DAILY_REQUEST_LIMIT)
+        return interval
+
+    async def _ingest_one(self, region: RegionEnum, topic: TopicEnum, semaphore: asyncio.Semaphore, stats: dict):
+        """Fetch and persist a single region/topic combination"""
+        async with semaphore:
+            try:
+                filters = ArticleFilter(
+                    region=region,
+                    topic=topic,
+                    date_range=DateRangeEnum.TODAY,
+                    limit=self.page_size
+                )
+                articles = await news_service.fetch_from_newsapi(filters)
+                stats["articles_fetched"] += len(articles)
+
+                if articles:
+                    counts = await db_service.save_articles(articles, region=region.value)
+                    stats["articles_inserted"] += counts["inserted"]
+                    stats["articles_updated"] += counts["updated"]
+                    stats["articles_skipped"] += counts["skipped"]
+                stats["combinations_succeeded"] += 1
+
+            except Exception as e:
+                stats["combinations_failed"] += 1
+                stats["errors"].append(f"{region.value}/{topic.value}: {e}")
+                logger.error(f"❌ Ingestion failed for {region.value}/{topic.value}: {e}")
+
+    async def run_cycle(self) -> dict:
+        """Run one full ingestion cycle and return its stats"""
+        combinations = self._combinations()
+        started_at = datetime.utcnow()
+        stats = {
+            "started_at": started_at,
+            "finished_at": None,
+            "duration_seconds": 0.0,
+            "combinations": len(combinations),
+            "combinations_succeeded": 0,
+            "combinations_failed": 0,
+            "articles_fetched": 0,
+            "articles_inserted": 0,
+            "articles_updated": 0,
+            "articles_skipped": 0,
+            "errors": [],
+        }
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(
+            self._ingest_one(region, topic, semaphore, stats)
+            for region, topic in combinations
+        ))
+
+        finished_at = datetime.utcnow()
+        stats["finished_at"] = finished_at
+        stats["duration_seconds"] = round((finished_at - started_at).total_seconds(), 3)
+
+        self.last_cycle = stats
+        if stats["articles_inserted"] and settings.SUMMARY_PIPELINE_ENABLED:
+            summary_pipeline.notify()
+        self.cycles_completed += 1
+        logger.info(
+            f"✅ Ingestion cycle finished in {stats['duration_seconds']}s: "
+            f"{stats['articles_inserted']} articles inserted, {stats['combinations_failed']} failures"
+        )
+        return stats
+
+    async def _hold_lease(self) -> bool:
+        """Take or renew the ingestion lease so only one worker calls NewsAPI"""
+        try:
+            # Outlives one interval plus a cycle, so the leader keeps it between cycles
+            self.is_leader = await db_service.acquire_lease(INGESTION_LEASE, self.worker_id, self.interval_seconds * 2)
+        except Exception as e:
+            logger.warning(f"⚠️ Ingestion lease unavailable, ingesting from this worker: {e}")
+            self.is_leader = True
+        return self.is_leader
+
+    async def _run_forever(self):
+        """Scheduler loop; a failed cycle never stops the next one"""
+        while True:
+            try:
+                if await self._hold_lease():
+                    await self.run_cycle()
+            except Exception as e:
+                logger.error(f"❌ Ingestion cycle crashed: {e}")
+            # Standby workers check back often enough to take over soon after the leader's lease lapses
+            await asyncio.sleep(
+                self.interval_seconds if self.is_leader
+                else min(self.interval_seconds, settings.INGESTION_LEASE_RETRY_SECONDS)
+            )
+
+    def start(self):
+        """Start the background scheduler"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever())
+            logger.info(f"🚀 Ingestion scheduler started (every {self.interval_seconds / 60:.0f} min)")
+            if self.interval_seconds > settings.INGESTION_INTERVAL_MINUTES * 60:
+                logger.warning(
+                    f"⚠️ Ingestion interval stretched from {settings.INGESTION_INTERVAL_MINUTES} min to fit "
+                    f"{settings.NEWS_API_DAILY_REQUEST_LIMIT} NewsAPI requests/day"
+                )
+
+    async def stop(self):
+        """Stop the background scheduler and hand the lease to another worker"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            if self.is_leader:
+                try:
+                    await db_service.release_lease(INGESTION_LEASE, self.worker_id)
+                except Exception as e:
+                    logger.error(f"❌ Error releasing ingestion lease: {e}")
+                self.is_leader = False
+            logger.info("✅ Ingestion scheduler stopped")
+
+    def get_stats(self) -> dict:
+        """Scheduler status plus stats for the most recent cycle"""
+        return {
+            "enabled": settings.INGESTION_ENABLED,
+            "running": self._task is not None and not self._task.done(),
+            "interval_minutes": round(self.interval_seconds / 60, 1),
+            "daily_request_limit": settings.NEWS_API_DAILY_REQUEST_LIMIT,
+            "leader": self.is_leader,
+            "concurrency": self.concurrency,
+            "cycles_completed": self.cycles_completed,
+            "last_cycle": self.last_cycle,
+        }
+
+# Global instance
+ingestion_service = IngestionService()
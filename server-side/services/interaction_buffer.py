@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from config import settings
+from database import check_database_health
+from services.database_service import db_service
+
+logger = logging.getLogger(__name__)
+
+class InteractionBuffer:
+    """Write-behind buffer that batches view/like/share events into periodic flushes"""
+
+    def __init__(self):
+        self.flush_interval = settings.INTERACTION_FLUSH_INTERVAL_SECONDS
+        self.flush_batch_size = settings.INTERACTION_FLUSH_BATCH_SIZE
+        self.max_pending = settings.INTERACTION_MAX_PENDING
+        self._pending: List[dict] = []
+        self._flush_lock = asyncio.Lock()
+        self._size_trigger = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.events_recorded = 0
+        self.events_flushed = 0
+        self.events_dropped = 0
+        self.events_rejected = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+
+    def record(self, article_id: str, interaction_type: str, user_ip: str = None):
+        """Queue an interaction; it reaches RDS on the next flush"""
+        if len(self._pending) >= self.max_pending:
+            self.events_dropped += 1
+            return
+
+        self._pending.append({
+            "id": str(uuid.uuid4()),
+            "article_id": article_id,
+            "interaction_type": interaction_type,
+            "user_ip": user_ip,
+            "timestamp": datetime.utcnow()
+        })
+        self.events_recorded += 1
+
+        if len(self._pending) >= self.flush_batch_size:
+            self._size_trigger.set()
+
+    async def flush(self) -> int:
+        """Write everything pending in one batch; batches failed by an outage are requeued"""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            events, self._pending = self._pending, []
+            self.flushes += 1
+
+            if await db_service.record_interactions(events):
+                self.events_flushed += len(events)
+                return len(events)
+
+            self.failed_flushes += 1
+            # A reachable database refused some rows; requeueing them would fail every later flush too
+            if (await check_database_health())["status"] == "healthy":
+                written = await self._write_around_rejects(events)
+                self.events_flushed += written
+                return written
+
+            # Put the batch back in front of anything recorded meanwhile, within the cap
+            room = max(self.max_pending - len(self._pending), 0)
+            self.events_dropped += max(len(events) - room, 0)
+            self._pending = events[:room] + self._pending
+            return 0
+
+    async def _write_around_rejects(self, events: List[dict]) -> int:
+        """Bisect a refused batch, writing the halves that succeed and dropping single events that don't"""
+        if len(events) == 1:
+            self.events_rejected += 1
+            logger.warning(f"⚠️ Dropped an interaction the database refused (article {events[0]['article_id']!r})")
+            return 0
+
+        written = 0
+        middle = len(events) // 2
+        for half in (events[:middle], events[middle:]):
+            if await db_service.record_interactions(half):
+                written += len(half)
+            else:
+                written += await self._write_around_rejects(half)
+        return written
+
+    async def _run_forever(self):
+        """Flush every interval, or sooner once a full batch is waiting"""
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._size_trigger.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._size_trigger.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ Interaction flush crashed: {e}")
+
+    def start(self):
+        """Start the background flusher"""
+        if self._task is None or self._task.done():
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run_forever())
+            logger.info(f"🚀 Interaction buffer started (flush every {self.flush_interval}s)")
+
+    async def stop(self):
+        """Stop the flusher and drain pending events"""
+        if self._task:
+            # Let a flush in progress finish; cancelling it would lose the batch it took
+            self._stopping.set()
+            self._size_trigger.set()
+            await self._task
+            self._task = None
+
+        drained = await self.flush()
+        logger.info(f"✅ Interaction buffer stopped ({drained} pending events drained)")
+
+    def get_stats(self) -> dict:
+        """Buffer occupancy and flush counters"""
+        return {
+            "pending": len(self._pending),
+            "events_recorded": self.events_recorded,
+            "events_flushed": self.events_flushed,
+            "events_dropped": self.events_dropped,
+            "events_rejected": self.events_rejected,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+        }
+
+# Global instance
+interaction_buffer = InteractionBuffer()
@@ -2,17 +2,30 @@ import httpx
 import asyncio
 from datetime import datetime, timedelta
 from typing import List, Optional
+import logging
 import random
 import uuid
 
 from config import settings
 from models import Article, NewsSource, TopicEnum, ArticleFilter
+from services.cache import article_cache
 from services.database_service import db_service
+from services.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+class FallbackArticles(list):
+    """Articles served in place of a real result (mock data); never cached"""
 
 class NewsService:
     def __init__(self):
         self.base_url = settings.NEWS_API_BASE_URL
         self.api_key = settings.NEWS_API_KEY
+        self.client: Optional[httpx.AsyncClient] = None
+        self.single_flight = SingleFlight()
+        self._revalidations = set()
+        self.stale_served = 0
+        self.revalidations_started = 0
         
         # Source mappings with emojis and colors
         self.source_mappings = {
@@ -37,12 +50,116 @@ class NewsService:
             TopicEnum.SPORTS: "sports",
         }
 
+        # Region to NewsAPI country code mapping
+        self.region_codes = {
+            "US": "us",
+            "EU": "gb",  # Use UK as EU representative
+            "Asia": "jp",  # Use Japan as Asia representative
+            "Africa": "za"  # Use South Africa as Africa representative
+        }
+
+    async def start(self):
+        """Create the shared, pooled NewsAPI client"""
+        if self.client is not None:
+            return
+
+        http2 = settings.NEWS_API_HTTP2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("⚠️ h2 is not installed, falling back to HTTP/1.1 for NewsAPI")
+                http2 = False
+
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.NEWS_API_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.NEWS_API_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.NEWS_API_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                settings.NEWS_API_READ_TIMEOUT,
+                connect=settings.NEWS_API_CONNECT_TIMEOUT,
+            ),
+        )
+        logger.info(f"✅ NewsAPI client started (http2={http2})")
+
+    async def close(self):
+        """Close the shared NewsAPI client and its pooled connections"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+            logger.info("✅ NewsAPI client closed")
+
     async def fetch_news(self, filters: ArticleFilter) -> List[Article]:
+        """Fetch news for filters from the response cache, sharing one fetch per miss"""
+        key = filters.cache_key()
+        cached, age = article_cache.get_with_age(key)
+        if cached is not None:
+            if settings.SWR_ENABLED and age >= settings.SWR_SOFT_TTL_SECONDS:
+                self.stale_served += 1
+                self._revalidate(key, filters)
+            return cached
+        return await self.single_flight.do(key, lambda: self._fetch_and_cache(key, filters))
+
+    def _revalidate(self, key: str, filters: ArticleFilter):
+        """Refresh a stale cache entry in the background"""
+        # A refresh already running for this key will update the entry
+        if self.single_flight.is_in_flight(key):
+            return
+        self.revalidations_started += 1
+        task = asyncio.create_task(self.single_flight.do(key, lambda: self._fetch_and_cache(key, filters)))
+        self._revalidations.add(task)
+        task.add_done_callback(self._revalidation_done)
+
+    def _revalidation_done(self, task: asyncio.Task):
+        self._revalidations.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"❌ Background revalidation failed: {task.exception()}")
+
+    def get_swr_stats(self) -> dict:
+        """Stale-while-revalidate windows and counters"""
+        return {
+            "enabled": settings.SWR_ENABLED,
+            "soft_ttl_seconds": settings.SWR_SOFT_TTL_SECONDS,
+            "hard_ttl_seconds": settings.SWR_HARD_TTL_SECONDS,
+            "stale_served": self.stale_served,
+            "revalidations_started": self.revalidations_started,
+            "revalidations_in_flight": len(self._revalidations),
+        }
+
+    async def _fetch_and_cache(self, key: str, filters: ArticleFilter) -> List[Article]:
+        """Fetch articles and cache them; if new rows landed in the meantime they are cached as already stale"""
+        generation = article_cache.generation
+        articles = await self._fetch_news(filters)
+        if not isinstance(articles, FallbackArticles):
+            article_cache.set(
+                key, articles, generation=generation,
+                stale_age=settings.SWR_SOFT_TTL_SECONDS if settings.SWR_ENABLED else None
+            )
+        return articles
+
+    async def _fetch_news(self, filters: ArticleFilter) -> List[Article]:
         """Fetch news from NewsAPI and RDS based on filters"""
         try:
             # First, try to get articles from RDS database
             db_articles = await db_service.get_articles_from_db(filters)
             
+            # Cursor pages only exist in RDS; NewsAPI has no equivalent
+            if filters.cursor:
+                return db_articles
+            
+            # The ingestion scheduler keeps RDS warm, so the request path never waits on NewsAPI
+            if settings.INGESTION_ENABLED:
+                # A filter that matches nothing is a real, empty result; mock data only
+                # stands in until the first ingestion run has stored anything
+                if db_articles or await db_service.has_articles():
+                    return db_articles
+                logger.warning("⚠️ No ingested articles yet, serving mock articles")
+                return await self._get_mock_articles(filters)
+            
             # If we have enough articles from DB and they're recent, return them
             if len(db_articles) >= filters.limit:
                 recent_threshold = datetime.now() - timedelta(hours=1)
@@ -52,73 +169,84 @@ class NewsService:
                     return db_articles
         
             # Fetch fresh articles from NewsAPI
-            async with httpx.AsyncClient() as client:
-                # Build query parameters
-                params = {
-                    "apiKey": self.api_key,
-                    "pageSize": min(filters.limit, settings.MAX_ARTICLES_PER_REQUEST),
-                    "page": filters.page,
-                    "sortBy": "publishedAt",
-                    "language": "en"
-                }
-                
-                # Add category filter
-                if filters.topic and filters.topic != "All":
-                    category = self.topic_categories.get(filters.topic, "general")
-                    params["category"] = category
-                
-                # Add date range
-                if filters.date_range:
-                    from_date = self._get_date_from_range(filters.date_range)
-                    params["from"] = from_date.isoformat()
-                
-                # Add search query
-                if filters.search_query:
-                    params["q"] = filters.search_query
-                
-                # Add region/country filter
-                if filters.region and filters.region != "Global":
-                    country_code = self._get_country_code(filters.region)
-                    params["country"] = country_code
-                    endpoint = f"{self.base_url}/top-headlines"
-                else:
-                    endpoint = f"{self.base_url}/everything"
-                
-                # Make API request
-                response = await client.get(endpoint, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                articles = []
-                
-                for article_data in data.get("articles", []):
-                    if not article_data.get("title") or article_data["title"] == "[Removed]":
-                        continue
-                    
-                    article = self._convert_to_article(article_data, filters.topic)
-                    articles.append(article)
-                
-                # After getting articles from NewsAPI, save them to RDS
-                if articles:
-                    await db_service.save_articles(articles)
-            
-                # Combine with DB articles if needed
-                if db_articles:
-                    # Remove duplicates and combine
-                    existing_urls = {str(a.url) for a in articles}
-                    unique_db_articles = [a for a in db_articles if str(a.url) not in existing_urls]
-                    articles.extend(unique_db_articles[:filters.limit - len(articles)])
+            articles = await self.fetch_from_newsapi(filters)
             
-                return articles[:filters.limit]
+            # After getting articles from NewsAPI, save them to RDS
+            if articles:
+                await db_service.save_articles(articles)
+        
+            # Combine with DB articles if needed
+            if db_articles:
+                # Remove duplicates and combine
+                existing_urls = {str(a.url) for a in articles}
+                unique_db_articles = [a for a in db_articles if str(a.url) not in existing_urls]
+                articles.extend(unique_db_articles[:filters.limit - len(articles)])
+        
+            return articles[:filters.limit]
             
         except Exception as e:
             print(f"Error fetching news: {e}")
-            # Fallback to database articles or mock data
+            # Fallback to database articles or mock data; neither is cached, so the
+            # next request retries instead of serving this for the whole TTL
             db_articles = await db_service.get_articles_from_db(filters)
-            if db_articles:
-                return db_articles
+            if db_articles or filters.cursor:
+                return FallbackArticles(db_articles)
             return await self._get_mock_articles(filters)
 
+    async def fetch_from_newsapi(self, filters: ArticleFilter) -> List[Article]:
+        """Fetch articles from NewsAPI for the given filters"""
+        # Build query parameters
+        params = {
+            "apiKey": self.api_key,
+            "pageSize": min(filters.limit, settings.MAX_ARTICLES_PER_REQUEST),
+            "page": filters.page,
+        }
+        
+        category = None
+        if filters.topic and filters.topic != "All":
+            category = self.topic_categories.get(filters.topic, "general")
+        
+        if filters.region and filters.region != "Global":
+            # A country's top headlines, optionally narrowed by category and query
+            endpoint = "/top-headlines"
+            params["country"] = self._get_country_code(filters.region)
+            if category:
+                params["category"] = category
+            if filters.search_query:
+                params["q"] = filters.search_query
+        elif filters.search_query:
+            # /everything requires q and has no category filter
+            endpoint = "/everything"
+            params["q"] = filters.search_query
+            params["sortBy"] = "publishedAt"
+            params["language"] = "en"
+            if filters.date_range:
+                params["from"] = self._get_date_from_range(filters.date_range).isoformat()
+        else:
+            # Global headlines: a category across every country
+            endpoint = "/top-headlines"
+            params["category"] = category or "general"
+        
+        # Scripts that skip the app lifespan still get a pooled client
+        if self.client is None:
+            await self.start()
+        
+        # Make API request over the shared keep-alive pool
+        response = await self.client.get(endpoint, params=params)
+        response.raise_for_status()
+        
+        data = response.json()
+        articles = []
+        
+        for article_data in data.get("articles", []):
+            if not article_data.get("title") or article_data["title"] == "[Removed]":
+                continue
+            
+            article = self._convert_to_article(article_data, filters.topic)
+            articles.append(article)
+        
+        return articles
+
     async def _get_mock_articles(self, filters: ArticleFilter) -> List[Article]:
         """Generate mock articles for development/fallback"""
         mock_articles = [
@@ -172,10 +300,15 @@ class NewsService:
             }
         ]
         
-        articles = []
+        search = (filters.search_query or "").lower()
+        articles = FallbackArticles()
         for i, mock_data in enumerate(mock_articles):
             if filters.topic and filters.topic != mock_data["topic"]:
                 continue
+            if filters.source and filters.source.lower() != mock_data["source"].lower():
+                continue
+            if search and search not in f"{mock_data['title']} {mock_data['content']}".lower():
+                continue
                 
             source_info = self.source_mappings.get(
                 mock_data["source"].lower().replace(" ", "-"),
@@ -183,7 +316,8 @@ class NewsService:
             )
             
             article = Article(
-                id=str(uuid.uuid4()),
+                # Stable across requests, though never stored
+                id=str(uuid.uuid5(uuid.NAMESPACE_URL, mock_data["url"])),
                 title=mock_data["title"],
                 source=NewsSource(
                     name=mock_data["source"],
@@ -200,7 +334,7 @@ class NewsService:
             )
             articles.append(article)
         
-        return articles[:filters.limit]
+        return FallbackArticles(articles[:filters.limit])
 
     def _convert_to_article(self, article_data: dict, topic_filter: Optional[TopicEnum]) -> Article:
         """Convert NewsAPI article data to our Article model"""
@@ -268,13 +402,7 @@ class NewsService:
 
     def _get_country_code(self, region: str) -> str:
         """Convert region to country code"""
-        region_codes = {
-            "US": "us",
-            "EU": "gb",  # Use UK as EU representative
-            "Asia": "jp",  # Use Japan as Asia representative
-            "Africa": "za"  # Use South Africa as Africa representative
-        }
-        return region_codes.get(region, "us")
+        return self.region_codes.get(region, "us")
 
 # Global instance
 news_service = NewsService()
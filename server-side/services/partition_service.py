@@ -0,0 +1,280 @@
+import asyncio
+import logging
+import re
+from datetime import datetime
+from typing import List, Optional
+
+from config import settings
+from database import ArticleDB, get_async_db
+from services.cache import article_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARTITION = "articles_default"
+ARCHIVE_TABLE = "articles_archive"
+
+# Monthly partitions are named articles_yYYYYmMM
+PARTITION_NAME_PATTERN = re.compile(r"^articles_y(\d{4})m(\d{2})$")
+
+# Stored (non-generated) article columns, in model order
+ARTICLE_COLUMNS = [column.name for column in ArticleDB.__table__.columns]
+
+def month_start(value: datetime) -> datetime:
+    """First instant of the month containing value"""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months"""
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+def partition_name(month: datetime) -> str:
+    return f"articles_y{month:%Y}m{month:%m}"
+
+def partition_month(name: str) -> Optional[datetime]:
+    """Month covered by a monthly partition, or None for other tables"""
+    match = PARTITION_NAME_PATTERN.match(name)
+    if not match:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+class PartitionService:
+    """Keeps the PostgreSQL articles table split into monthly partitions and enforces retention"""
+
+    def __init__(self):
+        self.db = None
+        self._task: Optional[asyncio.Task] = None
+        self.last_run: Optional[dict] = None
+        self.partitions_created = 0
+        self.partitions_retired = 0
+
+    async def _connect(self):
+        if not self.db:
+            self.db = await get_async_db()
+        if not self.db.is_connected:
+            await self.db.connect()
+
+    async def is_partitioned(self) -> bool:
+        """Whether articles is a partitioned (parent) table"""
+        await self._connect()
+        row = await self.db.fetch_one("""
+            SELECT EXISTS (
+                SELECT 1 FROM pg_partitioned_table p
+                JOIN pg_class c ON c.oid = p.partrelid
+                WHERE c.relname = 'articles' AND c.relnamespace = 'public'::regnamespace
+            ) AS partitioned
+        """)
+        return bool(row["partitioned"])
+
+    async def list_partitions(self) -> List[dict]:
+        """Attached partitions of articles with their month and approximate row count"""
+        await self._connect()
+        rows = await self.db.fetch_all("""
+            SELECT c.relname AS name, c.reltuples::bigint AS approximate_rows
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class parent ON parent.oid = i.inhparent
+            WHERE parent.relname = 'articles'
+            ORDER BY c.relname
+        """)
+        return [
+            {
+                "name": row["name"],
+                "month": partition_month(row["name"]),
+                "approximate_rows": max(int(row["approximate_rows"]), 0),
+            }
+            for row in rows
+        ]
+
+    async def create_partition(self, month: datetime) -> bool:
+        """Create the partition for one month; returns False if it already exists"""
+        name = partition_name(month)
+        start, end = month, add_months(month, 1)
+        bounds = f"FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+        range_condition = f"published_at >= '{start:%Y-%m-%d}' AND published_at < '{end:%Y-%m-%d}'"
+
+        async with self.db.transaction():
+            # Workers starting together all run this; serialize them per partition so
+            # only one creates it and the rest see it as already present
+            await self.db.execute("SELECT pg_advisory_xact_lock(hashtext(:name))", {"name": name})
+            existing = await self.db.fetch_one(
+                "SELECT to_regclass(:name) IS NOT NULL AS present", {"name": name}
+            )
+            if existing["present"]:
+                return False
+
+            has_default = await self.db.fetch_one(
+                "SELECT to_regclass(:name) IS NOT NULL AS present", {"name": DEFAULT_PARTITION}
+            )
+            stray = None
+            if has_default["present"]:
+                stray = await self.db.fetch_one(
+                    f"SELECT 1 AS found FROM {DEFAULT_PARTITION} WHERE {range_condition} LIMIT 1"
+                )
+
+            if not stray:
+                await self.db.execute(f"CREATE TABLE {name} PARTITION OF articles FOR VALUES {bounds}")
+            else:
+                # Rows for this month already landed in the default partition; move them
+                # into a standalone table first, since the new range can't overlap them
+                columns = ", ".join(ARTICLE_COLUMNS)
+                await self.db.execute(
+                    f"CREATE TABLE {name} (LIKE articles INCLUDING DEFAULTS INCLUDING GENERATED)"
+                )
+                await self.db.execute(
+                    f"INSERT INTO {name} ({columns}) SELECT {columns} FROM {DEFAULT_PARTITION} WHERE {range_condition}"
+                )
+                await self.db.execute(f"DELETE FROM {DEFAULT_PARTITION} WHERE {range_condition}")
+                await self.db.execute(f"ALTER TABLE articles ATTACH PARTITION {name} FOR VALUES {bounds}")
+
+        self.partitions_created += 1
+        logger.info(f"✅ Created article partition {name}")
+        return True
+
+    async def ensure_partitions(self, first_month: Optional[datetime] = None) -> List[str]:
+        """Create partitions from first_month (default: this month) through the look-ahead window"""
+        await self._connect()
+        current = month_start(datetime.utcnow())
+        month = month_start(first_month) if first_month else current
+        last = add_months(current, settings.ARTICLE_PARTITION_MONTHS_AHEAD)
+
+        created = []
+        while month <= last:
+            if await self.create_partition(month):
+                created.append(partition_name(month))
+            month = add_months(month, 1)
+
+        await self.db.execute(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF articles DEFAULT")
+        return created
+
+    async def _ensure_archive_table(self):
+        """Unindexed, compressed table that retired partitions are folded into"""
+        await self.db.execute(f"CREATE TABLE IF NOT EXISTS {ARCHIVE_TABLE} (LIKE articles INCLUDING DEFAULTS)")
+        # LIKE copies the search column as a plain tsvector; archived rows aren't searchable
+        await self.db.execute(f"ALTER TABLE {ARCHIVE_TABLE} DROP COLUMN IF EXISTS search_vector")
+
+        version = await self.db.fetch_one("SELECT current_setting('server_version_num')::int AS version")
+        if version["version"] >= 140000:
+            for column in ("title", "original_excerpt", "summary"):
+                await self.db.execute(f"ALTER TABLE {ARCHIVE_TABLE} ALTER COLUMN {column} SET COMPRESSION lz4")
+        # TOAST (and compress) anything over ~128 bytes instead of the default ~2 KB
+        await self.db.execute(f"ALTER TABLE {ARCHIVE_TABLE} SET (toast_tuple_target = 128)")
+
+    async def apply_retention(self, mode: Optional[str] = None, dry_run: bool = False) -> dict:
+        """Retire partitions older than the retention window"""
+        await self._connect()
+        mode = mode or settings.ARTICLE_RETENTION_MODE
+        result = {"mode": mode, "cutoff": None, "retired": [], "archived_rows": 0, "dry_run": dry_run}
+        if settings.ARTICLE_RETENTION_MONTHS <= 0:
+            return result
+
+        cutoff = add_months(month_start(datetime.utcnow()), -settings.ARTICLE_RETENTION_MONTHS)
+        result["cutoff"] = cutoff
+        expired = [
+            partition["name"] for partition in await self.list_partitions()
+            if partition["month"] and partition["month"] < cutoff
+        ]
+        if dry_run:
+            result["retired"] = expired
+            return result
+
+        if mode == "archive":
+            await self._ensure_archive_table()
+        columns = ", ".join(ARTICLE_COLUMNS)
+
+        for name in expired:
+            async with self.db.transaction():
+                await self.db.execute(f"ALTER TABLE articles DETACH PARTITION {name}")
+                if mode == "archive":
+                    archived = await self.db.fetch_one(f"""
+                        WITH moved AS (
+                            INSERT INTO {ARCHIVE_TABLE} ({columns}) SELECT {columns} FROM {name}
+                            RETURNING 1
+                        )
+                        SELECT COUNT(*) AS count FROM moved
+                    """)
+                    result["archived_rows"] += archived["count"]
+                    await self.db.execute(f"DROP TABLE {name}")
+            result["retired"].append(name)
+            self.partitions_retired += 1
+            logger.info(f"🗄️ Retired article partition {name} ({mode})")
+
+        async with self.db.transaction():
+            if mode == "archive":
+                # Old rows that fell into the default partition are archived too
+                archived = await self.db.fetch_one(f"""
+                    WITH moved AS (
+                        DELETE FROM {DEFAULT_PARTITION} WHERE published_at < :cutoff
+                        RETURNING {columns}
+                    ), archived AS (
+                        INSERT INTO {ARCHIVE_TABLE} ({columns}) SELECT {columns} FROM moved
+                        RETURNING 1
+                    )
+                    SELECT COUNT(*) AS count FROM archived
+                """, {"cutoff": cutoff})
+                result["archived_rows"] += archived["count"]
+
+            # Keep the statistics rollup consistent with the live table
+            await self.db.execute("DELETE FROM article_stats_hourly WHERE bucket_hour < :cutoff", {"cutoff": cutoff})
+
+        if result["retired"] or result["archived_rows"]:
+            article_cache.invalidate()
+        return result
+
+    async def run_maintenance(self) -> dict:
+        """Create upcoming partitions, then apply retention"""
+        started_at = datetime.utcnow()
+        created = await self.ensure_partitions()
+        retention = await self.apply_retention()
+        self.last_run = {
+            "started_at": started_at,
+            "duration_seconds": round((datetime.utcnow() - started_at).total_seconds(), 3),
+            "created": created,
+            "retention": retention,
+        }
+        return self.last_run
+
+    async def _run_forever(self):
+        """Maintenance loop; a failed run never stops the next one"""
+        while True:
+            try:
+                await self.run_maintenance()
+            except Exception as e:
+                logger.error(f"❌ Partition maintenance failed: {e}")
+            await asyncio.sleep(settings.PARTITION_MAINTENANCE_INTERVAL_HOURS * 3600)
+
+    def start(self):
+        """Start the background maintenance loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever())
+            logger.info(f"🚀 Partition maintenance started (every {settings.PARTITION_MAINTENANCE_INTERVAL_HOURS} h)")
+
+    async def stop(self):
+        """Stop the background maintenance loop"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("✅ Partition maintenance stopped")
+
+    async def get_stats(self) -> dict:
+        """Partition layout plus the most recent maintenance run"""
+        stats = {
+            "enabled": settings.ARTICLE_PARTITIONING_ENABLED,
+            "running": self._task is not None and not self._task.done(),
+            "months_ahead": settings.ARTICLE_PARTITION_MONTHS_AHEAD,
+            "retention_months": settings.ARTICLE_RETENTION_MONTHS,
+            "retention_mode": settings.ARTICLE_RETENTION_MODE,
+            "partitions_created": self.partitions_created,
+            "partitions_retired": self.partitions_retired,
+            "last_run": self.last_run,
+        }
+        if settings.ARTICLE_PARTITIONING_ENABLED:
+            stats["partitions"] = await self.list_partitions()
+        return stats
+
+# Global instance
+partition_service = PartitionService()
@@ -0,0 +1,277 @@
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from threading import Lock
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Latency histogram upper bounds in milliseconds; the last bucket is open-ended
+LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float("inf")]
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+# Multi-row statements name their parameters :column_0, :column_1, ...
+NUMBERED_PARAMETER = re.compile(r":([A-Za-z_]\w*?)_\d+\b")
+REPEATED_TUPLE = re.compile(r"(\([^()]*\))(?:\s*,\s*\1)+")
+REPEATED_PARAMETER = re.compile(r"(:\w+)(?:\s*,\s*\1)+")
+WHITESPACE = re.compile(r"\s+")
+
+def fingerprint_sql(query: str) -> str:
+    """Statement shape with literals masked and batch sizes collapsed"""
+    shape = STRING_LITERAL.sub("?", query)
+    shape = NUMBERED_PARAMETER.sub(r":\1_N", shape)
+    shape = NUMBER_LITERAL.sub("?", shape)
+    shape = WHITESPACE.sub(" ", shape).strip()
+    shape = REPEATED_TUPLE.sub(r"\1, ...", shape)
+    return REPEATED_PARAMETER.sub(r"\1, ...", shape)
+
+def _slow_query_logger() -> logging.Logger:
+    """Dedicated logger writing slow queries to a size-rotated file"""
+    slow_logger = logging.getLogger("slow_queries")
+    if not slow_logger.handlers and settings.SLOW_QUERY_LOG_FILE:
+        path = Path(settings.SLOW_QUERY_LOG_FILE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handler = RotatingFileHandler(
+            path,
+            maxBytes=settings.SLOW_QUERY_LOG_MAX_BYTES,
+            backupCount=settings.SLOW_QUERY_LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        slow_logger.addHandler(handler)
+        slow_logger.setLevel(logging.INFO)
+        slow_logger.propagate = False
+    return slow_logger
+
+class QueryStats:
+    """Running totals and latency histogram for one statement fingerprint"""
+
+    def __init__(self, fingerprint: str, statement: str):
+        self.fingerprint = fingerprint
+        self.statement = statement
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.slow_calls = 0
+        self.errors = 0
+        self.histogram = [0] * len(LATENCY_BUCKETS_MS)
+        self.targets: Dict[str, int] = {}
+        self.last_seen: Optional[datetime] = None
+        self.last_explained = float("-inf")
+
+    def record(self, target: str, elapsed_ms: float, rows: Optional[int], failed: bool):
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += rows or 0
+        self.errors += int(failed)
+        self.targets[target] = self.targets.get(target, 0) + 1
+        self.last_seen = datetime.utcnow()
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.histogram[i] += 1
+                break
+
+    def percentile_ms(self, fraction: float) -> float:
+        """Upper bound of the histogram bucket holding the given percentile"""
+        threshold = self.calls * fraction
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.histogram):
+            seen += count
+            if seen >= threshold and count:
+                return self.max_ms if bound == float("inf") else min(bound, self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> dict:
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.statement,
+            "calls": self.calls,
+            "errors": self.errors,
+            "slow_calls": self.slow_calls,
+            "rows": self.rows,
+            "rows_per_call": round(self.rows / self.calls, 2) if self.calls else 0.0,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "p50_ms": round(self.percentile_ms(0.5), 3),
+            "p95_ms": round(self.percentile_ms(0.95), 3),
+            "p99_ms": round(self.percentile_ms(0.99), 3),
+            "max_ms": round(self.max_ms, 3),
+            "histogram_ms": {
+                ("inf" if bound == float("inf") else str(bound)): count
+                for bound, count in zip(LATENCY_BUCKETS_MS, self.histogram)
+            },
+            "targets": self.targets,
+            "last_seen": self.last_seen,
+        }
+
+class QueryLog:
+    """Per-fingerprint query timing, plus a slow-query log with EXPLAIN plans"""
+
+    def __init__(self):
+        self._stats: Dict[str, QueryStats] = {}
+        self._lock = Lock()
+        self._explain_tasks: set = set()
+        self.slow_queries = deque(maxlen=settings.SLOW_QUERY_RECENT_LIMIT)
+        self.threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+        self.dropped_fingerprints = 0
+        self._slow_logger = None
+
+    async def run(
+        self,
+        target: str,
+        method: str,
+        query,
+        values,
+        execute: Callable[[], Awaitable],
+        explain: Callable[[str, Optional[dict]], Awaitable[list]],
+    ):
+        """Execute a statement through execute() and record how it went"""
+        if not settings.QUERY_LOG_ENABLED:
+            return await execute()
+
+        start = time.perf_counter()
+        result = None
+        failed = False
+        try:
+            result = await execute()
+            return result
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.record(target, method, query, values, result, elapsed_ms, failed, explain)
+
+    def record(self, target: str, method: str, query, values, result, elapsed_ms: float, failed: bool, explain):
+        statement = query if isinstance(query, str) else str(query)
+        shape = fingerprint_sql(statement)
+        fingerprint = hashlib.sha1(shape.encode()).hexdigest()[:12]
+
+        if method == "fetch_all":
+            rows = len(result) if result is not None else 0
+        elif method == "fetch_one":
+            rows = int(result is not None)
+        elif method == "execute_many":
+            rows = len(values or [])
+        else:
+            rows = None  # databases doesn't report affected rows
+
+        with self._lock:
+            stats = self._stats.get(fingerprint)
+            if stats is None:
+                if len(self._stats) >= settings.QUERY_LOG_MAX_FINGERPRINTS:
+                    self.dropped_fingerprints += 1
+                    return
+                stats = self._stats[fingerprint] = QueryStats(fingerprint, shape[:2000])
+            stats.record(target, elapsed_ms, rows, failed)
+
+            if elapsed_ms < self.threshold_ms:
+                return
+            stats.slow_calls += 1
+            explain_due = (
+                settings.SLOW_QUERY_EXPLAIN
+                and isinstance(query, str)
+                and method != "execute_many"
+                and time.monotonic() - stats.last_explained >= settings.SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS
+            )
+            if explain_due:
+                stats.last_explained = time.monotonic()
+
+        entry = {
+            "fingerprint": fingerprint,
+            "statement": shape[:2000],
+            "target": target,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "rows": rows,
+            "failed": failed,
+            "at": datetime.utcnow(),
+            "plan": None,
+        }
+        self.slow_queries.append(entry)
+
+        if explain_due:
+            # Plan in the background so the slow request isn't made slower still
+            task = asyncio.ensure_future(self._explain(entry, explain, statement, values))
+            self._explain_tasks.add(task)
+            task.add_done_callback(self._explain_tasks.discard)
+        else:
+            self._write(entry)
+
+    async def _explain(self, entry: dict, explain, statement: str, values):
+        try:
+            plan = await explain(f"{self.explain_prefix(statement)} {statement}", values)
+            entry["plan"] = "\n".join(plan)
+        except Exception as e:
+            entry["plan"] = f"EXPLAIN failed: {e}"
+        self._write(entry)
+
+    def explain_prefix(self, statement: str) -> str:
+        """EXPLAIN flavour for a statement; writes are planned but never re-executed"""
+        read_only = statement.lstrip().upper().startswith(("SELECT", "WITH")) and not re.search(
+            r"\b(INSERT|UPDATE|DELETE)\b", statement, re.IGNORECASE
+        )
+        if not read_only:
+            return "EXPLAIN"
+        if settings.DB_TYPE == "mysql":
+            return "EXPLAIN ANALYZE"
+        return "EXPLAIN (ANALYZE, BUFFERS)"
+
+    def _write(self, entry: dict):
+        if self._slow_logger is None:
+            self._slow_logger = _slow_query_logger()
+        message = (
+            f"slow query {entry['fingerprint']} on {entry['target']}: {entry['elapsed_ms']} ms, "
+            f"{'?' if entry['rows'] is None else entry['rows']} rows"
+            f"{' (failed)' if entry['failed'] else ''}\n  {entry['statement']}"
+        )
+        if entry["plan"]:
+            message += "\n" + "\n".join(f"    {line}" for line in entry["plan"].splitlines())
+        self._slow_logger.info(message)
+        logger.warning(f"🐢 Slow query {entry['fingerprint']} on {entry['target']}: {entry['elapsed_ms']} ms")
+
+    def top(self, sort: str = "total_ms", limit: int = 20) -> List[dict]:
+        """Fingerprints ordered by total_ms, mean_ms, p95_ms, max_ms, calls or slow_calls"""
+        with self._lock:
+            entries = [stats.as_dict() for stats in self._stats.values()]
+        entries.sort(key=lambda entry: entry.get(sort, 0), reverse=True)
+        return entries[:limit]
+
+    def recent_slow(self, limit: int = 50) -> List[dict]:
+        """Most recent slow queries first, with plans once captured"""
+        return list(self.slow_queries)[::-1][:limit]
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self.slow_queries.clear()
+            self.dropped_fingerprints = 0
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            calls = sum(stats.calls for stats in self._stats.values())
+            slow_calls = sum(stats.slow_calls for stats in self._stats.values())
+            fingerprints = len(self._stats)
+        return {
+            "enabled": settings.QUERY_LOG_ENABLED,
+            "threshold_ms": self.threshold_ms,
+            "explain": settings.SLOW_QUERY_EXPLAIN,
+            "log_file": settings.SLOW_QUERY_LOG_FILE,
+            "fingerprints": fingerprints,
+            "dropped_fingerprints": self.dropped_fingerprints,
+            "calls": calls,
+            "slow_calls": slow_calls,
+        }
+
+# Global instance
+query_log = QueryLog()
@@ -0,0 +1,47 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key onto one in-flight task"""
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn for key, or join the call already running for it"""
+        self.calls += 1
+        task = self._in_flight.get(key)
+
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+
+        # Shield so one caller going away doesn't cancel the work for the rest
+        return await asyncio.shield(task)
+
+    def is_in_flight(self, key: Hashable) -> bool:
+        """Whether a call for key is currently running"""
+        return key in self._in_flight
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counters for how much work was shared between callers"""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import List, Optional
+
+from config import settings
+from services.ai_service import ENGINE_EXTRACTIVE, PRIORITY_LOW
+from services.database_service import db_service
+from services.summary_store import summary_store
+
+logger = logging.getLogger(__name__)
+
+# Window for the recent throughput rate
+THROUGHPUT_WINDOW_SECONDS = 300
+
+class SummaryPipeline:
+    """Summarizes newly saved articles in the background from a leased summary_jobs queue"""
+
+    def __init__(self):
+        self.workers = settings.SUMMARY_PIPELINE_WORKERS
+        self.batch_size = settings.SUMMARY_PIPELINE_BATCH_SIZE
+        self.concurrency = settings.SUMMARY_PIPELINE_CONCURRENCY
+        self.poll_seconds = settings.SUMMARY_PIPELINE_POLL_SECONDS
+        self._tasks: List[asyncio.Task] = []
+        self._enqueue_trigger = asyncio.Event()
+        self._work_available = asyncio.Event()
+        self._completions = deque()
+        self._queue_waits = deque(maxlen=1000)
+        self.enqueued = 0
+        self.batches = 0
+        self.completed = 0
+        self.skipped = 0
+        self.failed = 0
+        self.last_enqueue: Optional[datetime] = None
+
+    def notify(self):
+        """Enqueue new articles now instead of at the next poll"""
+        self._enqueue_trigger.set()
+
+    async def enqueue(self) -> int:
+        """Queue recent unsummarized articles and wake idle workers"""
+        count = await db_service.enqueue_summary_jobs()
+        self.enqueued += count
+        self.last_enqueue = datetime.utcnow()
+        if count:
+            self._work_available.set()
+        return count
+
+    async def process_batch(self) -> int:
+        """Lease, summarize and write back one batch; returns how many jobs it leased"""
+        token, jobs = await db_service.lease_summary_jobs(self.batch_size)
+        if not jobs:
+            return 0
+        self.batches += 1
+
+        # Articles deleted or summarized by a reader since they were queued just leave the queue;
+        # extractive summaries stay pending so the model can replace them
+        pending = [
+            job for job in jobs
+            if job["title"] is not None and (job["summary"] is None or job["summary_engine"] == ENGINE_EXTRACTIVE)
+        ]
+        # Trending articles get model summaries; the long tail may be summarized locally
+        results = await summary_store.summarize_many(
+            [
+                {
+                    "title": job["title"],
+                    "content": job["original_excerpt"],
+                    "article_id": job["article_id"],
+                    "priority": None if job["priority"] else PRIORITY_LOW,
+                }
+                for job in pending
+            ],
+            concurrency=self.concurrency,
+            link_articles=False,
+        )
+
+        summaries = {}
+        errors = {}
+        for job, result in zip(pending, results):
+            if result["error"]:
+                errors[job["article_id"]] = result["error"]
+            else:
+                # A degraded model serves trending articles extractively too; they're queued
+                # again for a model summary without spending an attempt
+                summaries[job["article_id"]] = (result["summary"], result["engine"])
+
+        done = [job for job in jobs if job["article_id"] not in errors]
+        failed = [job for job in jobs if job["article_id"] in errors]
+        await db_service.complete_summary_jobs(token, done, summaries)
+        await db_service.fail_summary_jobs(token, failed, errors)
+
+        now = datetime.utcnow()
+        for job in done:
+            self._queue_waits.append((now - job["enqueued_at"]).total_seconds())
+        self._completions.append((time.monotonic(), len(summaries)))
+        self.completed += len(summaries)
+        self.skipped += len(done) - len(summaries)
+        self.failed += len(failed)
+        return len(jobs)
+
+    async def _work_forever(self, worker: int):
+        """Drain the queue batch by batch, then wait for new work"""
+        while True:
+            try:
+                leased = await self.process_batch()
+            except Exception as e:
+                logger.error(f"❌ Summary worker {worker} batch failed: {e}")
+                leased = 0
+
+            if leased == 0:
+                try:
+                    await asyncio.wait_for(self._work_available.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._work_available.clear()
+
+    async def _enqueue_forever(self):
+        """Enqueue every poll interval, or sooner when ingestion saves new articles"""
+        while True:
+            try:
+                count = await self.enqueue()
+                if count:
+                    logger.info(f"📬 Queued {count} articles for background summaries")
+            except Exception as e:
+                logger.error(f"❌ Summary enqueue failed: {e}")
+
+            try:
+                await asyncio.wait_for(self._enqueue_trigger.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._enqueue_trigger.clear()
+
+    def start(self):
+        """Start the enqueue loop and the worker pool"""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._enqueue_forever())] + [
+                asyncio.create_task(self._work_forever(worker)) for worker in range(self.workers)
+            ]
+            logger.info(f"🚀 Summary pipeline started ({self.workers} workers, batches of {self.batch_size})")
+
+    async def stop(self):
+        """Stop the pipeline; leases held by interrupted batches expire and are retried"""
+        if self._tasks:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+            logger.info("✅ Summary pipeline stopped")
+
+    def _recent_completions(self) -> int:
+        cutoff = time.monotonic() - THROUGHPUT_WINDOW_SECONDS
+        while self._completions and self._completions[0][0] < cutoff:
+            self._completions.popleft()
+        return sum(count for _, count in self._completions)
+
+    async def get_stats(self) -> dict:
+        """Queue depth by state, throughput and how long articles wait for a summary"""
+        try:
+            depth = await db_service.get_summary_queue_depth()
+        except Exception as e:
+            depth = {"error": str(e)}
+
+        waits = sorted(self._queue_waits)
+        return {
+            "enabled": settings.SUMMARY_PIPELINE_ENABLED,
+            "running": bool(self._tasks) and not all(task.done() for task in self._tasks),
+            "workers": self.workers,
+            "batch_size": self.batch_size,
+            "concurrency_per_worker": self.concurrency,
+            "depth": depth,
+            "enqueued": self.enqueued,
+            "batches": self.batches,
+            "completed": self.completed,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "completed_per_minute": round(self._recent_completions() / (THROUGHPUT_WINDOW_SECONDS / 60), 2),
+            "queue_wait_seconds": {
+                "p50": round(waits[len(waits) // 2], 1) if waits else 0.0,
+                "p95": round(waits[int(len(waits) * 0.95)], 1) if waits else 0.0,
+                "max": round(waits[-1], 1) if waits else 0.0,
+            },
+            "last_enqueue": self.last_enqueue,
+        }
+
+# Global instance
+summary_pipeline = SummaryPipeline()
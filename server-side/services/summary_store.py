@@ -0,0 +1,303 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from config import settings
+from services.ai_service import ENGINE_EXTRACTIVE, ENGINE_LLM, PRIORITY_LOW, ai_service
+from services.cache import TTLCache, summary_cache
+from services.content_hash import content_hash
+from services.database_service import db_service
+from services.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Where a summary was served from
+TIER_MEMORY = "memory"
+TIER_DATABASE = "database"
+
+class SummaryStore:
+    """Two-tier summary cache (in-process LRU, then the summaries table) in front of the model"""
+
+    def __init__(self):
+        self.single_flight = SingleFlight()
+        # article_id -> content hash of the summary this worker last stored on it, so
+        # repeat hits for the same article skip the link query
+        self.linked = TTLCache(
+            ttl_seconds=settings.SUMMARY_CACHE_TTL_SECONDS,
+            max_entries=settings.SUMMARY_CACHE_MAX_ENTRIES,
+            max_bytes=settings.SUMMARY_CACHE_MAX_ENTRIES * 128,
+            sizeof=lambda value: 128,
+        )
+        self._task: Optional[asyncio.Task] = None
+        self.memory_hits = 0
+        self.database_hits = 0
+        self.misses = 0
+        self.generated = 0
+        self.failures = 0
+        self.deduplicated = 0
+        self.links_skipped = 0
+        self.last_prune: Optional[dict] = None
+
+    def _key(self, title: str, content: str) -> tuple:
+        return (content_hash(title, content), ai_service.model, ai_service.prompt_version)
+
+    async def summarize(
+        self,
+        title: str,
+        content: str,
+        article_id: Optional[str] = None,
+        latency_budget_ms: Optional[float] = None,
+    ) -> Tuple[str, Optional[str], str]:
+        """Summary for this content, the tier it came from (None when freshly generated) and its engine"""
+        result = (await self.summarize_many(
+            [{"title": title, "content": content, "article_id": article_id}], latency_budget_ms=latency_budget_ms
+        ))[0]
+        return result["summary"], result["tier"], result["engine"]
+
+    async def summarize_many(
+        self,
+        entries: List[dict],
+        concurrency: Optional[int] = None,
+        link_articles: bool = True,
+        latency_budget_ms: Optional[float] = None,
+    ) -> List[dict]:
+        """Summaries for many {title, content, article_id, priority, latency_budget_ms} entries, each with its tier,
+        engine and any error; an entry's own latency budget overrides the batch's"""
+        keys = [self._key(entry["title"], entry["content"]) for entry in entries]
+        # Duplicate content in one batch is looked up and generated once
+        first_entry: Dict[tuple, dict] = {}
+        budgets: Dict[tuple, Optional[float]] = {}
+        for key, entry in zip(keys, entries):
+            # The most urgent copy decides how a duplicate is summarized
+            if key not in first_entry or first_entry[key].get("priority") == PRIORITY_LOW:
+                first_entry[key] = entry
+            # and no copy waits longer than its budget allows
+            budget = entry.get("latency_budget_ms")
+            if budget is None:
+                budget = latency_budget_ms
+            if budget is not None and (budgets.get(key) is None or budget < budgets[key]):
+                budgets[key] = budget
+        self.deduplicated += len(entries) - len(first_entry)
+
+        found = await self._find_cached(list(first_entry))
+        misses = [key for key in first_entry if key not in found]
+        self.misses += len(misses)
+
+        # Misses that can't wait for (or shouldn't spend) a model call are summarized locally;
+        # those summaries are neither cached nor stored on articles, so a model summary can replace them
+        local = [
+            key for key in misses
+            if ai_service.choose_engine(budgets.get(key), first_entry[key].get("priority")) == ENGINE_EXTRACTIVE
+        ]
+        extractive = dict(zip(local, ai_service.generate_extractive_summaries([first_entry[key] for key in local])))
+        misses = [key for key in misses if key not in extractive]
+
+        errors: Dict[tuple, str] = {}
+        if misses:
+            semaphore = asyncio.Semaphore(concurrency or settings.SUMMARY_BATCH_CONCURRENCY)
+
+            async def generate(key: tuple):
+                entry = first_entry[key]
+                async with semaphore:
+                    try:
+                        # Identical content requested concurrently is generated once
+                        summary = await self.single_flight.do(
+                            key, lambda: self._generate_and_store(key, entry["title"], entry["content"])
+                        )
+                        found[key] = (summary, None)
+                    except Exception as e:
+                        self.failures += 1
+                        errors[key] = str(e) or type(e).__name__
+                        logger.error(f"❌ Error generating summary: {e}")
+
+            await asyncio.gather(*(generate(key) for key in misses))
+
+        results = []
+        links = []
+        for key, entry in zip(keys, entries):
+            if key in errors:
+                # Fallback summaries are never cached, so the next request retries the model
+                summary = ai_service.generate_extractive_summary(entry["title"], entry["content"])
+                results.append({"summary": summary, "tier": None, "engine": ENGINE_EXTRACTIVE, "error": errors[key]})
+                continue
+            if key in extractive:
+                results.append({"summary": extractive[key], "tier": None, "engine": ENGINE_EXTRACTIVE, "error": None})
+                continue
+
+            summary, tier = found[key]
+            results.append({"summary": summary, "tier": tier, "engine": ENGINE_LLM, "error": None})
+            if not link_articles:
+                continue
+            if tier is None:
+                links.append(self._link_articles(entry.get("article_id"), key, summary))
+            else:
+                links.append(self._link_article(entry.get("article_id"), key, summary))
+        await asyncio.gather(*links)
+        return results
+
+    async def lookup(
+        self, title: str, content: str, article_id: Optional[str] = None
+    ) -> Tuple[tuple, Optional[str], Optional[str]]:
+        """Cache key, cached summary and its tier; the summary is None on a miss"""
+        key = self._key(title, content)
+        found = await self._find_cached([key])
+        if key not in found:
+            self.misses += 1
+            return key, None, None
+
+        summary, tier = found[key]
+        await self._link_article(article_id, key, summary)
+        return key, summary, tier
+
+    async def stream(self, key: tuple, title: str, content: str, article_id: Optional[str] = None) -> AsyncIterator[str]:
+        """Generate a summary for a lookup() miss chunk by chunk, storing it once complete"""
+        parts = []
+        chunks = ai_service.stream_summary(title, content)
+        try:
+            async for chunk in chunks:
+                parts.append(chunk)
+                yield chunk
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            # Abandoned streams end here too, and partial summaries are never stored
+            await chunks.aclose()
+
+        summary = "".join(parts)
+        if not summary.strip():
+            # An empty summary would be cached and stored as if it were the article's
+            self.failures += 1
+            raise ValueError("Model returned an empty summary")
+        self.generated += 1
+        summary_cache.set(key, summary)
+        try:
+            await db_service.save_stored_summary(*key, summary)
+        except Exception as e:
+            logger.error(f"❌ Error storing summary: {e}")
+        await self._link_articles(article_id, key, summary)
+
+    async def _find_cached(self, keys: List[tuple]) -> Dict[tuple, Tuple[str, str]]:
+        """Summary and tier for each key found in memory or, failing that, in the database"""
+        found = {}
+        for key in keys:
+            summary = summary_cache.get(key)
+            if summary is not None:
+                self.memory_hits += 1
+                found[key] = (summary, TIER_MEMORY)
+
+        stored = await self._lookup_many([key for key in keys if key not in found])
+        for key, summary in stored.items():
+            self.database_hits += 1
+            summary_cache.set(key, summary)
+            found[key] = (summary, TIER_DATABASE)
+        return found
+
+    async def _lookup_many(self, keys: List[tuple]) -> Dict[tuple, str]:
+        """Persistent tier; refreshes last_used_at at most once per touch interval"""
+        if not keys:
+            return {}
+        try:
+            _, model, prompt_version = keys[0]
+            stored = await db_service.get_stored_summaries([key[0] for key in keys], model, prompt_version)
+
+            summaries = {}
+            stale = []
+            stale_before = datetime.utcnow() - timedelta(seconds=settings.SUMMARY_STORE_TOUCH_INTERVAL_SECONDS)
+            for key in keys:
+                row = stored.get(key[0])
+                if row is None:
+                    continue
+                if row["last_used_at"] is None or row["last_used_at"] < stale_before:
+                    stale.append(key)
+                summaries[key] = row["summary"]
+            try:
+                await db_service.touch_stored_summaries(stale)
+            except Exception as e:
+                # A missed touch only makes the row look less recently used
+                logger.error(f"❌ Summary store touch failed: {e}")
+            return summaries
+        except Exception as e:
+            logger.error(f"❌ Summary store lookup failed: {e}")
+            return {}
+
+    async def _link_article(self, article_id: Optional[str], key: tuple, summary: str):
+        """Store a cached summary on its article, unless this worker already did"""
+        if not article_id:
+            return
+        if self.linked.get(article_id) == key[0]:
+            self.links_skipped += 1
+            return
+        if await db_service.update_article_summary(article_id, summary) is not None:
+            self.linked.set(article_id, key[0])
+
+    async def _link_articles(self, article_id: Optional[str], key: tuple, summary: str):
+        """Store a new summary on its article and every other article with the same content"""
+        if await db_service.update_article_summary(article_id, summary, content_hash=key[0]) is not None and article_id:
+            self.linked.set(article_id, key[0])
+
+    async def _generate_and_store(self, key: tuple, title: str, content: str) -> str:
+        summary = await ai_service.generate_summary(title, content, fallback=False)
+        self.generated += 1
+        summary_cache.set(key, summary)
+        try:
+            await db_service.save_stored_summary(*key, summary)
+        except Exception as e:
+            logger.error(f"❌ Error storing summary: {e}")
+        return summary
+
+    async def _prune_forever(self):
+        """Evict expired and least recently used rows from the persistent tier"""
+        while True:
+            try:
+                self.last_prune = await db_service.prune_stored_summaries()
+            except Exception as e:
+                logger.error(f"❌ Summary store pruning failed: {e}")
+            await asyncio.sleep(settings.SUMMARY_STORE_PRUNE_INTERVAL_HOURS * 3600)
+
+    def start(self):
+        """Start the background pruning loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._prune_forever())
+
+    async def stop(self):
+        """Stop the background pruning loop"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> dict:
+        """Hit ratios per tier and how many model calls they saved"""
+        lookups = self.memory_hits + self.database_hits + self.misses
+
+        def ratio(count: int) -> float:
+            return round(count / lookups, 4) if lookups else 0.0
+
+        return {
+            "model": ai_service.model,
+            "prompt_version": ai_service.prompt_version,
+            "lookups": lookups,
+            "hit_ratio": ratio(self.memory_hits + self.database_hits),
+            "memory": summary_cache.get_stats(),
+            "database": {
+                "hits": self.database_hits,
+                "hit_ratio": ratio(self.database_hits),
+                "ttl_days": settings.SUMMARY_STORE_TTL_DAYS,
+                "max_rows": settings.SUMMARY_STORE_MAX_ROWS,
+                "last_prune": self.last_prune,
+            },
+            "misses": self.misses,
+            "generated": self.generated,
+            "failures": self.failures,
+            "coalesced": self.single_flight.coalesced,
+            "deduplicated": self.deduplicated,
+            "links_skipped": self.links_skipped,
+        }
+
+# Global instance
+summary_store = SummaryStore()
@@ -16,7 +16,7 @@ import logging
 sys.path.append(str(Path(__file__).parent))
 
 from config import settings
-from database import init_database, close_database, check_database_health
+from database import init_database, close_database, check_database_health, create_tables
 from services.database_service import db_service
 
 logging.basicConfig(level=logging.INFO)
@@ -51,7 +51,8 @@ async def setup_database():
     print("\n🛠️ Setting up database...")
     
     try:
-        # Initialize database service
+        # Create missing tables, then initialize database service
+        create_tables()
         await db_service.init_db()
         
         # Create sample data
@@ -0,0 +1,40 @@
+import os
+import sys
+from pathlib import Path
+
+# Tests never reach RDS, NewsAPI or Gemini; keep the background loops off
+os.environ.setdefault("INGESTION_ENABLED", "false")
+os.environ.setdefault("SUMMARY_PIPELINE_ENABLED", "false")
+os.environ.setdefault("SLOW_QUERY_LOG_FILE", "")
+
+# Add the server-side directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+import pytest
+
+@pytest.fixture
+def stand_in_gemini(monkeypatch):
+    """Start the stand-in Gemini server with the given Latency and point the SDK at it"""
+    from bench_model_tiering import free_port
+    from config import settings
+    from stand_in_gemini import create_app
+    import threading
+    import time
+    import uvicorn
+
+    servers = []
+
+    def start(latency):
+        port = free_port()
+        server = uvicorn.Server(uvicorn.Config(create_app(latency), host="127.0.0.1", port=port, log_level="warning"))
+        threading.Thread(target=server.run, daemon=True).start()
+        while not server.started:
+            time.sleep(0.05)
+        servers.append(server)
+        monkeypatch.setattr(settings, "GEMINI_BASE_URL", f"http://127.0.0.1:{port}")
+        return latency
+
+    yield start
+    for server in servers:
+        server.should_exit = True
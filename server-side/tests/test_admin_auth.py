@@ -0,0 +1,27 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from config import settings
+from routers.admin import router
+
+def make_client(monkeypatch, enabled: bool, token: str) -> TestClient:
+    monkeypatch.setattr(settings, "ADMIN_API_ENABLED", enabled)
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", token)
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+def test_admin_api_is_hidden_by_default(monkeypatch):
+    client = make_client(monkeypatch, False, "secret")
+    assert client.get("/api/admin/queries", headers={"X-Admin-Token": "secret"}).status_code == 404
+    assert client.delete("/api/admin/queries", headers={"X-Admin-Token": "secret"}).status_code == 404
+
+def test_admin_api_stays_hidden_without_a_token(monkeypatch):
+    client = make_client(monkeypatch, True, "")
+    assert client.get("/api/admin/queries").status_code == 404
+
+def test_admin_api_requires_the_token(monkeypatch):
+    client = make_client(monkeypatch, True, "secret")
+    assert client.get("/api/admin/queries").status_code == 401
+    assert client.delete("/api/admin/queries", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    assert client.get("/api/admin/queries", headers={"X-Admin-Token": "secret"}).status_code == 200
@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+import pytest
+
+from config import settings
+from services.ai_service import AIService
+from stand_in_gemini import SUMMARY, Latency
+
+FAST, SLOW = "gemini-2.5-flash", "gemini-2.5-pro"
+
+class ScriptedLatency(Latency):
+    """Serves each model's calls with the given delays in order, then the last one"""
+
+    def __init__(self, delays: dict, error_rate: float = 0.0):
+        super().__init__(error_rate=error_rate, seed=1)
+        self.delays = {model: list(values) for model, values in delays.items()}
+
+    def delay(self, model: str) -> float:
+        self.requests[model] = self.requests.get(model, 0) + 1
+        values = self.delays[model]
+        return values.pop(0) if len(values) > 1 else values[0]
+
+def make_service(monkeypatch, tiers: str, deadline: float = 5.0, hedge: bool = False) -> AIService:
+    monkeypatch.setattr(settings, "GEMINI_MODEL_TIERS", tiers)
+    monkeypatch.setattr(settings, "SUMMARY_DEADLINE_SECONDS", deadline)
+    monkeypatch.setattr(settings, "GEMINI_HEDGE_ENABLED", hedge)
+    return AIService()
+
+async def summarize(service: AIService, content: str = "Content.", fallback: bool = False) -> tuple:
+    start = time.perf_counter()
+    try:
+        return await service.generate_summary("Title", content, fallback=fallback), time.perf_counter() - start
+    finally:
+        await service.close()
+
+def long_content(monkeypatch, parts: int) -> str:
+    """Content that map-reduce splits into this many chunks"""
+    monkeypatch.setattr(settings, "SUMMARY_INPUT_TOKEN_BUDGET", 50)
+    monkeypatch.setattr(settings, "SUMMARY_CHUNK_TOKENS", 50)
+    return "\n\n".join(f"Paragraph {i} " + "word " * 30 + "ends here." for i in range(parts))
+
+def test_one_deadline_covers_map_and_reduce(monkeypatch, stand_in_gemini):
+    # Map (in parallel) and reduce each fit the deadline alone, but not together
+    stand_in_gemini(ScriptedLatency({FAST: [0.6]}))
+    service = make_service(monkeypatch, f"{FAST}:5", deadline=1.0)
+    content = long_content(monkeypatch, parts=2)
+
+    start = time.perf_counter()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(summarize(service, content))
+    assert time.perf_counter() - start < 1.4
+    assert service.map_reduce_summaries == 1
+
+def test_a_failed_chunk_cancels_its_siblings(monkeypatch, stand_in_gemini):
+    # One chunk fails on both tiers quickly; the other two would take seconds
+    latency = stand_in_gemini(ScriptedLatency({FAST: [0.05, 3.0, 3.0], SLOW: [0.05]}, error_rate=1.0))
+    service = make_service(monkeypatch, f"{FAST}:5,{SLOW}:5")
+    content = long_content(monkeypatch, parts=3)
+
+    async def fail():
+        start = time.perf_counter()
+        try:
+            with pytest.raises(Exception):
+                await service.generate_summary("Title", content, fallback=False)
+            # Let the cancelled siblings unwind
+            for _ in range(5):
+                await asyncio.sleep(0)
+            return time.perf_counter() - start, asyncio.all_tasks() - {asyncio.current_task()}
+        finally:
+            await service.close()
+
+    elapsed, leftover = asyncio.run(fail())
+    assert elapsed < 1.0
+    assert leftover == set()
+    assert latency.requests == {FAST: 3, SLOW: 1}
+    # The request is one failure toward degraded mode
+    assert service.consecutive_failures == 1
+    assert not service.is_degraded()
+
+def test_slow_tier_escalates_within_the_deadline(monkeypatch, stand_in_gemini):
+    stand_in_gemini(ScriptedLatency({FAST: [2.0], SLOW: [0.05]}))
+    service = make_service(monkeypatch, f"{FAST}:0.3,{SLOW}:5")
+
+    summary, elapsed = asyncio.run(summarize(service))
+    assert summary == SUMMARY
+    assert elapsed < 1.0
+    assert service.escalations == 1 and service.timeouts == 1
+
+def test_hedge_answers_when_the_first_call_is_slow(monkeypatch, stand_in_gemini):
+    stand_in_gemini(ScriptedLatency({FAST: [2.0, 0.05]}))
+    monkeypatch.setattr(settings, "GEMINI_HEDGE_MIN_DELAY_MS", 50)
+    service = make_service(monkeypatch, f"{FAST}:5", hedge=True)
+    # A measured p95 of 100 ms: the hedge goes out once the first call is slower than that
+    for _ in range(20):
+        service.latency[FAST].record(100)
+
+    summary, elapsed = asyncio.run(summarize(service))
+    assert summary == SUMMARY
+    assert elapsed < 1.0
+    assert service.hedges == 1 and service.hedge_wins == 1
+
+def test_model_failure_falls_back_to_an_extractive_summary(monkeypatch, stand_in_gemini):
+    stand_in_gemini(ScriptedLatency({FAST: [0.05]}, error_rate=1.0))
+    service = make_service(monkeypatch, f"{FAST}:5")
+
+    summary, _ = asyncio.run(summarize(service, "A storm hit the coast. Thousands lost power.", fallback=True))
+    assert summary and summary != SUMMARY
+    assert service.extractive_summaries == 1
+    assert service.consecutive_failures == 1
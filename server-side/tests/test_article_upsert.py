@@ -0,0 +1,59 @@
+import asyncio
+from datetime import datetime
+
+from config import settings
+from services.database_service import ARTICLE_INSERT_COLUMNS, DatabaseService
+
+STORED_AT = datetime(2024, 5, 1, 8)
+
+class FakeDatabase:
+    """Reports the partitioning state and one already-stored url; records the upsert"""
+
+    def __init__(self, partitioned: bool):
+        self.partitioned = partitioned
+        self.upserts = []
+
+    async def fetch_one(self, query, values=None):
+        return {"partitioned": self.partitioned}
+
+    async def fetch_all(self, query, values=None):
+        if query.startswith("SELECT url, published_at"):
+            return [{"url": url, "published_at": STORED_AT} for url in values.values() if url.endswith("/old")]
+        self.upserts.append((query, values))
+        return []
+
+    async def execute(self, query, values=None):
+        pass
+
+    def transaction(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+def upsert(monkeypatch, partitioned: bool, flag: bool) -> tuple:
+    monkeypatch.setattr(settings, "DB_TYPE", "postgresql")
+    monkeypatch.setattr(settings, "ARTICLE_PARTITIONING_ENABLED", flag)
+    service = DatabaseService()
+    service.db = FakeDatabase(partitioned)
+    rows = [
+        {**dict.fromkeys(ARTICLE_INSERT_COLUMNS), "url": f"https://example.com/{path}", "published_at": datetime(2024, 5, 2, 9)}
+        for path in ("old", "new")
+    ]
+    asyncio.run(service._upsert_batch_postgres(rows))
+    return service.db.upserts[0]
+
+def test_conflict_target_follows_a_partitioned_table_even_with_the_flag_off(monkeypatch):
+    query, values = upsert(monkeypatch, partitioned=True, flag=False)
+    assert "ON CONFLICT (url, published_at)" in query
+    # A stored url keeps its published_at so it still conflicts with its row
+    assert values["published_at_0"] == STORED_AT
+    assert values["published_at_1"] == datetime(2024, 5, 2, 9)
+
+def test_conflict_target_follows_an_unpartitioned_table_even_with_the_flag_on(monkeypatch):
+    query, values = upsert(monkeypatch, partitioned=False, flag=True)
+    assert "ON CONFLICT (url)" in query
+    assert values["published_at_0"] == datetime(2024, 5, 2, 9)
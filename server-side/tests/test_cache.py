@@ -0,0 +1,63 @@
+import asyncio
+
+from config import settings
+from models import ArticleFilter, TopicEnum
+from services.cache import TTLCache, article_cache
+from services.news_service import NewsService
+
+def make_cache() -> TTLCache:
+    return TTLCache(ttl_seconds=400, max_entries=10, max_bytes=10_000)
+
+def test_mark_stale_keeps_entries_but_ages_them():
+    cache = make_cache()
+    cache.set("a", [1])
+    cache.mark_stale(100)
+
+    value, age = cache.get_with_age("a")
+    assert value == [1]
+    assert 100 <= age < 400
+
+def test_write_from_before_a_change_is_stored_stale():
+    cache = make_cache()
+    generation = cache.generation
+    cache.mark_stale(100)
+
+    cache.set("a", [1], generation=generation, stale_age=100)
+    value, age = cache.get_with_age("a")
+    assert value == [1]
+    assert age >= 100
+
+def test_write_from_before_an_invalidation_is_dropped():
+    cache = make_cache()
+    generation = cache.generation
+    cache.invalidate()
+
+    cache.set("a", [1], generation=generation)
+    assert cache.get("a") is None
+
+def test_saved_articles_leave_lists_served_stale_while_one_refresh_runs():
+    async def scenario():
+        service = NewsService()
+        fetches = 0
+
+        async def fetch_news(filters):
+            nonlocal fetches
+            fetches += 1
+            await asyncio.sleep(0.05)
+            return [f"fetch {fetches}"]
+
+        service._fetch_news = fetch_news
+        filters = ArticleFilter(topic=TopicEnum.BUSINESS, search_query="stale marking test")
+        article_cache.invalidate(filters.cache_key())
+        assert await service.fetch_news(filters) == ["fetch 1"]
+
+        # What save_articles does after an ingestion tick
+        article_cache.mark_stale(settings.SWR_SOFT_TTL_SECONDS)
+        served = await asyncio.gather(*(service.fetch_news(filters) for _ in range(10)))
+        await asyncio.gather(*service._revalidations)
+        return served, fetches, await service.fetch_news(filters)
+
+    served, fetches, refreshed = asyncio.run(scenario())
+    assert served == [["fetch 1"]] * 10
+    assert fetches == 2
+    assert refreshed == ["fetch 2"]
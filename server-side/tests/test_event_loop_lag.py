@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import pytest
+
+from config import settings
+from models import ArticleFilter
+from services.ai_service import AIService
+from services.database_service import DatabaseService
+from stand_in_gemini import Latency
+
+MODEL = "gemini-2.5-flash"
+SUMMARIES = 8
+HEARTBEAT = 0.01
+# Far below one model round trip; a blocking call anywhere would blow through it
+MAX_LAG_MS = 100
+
+class SlowDatabase:
+    """Async queries that take a few milliseconds, like a nearby RDS instance"""
+
+    def __init__(self):
+        self.queries = 0
+
+    async def fetch_one(self, query, values=None):
+        await asyncio.sleep(0.005)
+        return None
+
+    async def fetch_all(self, query, values=None):
+        self.queries += 1
+        await asyncio.sleep(0.005)
+        return []
+
+async def heartbeat(stop: asyncio.Event) -> float:
+    """Worst lateness of a periodic tick, in milliseconds"""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT)
+        worst = max(worst, (time.perf_counter() - start - HEARTBEAT) * 1000)
+    return worst
+
+async def run_concurrently(service: AIService, db_service: DatabaseService) -> float:
+    service.start()
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(stop))
+
+    async def db_work():
+        while not stop.is_set():
+            await db_service.get_articles_from_db(ArticleFilter(search_query="climate"))
+
+    workers = [asyncio.create_task(db_work()) for _ in range(4)]
+    try:
+        summaries = await asyncio.gather(*(
+            service.generate_summary(f"Title {i}", f"Content of article {i}.", fallback=False)
+            for i in range(SUMMARIES)
+        ))
+    finally:
+        stop.set()
+        await asyncio.gather(*workers)
+        await service.close()
+    assert all(summaries)
+    return await ticker
+
+def test_event_loop_stays_responsive_while_summaries_and_queries_run(monkeypatch, stand_in_gemini):
+    latency = stand_in_gemini(Latency({MODEL: 0.5}, seed=1))
+    monkeypatch.setattr(settings, "GEMINI_MODEL_TIERS", f"{MODEL}:5")
+    monkeypatch.setattr(settings, "GEMINI_HEDGE_ENABLED", False)
+
+    db_service = DatabaseService()
+    db_service.db = db_service.reader = SlowDatabase()
+    worst_lag_ms = asyncio.run(run_concurrently(AIService(), db_service))
+
+    assert latency.requests[MODEL] == SUMMARIES
+    assert db_service.db.queries > SUMMARIES
+    assert worst_lag_ms < MAX_LAG_MS
+
+def test_start_shuts_down_the_default_pool_it_replaces():
+    async def replace_pool():
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, time.sleep, 0)
+        previous = loop._default_executor
+        AIService().start()
+        assert loop._default_executor is not previous
+        return previous
+
+    previous = asyncio.run(replace_pool())
+    # A shut-down pool refuses new work
+    with pytest.raises(RuntimeError):
+        previous.submit(time.sleep, 0)
@@ -0,0 +1,20 @@
+import json
+from pathlib import Path
+
+from services.extractive_summarizer import METHODS, ExtractiveSummarizer
+
+CORPUS = Path(__file__).parent.parent / "benchmarks" / "fixtures" / "summary_corpus.json"
+
+def test_a_batch_summarizes_each_article_as_it_would_alone():
+    articles = [{"title": article["title"], "content": article["content"]} for article in json.loads(CORPUS.read_text())]
+    # Articles of very different lengths share the padded batch with ones that skip scoring
+    articles += [
+        {"title": "Empty", "content": ""},
+        {"title": "One sentence", "content": "Only this sentence is here."},
+        {"title": "", "content": "A lede without a headline. Then a second sentence. And a third one."},
+    ]
+    summarizer = ExtractiveSummarizer()
+    for method in METHODS:
+        alone = [summarizer.summarize(article["title"], article["content"], method) for article in articles]
+        assert summarizer.summarize_many(articles, method) == alone
+    assert alone[-3:-1] == ["Empty", "Only this sentence is here."]
@@ -0,0 +1,89 @@
+import asyncio
+import uuid
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers.news import router
+from services import interaction_buffer as buffer_module
+from services.interaction_buffer import InteractionBuffer
+
+BAD_ID = "x" * 40
+
+class FakeInteractionStore:
+    """record_interactions that refuses any batch holding a bad article id"""
+
+    def __init__(self, healthy: bool = True, delay: float = 0.0):
+        self.healthy = healthy
+        self.delay = delay
+        self.written = []
+        self.calls = 0
+
+    async def record_interactions(self, events):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if not self.healthy or any(event["article_id"] == BAD_ID for event in events):
+            return False
+        self.written.extend(events)
+        return True
+
+    async def check_health(self):
+        return {"status": "healthy" if self.healthy else "unhealthy"}
+
+def install(monkeypatch, store: FakeInteractionStore):
+    monkeypatch.setattr(buffer_module.db_service, "record_interactions", store.record_interactions)
+    monkeypatch.setattr(buffer_module, "check_database_health", store.check_health)
+
+def test_refused_rows_are_dropped_and_the_rest_written(monkeypatch):
+    store = FakeInteractionStore()
+    install(monkeypatch, store)
+    buffer = InteractionBuffer()
+    good_ids = [str(uuid.uuid4()) for _ in range(63)]
+    for article_id in good_ids[:30] + [BAD_ID] + good_ids[30:]:
+        buffer.record(article_id, "view")
+
+    assert asyncio.run(buffer.flush()) == 63
+    assert sorted(event["article_id"] for event in store.written) == sorted(good_ids)
+    assert buffer.get_stats()["events_rejected"] == 1
+    assert buffer.get_stats()["pending"] == 0
+
+def test_outage_requeues_the_batch(monkeypatch):
+    store = FakeInteractionStore(healthy=False)
+    install(monkeypatch, store)
+    buffer = InteractionBuffer()
+    for _ in range(10):
+        buffer.record(str(uuid.uuid4()), "like")
+
+    assert asyncio.run(buffer.flush()) == 0
+    assert store.calls == 1
+    assert buffer.get_stats()["pending"] == 10
+    assert buffer.get_stats()["events_dropped"] == 0
+
+def test_stop_during_a_flush_keeps_its_batch(monkeypatch):
+    store = FakeInteractionStore(delay=0.2)
+    install(monkeypatch, store)
+    buffer = InteractionBuffer()
+    buffer.flush_interval = 0.01
+
+    async def scenario():
+        buffer.start()
+        for _ in range(5):
+            buffer.record(str(uuid.uuid4()), "view")
+        # The flusher has taken the batch and is waiting on the database
+        await asyncio.sleep(0.1)
+        buffer.record(str(uuid.uuid4()), "view")
+        await buffer.stop()
+
+    asyncio.run(scenario())
+    assert len(store.written) == 6
+
+def test_malformed_article_ids_are_rejected_at_the_edge(monkeypatch):
+    store = FakeInteractionStore()
+    install(monkeypatch, store)
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    assert client.post(f"/api/news/articles/{BAD_ID}/view").status_code == 422
+    assert client.post("/api/news/articles/not-an-id/like").status_code == 422
+    assert client.post(f"/api/news/articles/{uuid.uuid4()}/view").status_code == 200
@@ -0,0 +1,63 @@
+import asyncio
+
+import services.news_service as news_module
+from config import settings
+from models import ArticleFilter, TopicEnum
+from services.cache import article_cache
+from services.news_service import NewsService
+
+def fetch(monkeypatch, stored_rows: list, table_has_rows: bool, filters: ArticleFilter):
+    """fetch_news with ingestion on, over a database holding stored_rows for these filters"""
+    async def get_articles_from_db(filters):
+        return list(stored_rows)
+
+    async def has_articles():
+        return table_has_rows
+
+    monkeypatch.setattr(settings, "INGESTION_ENABLED", True)
+    monkeypatch.setattr(news_module.db_service, "get_articles_from_db", get_articles_from_db)
+    monkeypatch.setattr(news_module.db_service, "has_articles", has_articles)
+    article_cache.invalidate(filters.cache_key())
+    return asyncio.run(NewsService().fetch_news(filters)), article_cache.get(filters.cache_key())
+
+def test_filter_with_no_matches_returns_an_empty_list(monkeypatch):
+    filters = ArticleFilter(search_query="no article mentions this")
+    articles, cached = fetch(monkeypatch, [], table_has_rows=True, filters=filters)
+    assert articles == []
+    assert cached == []
+
+def test_empty_table_serves_mock_articles_without_caching_them(monkeypatch):
+    filters = ArticleFilter(topic=TopicEnum.TECHNOLOGY, source="TechCrunch")
+    articles, cached = fetch(monkeypatch, [], table_has_rows=False, filters=filters)
+    assert articles and all(article.source.name == "TechCrunch" for article in articles)
+    assert cached is None
+
+def test_mock_articles_honour_the_search_query(monkeypatch):
+    filters = ArticleFilter(search_query="climate")
+    articles, _ = fetch(monkeypatch, [], table_has_rows=False, filters=filters)
+    assert [article.source.name for article in articles] == ["Reuters"]
+
+def test_source_is_normalized_before_the_query_and_the_cache_key():
+    padded, plain = ArticleFilter(source=" Reuters "), ArticleFilter(source="Reuters")
+    assert padded.source == plain.source == "Reuters"
+    assert padded.cache_key() == plain.cache_key()
+    assert ArticleFilter(source="All").source is None
+    assert ArticleFilter(search_query="  climate   talks ").search_query == "climate talks"
+
+def test_fallback_after_an_error_is_not_cached(monkeypatch):
+    calls = 0
+
+    async def get_articles_from_db(filters):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("connection reset")
+        return ["stored article"]
+
+    monkeypatch.setattr(settings, "INGESTION_ENABLED", True)
+    monkeypatch.setattr(news_module.db_service, "get_articles_from_db", get_articles_from_db)
+    filters = ArticleFilter(search_query="transient error test")
+    article_cache.invalidate(filters.cache_key())
+
+    assert asyncio.run(NewsService().fetch_news(filters)) == ["stored article"]
+    assert article_cache.get(filters.cache_key()) is None
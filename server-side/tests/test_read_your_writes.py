@@ -0,0 +1,64 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import main
+from database import read_router
+from services.database_service import DatabaseService
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.middleware("http")(main.read_your_writes)
+
+    @app.post("/write")
+    async def write():
+        read_router.mark_write()
+        return {}
+
+    @app.post("/buffered")
+    async def buffered():
+        return {}
+
+    return TestClient(app)
+
+def test_only_committed_writes_pin_the_client_to_the_primary():
+    client = make_client()
+    assert main.READ_YOUR_WRITES_COOKIE not in client.post("/buffered").cookies
+    assert main.READ_YOUR_WRITES_COOKIE in client.post("/write").cookies
+
+class FakeDatabase:
+    def __init__(self, stale_ids):
+        self.stale_ids = stale_ids
+        self.executed = []
+
+    async def fetch_all(self, query, values=None):
+        return [{"id": article_id, "published_at": None} for article_id in self.stale_ids]
+
+    async def execute_many(self, query, values):
+        self.executed.append((query, values))
+
+class CountingRouter:
+    def __init__(self):
+        self.writes = 0
+
+    def mark_write(self):
+        self.writes += 1
+
+def link(stale_ids):
+    service = DatabaseService()
+    service.db = FakeDatabase(stale_ids)
+    service.reader = CountingRouter()
+    updated = asyncio.run(service.update_article_summary("a1", "Summary.", content_hash="h"))
+    return updated, service.db.executed, service.reader.writes
+
+def test_unchanged_summary_skips_the_update():
+    assert link([]) == (False, [], 0)
+
+def test_changed_summary_is_written_and_marks_the_write():
+    updated, executed, writes = link(["a1", "a2"])
+    assert updated
+    assert len(executed) == 1
+    assert [row["id"] for row in executed[0][1]] == ["a1", "a2"]
+    assert "published_at = :published_at" in executed[0][0]
+    assert writes == 1
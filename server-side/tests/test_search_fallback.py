@@ -0,0 +1,34 @@
+import asyncio
+
+from models import ArticleFilter
+from services.database_service import DatabaseService
+
+class FakeDatabase:
+    """Answers the schema check and records the article queries"""
+
+    def __init__(self, has_fulltext: bool):
+        self.has_fulltext = has_fulltext
+        self.queries = []
+
+    async def fetch_one(self, query, values=None):
+        return {"?column?": 1} if self.has_fulltext else None
+
+    async def fetch_all(self, query, values=None):
+        self.queries.append(query)
+        return []
+
+def search(has_fulltext: bool) -> str:
+    service = DatabaseService()
+    service.db = service.reader = FakeDatabase(has_fulltext)
+    asyncio.run(service.get_articles_from_db(ArticleFilter(search_query="climate")))
+    return service.db.queries[-1]
+
+def test_unmigrated_database_falls_back_to_like_search():
+    query = search(has_fulltext=False)
+    assert "LIKE :search" in query
+    assert "search_vector" not in query
+
+def test_migrated_database_uses_the_fulltext_index():
+    query = search(has_fulltext=True)
+    assert "search_vector" in query
+    assert "LIKE" not in query
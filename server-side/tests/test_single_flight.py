@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from models import ArticleFilter, TopicEnum
+from services.cache import article_cache
+from services.news_service import NewsService
+from services.single_flight import SingleFlight
+
+CALLERS = 50
+
+def test_concurrent_callers_share_one_execution():
+    async def scenario():
+        flight = SingleFlight()
+        executions = 0
+        release = asyncio.Event()
+
+        async def fetch():
+            nonlocal executions
+            executions += 1
+            await release.wait()
+            return ["article"]
+
+        callers = [asyncio.create_task(flight.do("key", fetch)) for _ in range(CALLERS)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+        return executions, results, flight
+
+    executions, results, flight = asyncio.run(scenario())
+    assert executions == 1
+    assert all(result == ["article"] for result in results)
+    assert flight.get_stats() == {"calls": CALLERS, "executions": 1, "coalesced": CALLERS - 1, "in_flight": 0}
+
+def test_error_reaches_every_waiter():
+    async def scenario():
+        flight = SingleFlight()
+        executions = 0
+        release = asyncio.Event()
+
+        async def fetch():
+            nonlocal executions
+            executions += 1
+            await release.wait()
+            raise RuntimeError("NewsAPI unavailable")
+
+        callers = [asyncio.create_task(flight.do("key", fetch)) for _ in range(CALLERS)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        return executions, results, flight
+
+    executions, results, flight = asyncio.run(scenario())
+    assert executions == 1
+    assert len(results) == CALLERS
+    assert all(isinstance(result, RuntimeError) and str(result) == "NewsAPI unavailable" for result in results)
+    assert not flight.is_in_flight("key")
+
+def test_next_call_after_failure_runs_again():
+    async def scenario():
+        flight = SingleFlight()
+        outcomes = iter([RuntimeError("first"), "second"])
+
+        async def fetch():
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with pytest.raises(RuntimeError):
+            await flight.do("key", fetch)
+        return await flight.do("key", fetch), flight.executions
+
+    assert asyncio.run(scenario()) == ("second", 2)
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return first, await second
+
+    first, result = asyncio.run(scenario())
+    assert first.cancelled()
+    assert result == "done"
+
+def test_distinct_keys_run_separately():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fetch(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(*(flight.do(i % 3, lambda i=i: fetch(i % 3)) for i in range(9)))
+        return results, flight.executions
+
+    results, executions = asyncio.run(scenario())
+    assert results == [i % 3 for i in range(9)]
+    assert executions == 3
+
+def test_fetch_news_coalesces_identical_misses():
+    async def scenario():
+        service = NewsService()
+        fetches = 0
+
+        async def fetch_news(filters):
+            nonlocal fetches
+            fetches += 1
+            await asyncio.sleep(0.05)
+            return []
+
+        service._fetch_news = fetch_news
+        filters = ArticleFilter(topic=TopicEnum.SCIENCE, search_query="single flight test")
+        article_cache.invalidate(filters.cache_key())
+        results = await asyncio.gather(*(service.fetch_news(filters) for _ in range(CALLERS)))
+        return fetches, results
+
+    fetches, results = asyncio.run(scenario())
+    assert fetches == 1
+    assert results == [[]] * CALLERS
@@ -0,0 +1,57 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import routers.ai as ai_router
+import services.summary_store as store_module
+from services.ai_service import ENGINE_EXTRACTIVE
+from services.summary_store import SummaryStore
+
+def test_each_item_keeps_its_own_latency_budget(monkeypatch):
+    received = []
+
+    async def summarize_many(entries, latency_budget_ms=None):
+        received.append((entries, latency_budget_ms))
+        return [{"summary": "S.", "tier": None, "engine": ENGINE_EXTRACTIVE, "error": None} for _ in entries]
+
+    monkeypatch.setattr(ai_router.summary_store, "summarize_many", summarize_many)
+    app = FastAPI()
+    app.include_router(ai_router.router)
+    response = TestClient(app).post("/api/ai/summarize/batch", json={
+        "items": [
+            {"title": "A", "content": "a.", "latency_budget_ms": 200},
+            {"title": "B", "content": "b."},
+        ],
+        "latency_budget_ms": 5000,
+    })
+
+    assert response.status_code == 200
+    entries, batch_budget = received[0]
+    assert [entry["latency_budget_ms"] for entry in entries] == [200, None]
+    assert batch_budget == 5000
+
+def test_item_budgets_override_the_batch_budget(monkeypatch):
+    budgets = []
+
+    def choose_engine(latency_budget_ms=None, priority=None):
+        budgets.append(latency_budget_ms)
+        return ENGINE_EXTRACTIVE
+
+    async def no_stored_summaries(content_hashes, model, prompt_version):
+        return {}
+
+    monkeypatch.setattr(store_module.ai_service, "choose_engine", choose_engine)
+    monkeypatch.setattr(store_module.ai_service, "generate_extractive_summaries",
+                        lambda articles: [f"Local {article['title']}." for article in articles])
+    monkeypatch.setattr(store_module.db_service, "get_stored_summaries", no_stored_summaries)
+    entries = [
+        {"title": "Own budget", "content": "x.", "latency_budget_ms": 100},
+        {"title": "Batch budget", "content": "y."},
+        # A duplicate with a tighter budget: no copy may wait longer than it allows
+        {"title": "Batch budget", "content": "y.", "latency_budget_ms": 50},
+    ]
+    results = asyncio.run(SummaryStore().summarize_many(entries, latency_budget_ms=3000))
+
+    assert budgets == [100, 50]
+    assert [result["summary"] for result in results] == ["Local Own budget.", "Local Batch budget.", "Local Batch budget."]
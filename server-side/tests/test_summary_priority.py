@@ -0,0 +1,213 @@
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta
+
+import services.summary_store as store_module
+from config import settings
+from services.ai_service import ENGINE_EXTRACTIVE, ENGINE_LLM, AIService
+from services.database_service import DatabaseService, db_service
+from services.summary_pipeline import SummaryPipeline
+from stand_in_gemini import SUMMARY, Latency
+
+MODEL = "gemini-2.5-flash"
+
+class SqliteDatabase:
+    """Runs the enqueue statements against an in-memory SQLite copy of the tables they touch"""
+
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(
+            """
+            CREATE TABLE articles (
+                id TEXT PRIMARY KEY, topic TEXT, is_trending BOOLEAN DEFAULT 0, view_count INTEGER DEFAULT 0,
+                like_count INTEGER DEFAULT 0, summary TEXT, summary_engine TEXT, published_at TIMESTAMP
+            );
+            CREATE TABLE summary_jobs (
+                article_id TEXT PRIMARY KEY, priority INTEGER, published_at TIMESTAMP, enqueued_at TIMESTAMP,
+                attempts INTEGER, lease_token TEXT, lease_expires_at TIMESTAMP
+            );
+            CREATE TABLE article_stats_hourly (topic TEXT, bucket_hour TIMESTAMP, view_count INTEGER, like_count INTEGER);
+            """
+        )
+
+    async def fetch_all(self, query, values=None):
+        return self.conn.execute(query, values or {}).fetchall()
+
+    async def execute(self, query, values=None):
+        self.conn.execute(query, values or {})
+
+def add_article(db, article_id, topic="Sports", published_at=None, summary=None, summary_engine=None, **counts):
+    db.conn.execute(
+        "INSERT INTO articles (id, topic, is_trending, view_count, like_count, summary, summary_engine, published_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (article_id, topic, counts.get("is_trending", 0), counts.get("view_count", 0), counts.get("like_count", 0),
+         summary, summary_engine, published_at or datetime.utcnow()),
+    )
+
+def queue_job(db, article_id, lease_token=None):
+    now = datetime.utcnow()
+    db.conn.execute(
+        "INSERT INTO summary_jobs (article_id, priority, published_at, enqueued_at, attempts, lease_token) "
+        "VALUES (?, 0, ?, ?, 0, ?)",
+        (article_id, now, now, lease_token),
+    )
+
+def test_enqueue_ranks_engaged_articles_and_topics_as_trending():
+    db = SqliteDatabase()
+    engaged = settings.SUMMARY_TRENDING_MIN_INTERACTIONS
+    db.conn.execute(
+        "INSERT INTO article_stats_hourly VALUES ('Technology', ?, 40, 2)", (datetime.utcnow(),)
+    )
+    add_article(db, "flagged", is_trending=1)
+    add_article(db, "engaged", view_count=engaged - 1, like_count=1)
+    add_article(db, "hot-topic", topic="Technology")
+    add_article(db, "quiet", view_count=engaged - 1)
+    add_article(db, "extractive-engaged", summary="Local.", summary_engine=ENGINE_EXTRACTIVE, view_count=engaged)
+    add_article(db, "extractive-quiet", summary="Local.", summary_engine=ENGINE_EXTRACTIVE)
+    add_article(db, "summarized-engaged", summary="Model.", summary_engine=ENGINE_LLM, view_count=engaged)
+    add_article(db, "old-engaged", view_count=engaged, published_at=datetime.utcnow() - timedelta(
+        hours=settings.SUMMARY_PIPELINE_LOOKBACK_HOURS + 1
+    ))
+    add_article(db, "queued-now-engaged", view_count=engaged)
+    queue_job(db, "queued-now-engaged")
+    add_article(db, "leased-now-engaged", view_count=engaged)
+    queue_job(db, "leased-now-engaged", lease_token="token")
+
+    service = DatabaseService()
+    service.db = db
+    assert asyncio.run(service.enqueue_summary_jobs()) == 5
+
+    queued = {row["article_id"]: row["priority"] for row in db.conn.execute("SELECT * FROM summary_jobs")}
+    assert queued == {
+        "flagged": 1,
+        "engaged": 1,
+        "hot-topic": 1,
+        "quiet": 0,
+        "extractive-engaged": 1,
+        "queued-now-engaged": 1,
+        # A leased job keeps its priority; the worker already has it
+        "leased-now-engaged": 0,
+    }
+
+def job(article_id: str, priority: int, summary: str = None, summary_engine: str = None) -> dict:
+    now = datetime.utcnow()
+    return {
+        "article_id": article_id, "priority": priority, "published_at": now, "enqueued_at": now, "attempts": 1,
+        "title": f"Priority test {article_id}", "original_excerpt": f"What happened to {article_id}. More detail.",
+        "summary": summary, "summary_engine": summary_engine,
+    }
+
+def test_trending_jobs_reach_the_model(monkeypatch, stand_in_gemini):
+    latency = stand_in_gemini(Latency({MODEL: 0.05}, seed=1))
+    monkeypatch.setattr(settings, "GEMINI_MODEL_TIERS", f"{MODEL}:5")
+    monkeypatch.setattr(settings, "GEMINI_HEDGE_ENABLED", False)
+    monkeypatch.setattr(settings, "SUMMARY_LOW_PRIORITY_ENGINE", "extractive")
+    monkeypatch.setattr(store_module, "ai_service", AIService())
+
+    completed = {}
+
+    async def lease(limit):
+        return "token", [
+            job("trending", 1),
+            job("tail", 0),
+            job("replaceable", 1, "An extractive summary.", ENGINE_EXTRACTIVE),
+            job("summarized", 0, "A reader's model summary.", ENGINE_LLM),
+        ]
+
+    async def complete(token, jobs, summaries):
+        completed.update(summaries)
+
+    async def nothing(*args, **kwargs):
+        return {}
+
+    monkeypatch.setattr(db_service, "lease_summary_jobs", lease)
+    monkeypatch.setattr(db_service, "complete_summary_jobs", complete)
+    monkeypatch.setattr(db_service, "fail_summary_jobs", nothing)
+    monkeypatch.setattr(db_service, "get_stored_summaries", nothing)
+    monkeypatch.setattr(db_service, "save_stored_summary", nothing)
+
+    async def run():
+        try:
+            return await SummaryPipeline().process_batch()
+        finally:
+            await store_module.ai_service.close()
+
+    assert asyncio.run(run()) == 4
+    assert latency.requests == {MODEL: 2}
+    assert completed["trending"] == (SUMMARY, ENGINE_LLM)
+    assert completed["replaceable"] == (SUMMARY, ENGINE_LLM)
+    assert completed["tail"][1] == ENGINE_EXTRACTIVE
+    assert "summarized" not in completed
+
+def test_a_degraded_model_completes_trending_jobs_extractively(monkeypatch):
+    """The extractive summary is kept, no attempt is spent, and the next enqueue queues it for the model"""
+    service = AIService()
+    monkeypatch.setattr(service, "is_degraded", lambda: True)
+    monkeypatch.setattr(store_module, "ai_service", service)
+
+    completed = {}
+    failed = []
+
+    async def lease(limit):
+        return "token", [job("trending", 1)]
+
+    async def complete(token, jobs, summaries):
+        completed.update(summaries)
+
+    async def fail(token, jobs, errors):
+        failed.extend(jobs)
+
+    async def nothing(*args, **kwargs):
+        return {}
+
+    monkeypatch.setattr(db_service, "lease_summary_jobs", lease)
+    monkeypatch.setattr(db_service, "complete_summary_jobs", complete)
+    monkeypatch.setattr(db_service, "fail_summary_jobs", fail)
+    monkeypatch.setattr(db_service, "get_stored_summaries", nothing)
+    monkeypatch.setattr(db_service, "save_stored_summary", nothing)
+
+    pipeline = SummaryPipeline()
+    assert asyncio.run(pipeline.process_batch()) == 1
+    assert completed["trending"][1] == ENGINE_EXTRACTIVE
+    assert failed == []
+    assert pipeline.failed == 0
+
+class NullTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class RecordingDatabase:
+    """Records the article updates complete_summary_jobs issues"""
+
+    def __init__(self):
+        self.updates = []
+
+    async def execute_many(self, query, values):
+        self.updates.append((query, values))
+
+    async def execute(self, query, values=None):
+        pass
+
+    def transaction(self):
+        return NullTransaction()
+
+    def mark_write(self):
+        pass
+
+def test_model_summaries_replace_extractive_ones_but_not_the_reverse():
+    service = DatabaseService()
+    service.db = service.reader = RecordingDatabase()
+    jobs = [job("model", 1), job("local", 0)]
+    asyncio.run(service.complete_summary_jobs(
+        "token", jobs, {"model": (SUMMARY, ENGINE_LLM), "local": ("Local.", ENGINE_EXTRACTIVE)}
+    ))
+
+    (llm_query, llm_rows), (extractive_query, extractive_rows) = service.db.updates
+    assert "summary_engine = :extractive" in llm_query
+    assert [row["id"] for row in llm_rows] == ["model"]
+    assert extractive_query.rstrip().endswith("summary IS NULL")
+    assert [(row["id"], row["summary_engine"]) for row in extractive_rows] == [("local", ENGINE_EXTRACTIVE)]
@@ -0,0 +1,61 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from services.database_service import db_service
+from services.summary_store import SummaryStore
+
+def test_stale_rows_are_touched_in_one_batch(monkeypatch):
+    touched = []
+
+    async def get_stored_summaries(hashes, model, prompt_version):
+        old = datetime.utcnow() - timedelta(days=1)
+        return {value: {"summary": f"Summary {value}", "last_used_at": old} for value in hashes}
+
+    async def touch_stored_summaries(keys):
+        touched.append(list(keys))
+
+    monkeypatch.setattr(db_service, "get_stored_summaries", get_stored_summaries)
+    monkeypatch.setattr(db_service, "touch_stored_summaries", touch_stored_summaries)
+    keys = [(f"touch-{i}", "model", "v") for i in range(3)]
+    found = asyncio.run(SummaryStore()._lookup_many(keys))
+
+    assert len(found) == 3
+    assert touched == [keys]
+
+def test_repeat_hits_for_an_article_link_it_once(monkeypatch):
+    updates = []
+
+    async def update_article_summary(article_id, summary, content_hash=None):
+        updates.append(article_id)
+        return True
+
+    monkeypatch.setattr(db_service, "update_article_summary", update_article_summary)
+    store = SummaryStore()
+    key = ("link-once", "model", "v")
+
+    async def hits():
+        for _ in range(3):
+            await store._link_article("a1", key, "Summary.")
+        await store._link_article("a2", key, "Summary.")
+
+    asyncio.run(hits())
+    assert updates == ["a1", "a2"]
+    assert store.links_skipped == 2
+
+def test_failed_link_is_retried(monkeypatch):
+    updates = []
+
+    async def update_article_summary(article_id, summary, content_hash=None):
+        updates.append(article_id)
+        return None
+
+    monkeypatch.setattr(db_service, "update_article_summary", update_article_summary)
+    store = SummaryStore()
+    key = ("link-retry", "model", "v")
+
+    async def hits():
+        await store._link_article("a1", key, "Summary.")
+        await store._link_article("a1", key, "Summary.")
+
+    asyncio.run(hits())
+    assert updates == ["a1", "a1"]
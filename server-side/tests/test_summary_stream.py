@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+import services.summary_store as store_module
+from config import settings
+from services.ai_service import AIService
+from services.cache import summary_cache
+from services.database_service import db_service
+from services.summary_store import SummaryStore
+from stand_in_gemini import SUMMARY, Latency
+
+FAST, SLOW = "gemini-2.5-flash", "gemini-2.5-pro"
+
+@pytest.fixture
+def store(monkeypatch, stand_in_gemini):
+    """A SummaryStore on a fresh AIService, recording what it writes to the database"""
+    monkeypatch.setattr(settings, "GEMINI_MODEL_TIERS", f"{FAST}:5,{SLOW}:5")
+    monkeypatch.setattr(settings, "GEMINI_HEDGE_ENABLED", False)
+    monkeypatch.setattr(store_module, "ai_service", AIService())
+    store = SummaryStore()
+    store.written = []
+
+    async def save_stored_summary(*args):
+        store.written.append(("summaries", args))
+
+    async def update_article_summary(*args, **kwargs):
+        store.written.append(("articles", args))
+
+    monkeypatch.setattr(db_service, "save_stored_summary", save_stored_summary)
+    monkeypatch.setattr(db_service, "update_article_summary", update_article_summary)
+    return store
+
+async def read_stream(store: SummaryStore, title: str) -> tuple:
+    key = store._key(title, "Content.")
+    parts = []
+    try:
+        async for chunk in store.stream(key, title, "Content.", article_id="a1"):
+            parts.append(chunk)
+    finally:
+        await store_module.ai_service.close()
+    return key, "".join(parts)
+
+def test_streamed_summary_is_stored(store, stand_in_gemini):
+    stand_in_gemini(Latency({FAST: 0.05, SLOW: 0.05}, seed=1))
+    key, text = asyncio.run(read_stream(store, "Stream stored"))
+
+    assert text.strip() == SUMMARY
+    assert summary_cache.get(key) == text
+    assert [table for table, _ in store.written] == ["summaries", "articles"]
+
+def test_empty_stream_fails_and_stores_nothing(store, stand_in_gemini):
+    latency = stand_in_gemini(Latency({FAST: 0.05, SLOW: 0.05}, empty_rate=1.0, seed=1))
+    with pytest.raises(ValueError):
+        asyncio.run(read_stream(store, "Stream empty"))
+
+    # Both tiers were tried before giving up
+    assert latency.requests == {FAST: 1, SLOW: 1}
+    assert summary_cache.get(store._key("Stream empty", "Content.")) is None
+    assert store.written == []